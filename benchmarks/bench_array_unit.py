@@ -0,0 +1,50 @@
+'''Time and memory of `ndarray * unit` on 10^6 elements, run from the
+repo root:
+
+    python -m benchmarks.bench_array_unit
+
+`object` is the previous behavior, numpy broadcasting `Unit.__rmul__`
+over the elements into an object array of `Quantity`, and `quantity`
+is `Unit.__array_ufunc__` wrapping the whole array in one `Quantity`.
+'''
+
+import tracemalloc
+import warnings
+from time import perf_counter
+
+import numpy as np
+
+from src.siunitpy import Unit
+
+
+def _object(values, unit):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return np.frompyfunc(unit.__rmul__, 1, 1)(values)
+
+
+def _quantity(values, unit):
+    return values * unit
+
+
+def _measure(run, values, unit) -> tuple[float, int]:
+    '''(seconds, peak bytes) of one run.'''
+    tracemalloc.start()
+    start = perf_counter()
+    run(values, unit)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(size: int = 10**6) -> None:
+    values, unit = np.random.default_rng(0).random(size), Unit('km/h')
+    print(f"{'method':<12}{'time':>12}{'peak memory':>16}")
+    for name, run in (('object', _object), ('quantity', _quantity)):
+        elapsed, peak = _measure(run, values, unit)
+        print(f'{name:<12}{elapsed * 1e3:>10.1f}ms{peak / 2**20:>14.1f}MB')
+
+
+if __name__ == '__main__':
+    main()
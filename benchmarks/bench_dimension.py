@@ -0,0 +1,79 @@
+'''Arithmetic time of Dimension, run from the repo root:
+
+    python -m benchmarks.bench_dimension
+
+`fraction` is the previous Dimension storing a 7-tuple of Fractions,
+and `packed` is the Dimension with the exponents packed into one int,
+interned and with memoized mul/div/pow.
+'''
+
+import operator
+from timeit import repeat
+
+from src.siunitpy.dimension import Dimension
+from src.siunitpy.utilcollections.utils import common_rational
+
+
+class _FractionDimension:
+    __slots__ = ('vector',)
+
+    def __init__(self, vector):
+        self.vector = tuple(map(common_rational, vector))
+
+    def __iter__(self): return iter(self.vector)
+
+    def __hash__(self) -> int: return hash(self.vector)
+
+    def __eq__(self, other) -> bool: return self.vector == other.vector
+
+    def __mul__(self, other):
+        return self.__class__(map(operator.add, self, other))
+
+    def __truediv__(self, other):
+        return self.__class__(map(operator.sub, self, other))
+
+    def __pow__(self, n):
+        return self.__class__(x * n for x in self)
+
+    @staticmethod
+    def product(dim_iter):
+        start = _FractionDimension((0,) * 7)
+        for dim in dim_iter:
+            start *= dim
+        return start
+
+
+_VECTORS = [(-2, 1, 1, 0, 0, 0, 0), (0, 1, 0, 0, 0, 0, 0),
+            (-1, 0, 0, 0, 0, 0, 0), (1, 0, 0, 1, 0, 0, 0),
+            (0, 0, 0, 0, -1, 0, 0), (-3, 2, 1, -1, 0, 0, 0)]
+
+
+def _cases(cls):
+    dims = [cls(v) for v in _VECTORS]
+    a, b = dims[0], dims[-1]
+    return {
+        'product (6 dims)': lambda: cls.product(dims),
+        'a * b': lambda: a * b,
+        'a / b': lambda: a / b,
+        'a ** 2': lambda: a ** 2,
+        'a == b': lambda: a == b,
+        'hash(a)': lambda: hash(a),
+    }
+
+
+def _time(run, number: int) -> float:
+    return min(repeat(run, number=number, repeat=5)) / number
+
+
+def main(number: int = 50_000) -> None:
+    print(f"{'operation':<20}{'fraction':>12}{'packed':>12}{'speedup':>10}")
+    fraction_cases = _cases(_FractionDimension)
+    for case, run in _cases(Dimension).items():
+        fraction = _time(fraction_cases[case], number)
+        packed = _time(run, number)
+        print(f'{case:<20}{fraction * 1e9:>10.0f}ns{packed * 1e9:>10.0f}ns'
+              f'{fraction / packed:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
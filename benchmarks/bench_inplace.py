@@ -0,0 +1,59 @@
+'''Time and memory of in-place operations of array-valued quantities on
+10^7 elements, run from the repo root:
+
+    python -m benchmarks.bench_inplace
+
+`peak memory` is the peak traced allocation of the operation, every
+full-size temporary adds one array (76MB) to it. The out-of-place
+`q + r` is listed for reference.
+'''
+
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+from src.siunitpy import Quantity
+
+
+def _measure(run) -> tuple[float, int]:
+    '''(seconds, peak bytes) of one run.'''
+    tracemalloc.start()
+    start = perf_counter()
+    run()
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(size: int = 10**7) -> None:
+    rng = np.random.default_rng(0)
+
+    def quantity(unit: str) -> Quantity:
+        return Quantity(rng.random(size), unit, rng.random(size) / 10)
+
+    q, r, s = quantity('m'), quantity('m'), quantity('s')
+
+    def add():
+        nonlocal q
+        q += r
+
+    def mul():
+        nonlocal q
+        q *= 2
+
+    def mul_quantity():
+        nonlocal q
+        q *= s
+
+    cases = (('q + r', lambda: q + r), ('q += r', add), ('q *= 2', mul),
+             ("q.ito('km')", lambda: q.ito('km')), ('q *= s', mul_quantity))
+    print(f"{'operation':<14}{'time':>12}{'peak memory':>16}")
+    for name, run in cases:
+        elapsed, peak = _measure(run)
+        print(f'{name:<14}{elapsed * 1e3:>10.1f}ms{peak / 2**20:>14.1f}MB')
+
+
+if __name__ == '__main__':
+    main()
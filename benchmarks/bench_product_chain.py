@@ -0,0 +1,50 @@
+'''Time of a 10-factor product/quotient chain of uncertain variables on
+10^6 elements, run from the repo root:
+
+    python -m benchmarks.bench_product_chain
+
+`chain` is `a0 * a1 / a2 * a3 ...` of fresh variables, the relative
+uncertainty of each factor is computed once and carried between the
+steps. `chain + uncertainty` reads the absolute uncertainty of the
+result, which is then computed once.
+'''
+
+from time import perf_counter
+
+import numpy as np
+
+from src.siunitpy import Variable
+
+
+def _chain(factors: list[Variable]) -> Variable:
+    result = factors[0]
+    for i, factor in enumerate(factors[1:]):
+        result = result * factor if i % 2 == 0 else result / factor
+    return result
+
+
+def _best(run, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main(size: int = 10**6, length: int = 10) -> None:
+    rng = np.random.default_rng(0)
+
+    def factors() -> list[Variable]:
+        return [Variable(1 + rng.random(size), rng.random(size) / 10)
+                for _ in range(length)]
+
+    for name, run in (('chain', _chain),
+                      ('chain + uncertainty', lambda f: _chain(f).uncertainty)):
+        inputs = [factors() for _ in range(5)]
+        elapsed = _best(lambda: run(inputs.pop()))
+        print(f'{name:<22}{elapsed * 1e3:>10.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
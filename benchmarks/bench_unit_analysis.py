@@ -0,0 +1,67 @@
+'''Resolution time of unit symbols, run from the repo root:
+
+    python -m benchmarks.bench_unit_analysis
+
+`regex` is the previous pipeline of `_resolve` (substitute special chars,
+split by linkers, search exponents, find the first '/', remove exponents),
+and `scan` is the one-pass `_tokenize`.
+'''
+
+import re
+from timeit import repeat
+
+from src.siunitpy.unit_analysis import _SPECIAL_CHAR, _resolve
+from src.siunitpy.unitelement import UnitElement
+from src.siunitpy.utilcollections import Compound
+from src.siunitpy.utilcollections.utils import _SUPERSCRIPT, neg_after
+
+_UNIT_SEP = re.compile(r'[/.·]+')
+_UNIT_EXPO = re.compile(r'[+-]?[0-9]+$')
+_REMOVE = re.compile(r'\s|\^?[+-]?[0-9]+$')
+_REGEX_CHAR = _SPECIAL_CHAR | {s: str(i) for i, s in enumerate(_SUPERSCRIPT)}
+_SPECIAL_PAT = re.compile('[{}]'.format(''.join(_REGEX_CHAR)))
+
+
+def _resolve_regex(symbol: str) -> Compound[UnitElement]:
+    elements: Compound[UnitElement] = Compound()
+    symbol = _SPECIAL_PAT.sub(lambda m: _REGEX_CHAR[m.group()], symbol)
+    unites = [unite for unite in _UNIT_SEP.split(symbol) if unite]
+    expo_match_gen = (_UNIT_EXPO.search(unite) for unite in unites)
+    expo = [1 if em is None else int(em.group()) for em in expo_match_gen]
+    for i, sep_match in enumerate(_UNIT_SEP.finditer(symbol)):
+        if '/' in sep_match.group():
+            neg_after(expo, i)
+            break
+    unit_gen = (UnitElement(_REMOVE.sub('', unite)) for unite in unites)
+    for unit, e in zip(unit_gen, expo):
+        if e != 0:
+            elements[unit] += e
+    return elements
+
+
+CASES = (
+    'm',
+    'kg.m/s2',
+    'T.W/m2.K4',
+    'kg·m²·mol·cd·A/s³·K⁴·sr·lm·Hz',
+    'kg.m2.mol.cd.A.Pa.J.W.C.V/s3.K4.sr.lm.Hz.Gy.Bq.kat.lx.Wb',
+)
+
+
+def _time(resolve, symbol: str, number: int) -> float:
+    return min(repeat(lambda: resolve(symbol), number=number, repeat=5)) / number
+
+
+def main(number: int = 20_000) -> None:
+    for symbol in CASES:
+        assert str(_resolve_regex(symbol)) == str(_resolve(symbol))
+    print(f"{'symbol':<60}{'regex':>10}{'scan':>10}{'speedup':>9}")
+    for symbol in CASES:
+        old = _time(_resolve_regex, symbol, number)
+        new = _time(_resolve, symbol, number)
+        print(f'{symbol:<60}{old * 1e6:>8.2f}us{new * 1e6:>8.2f}us'
+              f'{old / new:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+'''Resolution time of unexponented element str, run from the repo root:
+
+    python -m benchmarks.bench_unitelement
+
+`probe` is the previous algorithm, which tries every prefix length,
+and `index` is the single lookup of `_resolve_element`.
+'''
+
+from timeit import repeat
+
+from src.siunitpy.unit_archive import (_PREFIX_ALIAS, _PREFIX_DATA,
+                                       _PREFIX_FULLNAME, _UNIT_DATA,
+                                       _UNIT_FULLNAME, _UNIT_FULLNAME_ALIAS)
+from src.siunitpy.unitelement import UnitSymbolError, _resolve_element
+
+_PREFIX_MAXLEN = max(map(len, _PREFIX_DATA))
+_PREFIX_FULLNAME_MINLEN = min(filter(None, map(len, _PREFIX_FULLNAME)))
+_PREFIX_FULLNAME_MAXLEN = max(map(len, _PREFIX_FULLNAME))
+
+
+def _resolve_element_probe(unit: str) -> tuple[str, str]:
+    if unit in _UNIT_DATA:
+        return unit, ''
+    for prefix_len in range(1, _PREFIX_MAXLEN + 1):
+        prefix, base = unit[:prefix_len], unit[prefix_len:]
+        if prefix in _PREFIX_ALIAS:
+            prefix = _PREFIX_ALIAS[prefix]
+        if prefix in _PREFIX_DATA and base in _UNIT_DATA:
+            if _UNIT_DATA[base].never_prefix:
+                continue
+            return base, prefix
+    if unit in _UNIT_FULLNAME:
+        return _UNIT_FULLNAME[unit], ''
+    for prefix_len in range(_PREFIX_FULLNAME_MINLEN, _PREFIX_FULLNAME_MAXLEN + 1):
+        prefix, base = unit[:prefix_len], unit[prefix_len:]
+        if base in _UNIT_FULLNAME_ALIAS:
+            base = _UNIT_FULLNAME_ALIAS[base]
+        if prefix in _PREFIX_FULLNAME and base in _UNIT_FULLNAME:
+            if _UNIT_DATA[_UNIT_FULLNAME[base]].never_prefix:
+                continue
+            return _UNIT_FULLNAME[base], _PREFIX_FULLNAME[prefix]
+    raise UnitSymbolError(f"'{unit}' is not a valid element unit.")
+
+
+CASES = {
+    'symbol': 'm',
+    'prefixed symbol': 'km',
+    'fullname': 'electronvolt',
+    'prefixed fullname': 'kiloelectronvolt',
+    'unknown': 'furlong',
+}
+
+
+def _time(resolve, unit: str, number: int) -> float:
+    def run():
+        try:
+            resolve(unit)
+        except UnitSymbolError:
+            pass
+    return min(repeat(run, number=number, repeat=5)) / number
+
+
+def main(number: int = 100_000) -> None:
+    print(f"{'input':<20}{'probe':>12}{'index':>12}{'speedup':>10}")
+    for case, unit in CASES.items():
+        probe = _time(_resolve_element_probe, unit, number)
+        index = _time(_resolve_element, unit, number)
+        print(f'{case:<20}{probe * 1e9:>10.0f}ns{index * 1e9:>10.0f}ns'
+              f'{probe / index:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+'''The metadata is in `pyproject.toml`, this only adds the unit registry
+snapshot (see `siunitpy.unit_registry`) to the built package.'''
+
+import os
+import subprocess
+import sys
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithSnapshot(build_py):
+    def run(self):
+        super().run()
+        if self.dry_run:
+            return
+        path = os.path.join(os.path.abspath(self.build_lib), 'siunitpy',
+                            'unit_registry.snapshot')
+        # run from the built package, so the source tree is not written
+        code = ('from siunitpy.unit_registry import build_snapshot; '
+                f'build_snapshot({path!r})')
+        subprocess.run([sys.executable, '-c', code],
+                       cwd=self.build_lib, check=True)
+
+
+setup(cmdclass={'build_py': BuildPyWithSnapshot})
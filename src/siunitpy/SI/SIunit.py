@@ -1,11 +1,11 @@
 from ..unit import Unit, DIMENSIONLESS
-from ..utilcollections.constclass import ConstClass
+from ..utilcollections.constclass import ConstClass, lazy
 
 __all__ = ['si']
 
 
 def prefix_map(unitbase: str, prefix: str | list[str]):
-    return (Unit(p + unitbase) for p in prefix)
+    return (lazy(Unit, (p + unitbase).strip()) for p in prefix)
 
 
 class si(ConstClass):
@@ -26,12 +26,12 @@ class si(ConstClass):
     >>> 1 / si.m
     1 /m
 
-    However, when rmul/rtruediv `numpy.ndarray` objects, 
-    which overload `__mul__` operation, it may won't get what is intended:
+    `numpy.ndarray` objects become one `Quantity` of the whole array,
+    not an array of `Quantity` objects:
     >>> numpy.array([1, 2]) * si.m
-    [Quantity(1, m) Quantity(2, m)]
+    [1 2] m
 
-    So we recommend using @ operand (meaning at) instead:
+    but we still recommend using @ operand (meaning at) to assign units:
     >>> numpy.array([1, 2]) @ si.m
     [1 2] m
     '''
@@ -52,14 +52,14 @@ class si(ConstClass):
     '''kelvin, thermodynamic temperature'''
     mmol, mol = prefix_map('mol', 'm ')
     '''mole, amount of substance'''
-    cd = Unit('cd')
+    cd = lazy(Unit, 'cd')
     '''candela, luminous intensity'''
 
     # SI derived unit
 
-    rad = Unit('rad')
+    rad = lazy(Unit, 'rad')
     '''radian, plane angle'''
-    sr = Unit('sr')
+    sr = lazy(Unit, 'sr')
     '''steradian, solid angle'''
     Hz, kHz, MHz, GHz, THz = prefix_map('Hz', ' kMGT')
     '''hertz, frequency'''
@@ -79,44 +79,44 @@ class si(ConstClass):
     '''farad, capacitance'''
     mohm, ohm, kohm = prefix_map('Ω', 'm k')
     '''ohm, resistance/impedance/reactance'''
-    S = Unit('S')
+    S = lazy(Unit, 'S')
     '''siemens, electrical conductance'''
-    Wb = Unit('Wb')
+    Wb = lazy(Unit, 'Wb')
     '''weber, magnetic flux'''
-    T = Unit('T')
+    T = lazy(Unit, 'T')
     '''tesla, magnetic flux density'''
-    H = Unit('H')
+    H = lazy(Unit, 'H')
     '''henry, inductance'''
     # celsius = Unit('°C')
     # '''degree Celsius, temperature relative to 273.15 K'''
-    lm = Unit('lm')
+    lm = lazy(Unit, 'lm')
     '''lumen, luminous flux'''
-    lx = Unit('lx')
+    lx = lazy(Unit, 'lx')
     '''lux, illuminance'''
     Bq, kBq, MBq, GBq = prefix_map('Bq', ' kMG')
     '''becquerel, activity referred to a radionuclide'''
-    Gy = Unit('Gy')
+    Gy = lazy(Unit, 'Gy')
     '''gray, absorbed dose'''
     nSv, uSv, mSv, Sv = prefix_map('Sv', 'num ')
     '''sievert, equivalent dose'''
-    kat = Unit('kat')
+    kat = lazy(Unit, 'kat')
     '''katal, catalytic activity'''
 
     # other common unit
 
-    min = Unit('min')
+    min = lazy(Unit, 'min')
     '''minute, time'''
-    h = Unit('h')
+    h = lazy(Unit, 'h')
     '''hour, time'''
     mL, L = prefix_map('L', 'm ')
     '''liter/litre, volume'''
-    bar = Unit('bar')
+    bar = lazy(Unit, 'bar')
     '''bar, pressure'''
-    ssp = Unit('ssp')
+    ssp = lazy(Unit, 'ssp')
     '''standard-state pressure'''
-    atm = Unit('atm')
+    atm = lazy(Unit, 'atm')
     '''standard atmosphere'''
-    mmHg = Unit('mmHg')
+    mmHg = lazy(Unit, 'mmHg')
     '''millimetre of mercury, 760 mmHg = 1 atm'''
     Wh, kWh = prefix_map('Wh', ' k')
     '''watthour, energy'''
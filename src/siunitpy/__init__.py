@@ -5,5 +5,6 @@ from .constant import Constant
 from .dimension import Dimension
 from .dimensionconst import DimensionConst
 from .quantity import Quantity
+from .quantityarray import QuantityArray
 from .unit import Unit
-from .variable import Variable
+from .variable import Variable, correlation_matrix, covariance_matrix
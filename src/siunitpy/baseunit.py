@@ -1,27 +1,186 @@
+from fractions import Fraction
+from functools import wraps
+from math import floor
+from threading import Lock
+from weakref import WeakValueDictionary
+
 from .dimension import Dimension
-from .unit_analysis import _combine, _combine_fullname
-from .unit_archive import _BASE_SI, _UNIT_STD
+from .unit_analysis import _combine, _combine_fullname, _factor
+from .unit_registry import _BASE_SI, _UNIT_STD
 from .unitelement import UnitElement
-from .utilcollections.compound import Compound
-from .utilcollections.utils import _inplace, common_rational
+from .utilcollections.compound import FrozenCompound
+from .utilcollections.lrucache import LRUCache
+from .utilcollections.utils import _inplace
+
+_SIMPLE_EXPONENT = (1, -1, 2, -2)
+_REDUCE_EXPONENT = (1, -1, 2, -2, 3, -3)
+
+_REDUCE_INDEX: tuple[dict[Dimension, tuple[str, int]], ...] | None = None
+'''{dimension: (symbol, n)}, where dimension = dimension(symbol)**n,
+of the standard units and of the base SI units, prefer the smaller |n|.
+Built on first use.'''
+
+
+def _reduce_index() -> tuple[dict[Dimension, tuple[str, int]], ...]:
+    global _REDUCE_INDEX
+    if _REDUCE_INDEX is None:
+        standard: dict[Dimension, tuple[str, int]] = {}
+        base: dict[Dimension, tuple[str, int]] = {}
+        for n in _REDUCE_EXPONENT:
+            for dim, symbol in _UNIT_STD.items():
+                standard.setdefault(dim**n, (symbol, n))
+                if symbol in _BASE_SI:
+                    base.setdefault(dim**n, (symbol, n))
+        _REDUCE_INDEX = standard, base  # publish when complete
+    return _REDUCE_INDEX
+
+
+def _partial_exponents(e) -> list:
+    '''exponents that a part of u**e can have, i.e. 0, integers towards e,
+    and e itself.'''
+    if e > 0:
+        return [*range(0, floor(e) + 1)] + ([e] if e != floor(e) else [])
+    return [*range(0, -floor(-e) - 1, -1)] + ([e] if e != -floor(-e) else [])
+
+
+def _pairs(options: list, dimension: Dimension):
+    '''single options `(u, exponent, dimension)` and pairs of options of
+    different elements whose dimension is `dimension`, looked up by
+    dimension, so it is O(options).'''
+    by_dimension: dict[Dimension, list] = {}
+    for option in options:
+        by_dimension.setdefault(option[2], []).append(option)
+    for u, r, _ in by_dimension.get(dimension, ()):
+        yield {u: r}
+    for u, r, dim in options:
+        for v, q, _ in by_dimension.get(dimension / dim, ()):
+            if u is not v:
+                yield {u: r, v: q}
+
+
+def _rests(items: tuple, dimension: Dimension, absorbed: Dimension):
+    '''the candidate rests of `reduce(unit)`, `{element: exponent}` of
+    `dimension`, where `absorbed` = dimension(unit**k) is the rest.
+    Either at most 2 elements (part of their exponents) are kept, or at
+    most 2 are absorbed, or the rest is 1 standard unit of the reduce
+    index, so the search is bounded instead of over every subset.'''
+    if dimension == Dimension():
+        yield {}
+    kept, taken = [], []
+    for u, e in items:
+        for p in _partial_exponents(e):
+            if p != e:  # keep e - p of u
+                kept.append((u, e - p, u.dimension**(e - p)))
+            if p != 0:  # absorb p of u
+                taken.append((u, p, u.dimension**p))
+    yield from _pairs(kept, dimension)
+    elements = dict(items)
+    for part in _pairs(taken, absorbed):
+        rest = elements.copy()
+        for u, p in part.items():
+            if rest[u] == p:
+                del rest[u]
+            else:
+                rest[u] -= p
+        yield rest
+    found = _reduce_index()[0].get(dimension)
+    if found is not None:
+        symbol, n = found
+        yield {UnitElement(symbol): n}
 
-_SIMPLE_EXPONENT = tuple(map(common_rational, (1, -1, 2, -2)))
+
+# Units are canonicalized by their key, units with the same elements
+# from parsing or unit operations are the same object, so they share
+# the entries of the id-keyed caches. The canonical factor is computed
+# from the elements, not taken from whichever path built the unit first,
+# whose factor may be rounded differently, e.g. 60.00000000000001 min.
+_CANONICAL: 'WeakValueDictionary[tuple, BaseUnit]' = WeakValueDictionary()
+_CANONICAL_LOCK = Lock()
+
+
+def _canonical(unit: 'BaseUnit') -> 'BaseUnit':
+    '''return the canonical object of the units with the same key.'''
+    key = (unit.__class__, unit.key)
+    canonical = _CANONICAL.get(key)
+    if canonical is not None:
+        return canonical
+    unit._factor = _factor(unit._elements)
+    with _CANONICAL_LOCK:
+        return _CANONICAL.setdefault(key, unit)
+
+
+def _fromkey(cls, key: tuple, factor: float):
+    '''rebuild a unit from its key, used in unpickling.'''
+    elements = FrozenCompound((UnitElement(base, prefix), e)
+                              for prefix, base, e in key)
+    dimension = Dimension.product(u.dimension**e for u, e in elements.items())
+    return _canonical(cls(elements, dimension, factor))
+
+
+_ALGEBRA_CACHE_MAXSIZE = 4096
+
+_ALGEBRA_CACHE: LRUCache[tuple, tuple] = LRUCache(_ALGEBRA_CACHE_MAXSIZE)
+'''{(op, id(unit), id(unit)/number): (unit, operand, result)}, the entry
+keeps the operands alive, so their id is not reused while cached.'''
+
+
+def _memoize(op):
+    '''cache the result of the unit operation `op(self, operand)`.'''
+    name = op.__name__
+    @wraps(op)
+    def cached_op(self, *args):
+        operand = args[0] if args else None
+        key = (name, id(self),
+               id(operand) if isinstance(operand, BaseUnit) else operand)
+        try:
+            entry = _ALGEBRA_CACHE.get(key)
+        except TypeError:  # unhashable operand
+            return op(self, *args)
+        if entry is None:
+            result = op(self, *args)
+            if isinstance(result, BaseUnit):
+                result = _canonical(result)
+            elif isinstance(result[0], BaseUnit):  # (unit, factor)
+                result = _canonical(result[0]), result[1]
+            entry = _ALGEBRA_CACHE.setdefault(key, (self, operand, result))
+        return entry[2]
+    return cached_op
 
 
 class BaseUnit:
-    __slots__ = ('_elements', '_dimension', '_factor', '_symbol')
+    __slots__ = ('_elements', '_dimension', '_factor', '_symbol', '_fullname',
+                 '_key', '_deprefixed', '_tobased', '_simplified',
+                 '__weakref__')
 
-    def __init__(self, elements: Compound[UnitElement], dimension: Dimension,
-                 factor: float):
+    def __init__(self, elements: FrozenCompound[UnitElement],
+                 dimension: Dimension, factor: float):
         self._elements = elements
         self._dimension = dimension
         self._factor = factor
-        self._symbol = _combine(self._elements)
+        # rendered on first access
+        self._symbol = self._fullname = self._key = None
+        # (unit, factor) of the derived forms, computed on first call
+        self._deprefixed = self._tobased = self._simplified = None
 
     @property
-    def symbol(self) -> str: return self._symbol
+    def symbol(self) -> str:
+        if self._symbol is None:
+            self._symbol = _combine(self._elements)
+        return self._symbol
+
     @property
-    def fullname(self) -> str: return _combine_fullname(self._elements)
+    def fullname(self) -> str:
+        if self._fullname is None:
+            self._fullname = _combine_fullname(self._elements)
+        return self._fullname
+
+    @property
+    def key(self) -> tuple:
+        if self._key is None:
+            self._key = tuple((u.prefix, u.base, e)
+                              for u, e in self._elements.items())
+        return self._key
+
     @property
     def dimension(self) -> Dimension: return self._dimension
     @property
@@ -38,37 +197,61 @@ class BaseUnit:
     def __eq__(self, other: 'BaseUnit') -> bool:
         return self.dimension == other.dimension and self.factor == other.factor
 
+    def __reduce__(self):
+        return _fromkey, (self.__class__, self.key, self.factor)
+
+    def __copy__(self): return self
+
+    def __deepcopy__(self, memo): return self
+
     def sameas(self, other: 'BaseUnit', /) -> bool:
-        return self._elements == other._elements
+        return self is other or self.key == other.key
 
     def isdimensionless(self) -> bool:
         return self.dimension.isdimensionless()
 
+    @staticmethod
+    def algebra_cache_info():
+        '''statistics of the unit operation cache.'''
+        return _ALGEBRA_CACHE.cache_info()
+
+    @staticmethod
+    def algebra_cache_clear() -> None:
+        '''clear the unit operation cache and its statistics.'''
+        _ALGEBRA_CACHE.cache_clear()
+
     def deprefix_with_factor(self):
-        elements = self._elements
-        factor = 1
-        for unit in self._elements:
-            if unit.prefix == '':  # not prefixed
-                continue
-            if elements is self._elements:
-                elements = self._elements.copy()
-            e = elements.pop(unit)
-            factor *= unit.prefix_factor**e
-            if unit.base:  # not a single prefix
-                elements[unit.deprefix()] += e
-        if elements is self._elements:
+        if self._deprefixed is None:
+            self._deprefixed = self.__deprefix()
+        return self._deprefixed
+
+    def __deprefix(self):
+        if all(unit.prefix == '' for unit in self._elements):
             return self, 1
+        elements: dict[UnitElement, int | Fraction] = {}
+        factor = 1
+        for unit, e in self._elements.items():
+            if unit.prefix != '':
+                factor *= unit.prefix_factor**e
+                if not unit.base:  # a single prefix
+                    continue
+                unit = unit.deprefix()
+            elements[unit] = elements.get(unit, 0) + e
         cls = self.__class__
-        return cls(elements, self.dimension, self.factor / factor), factor
+        return _canonical(cls(FrozenCompound(elements), self.dimension,
+                              self.factor / factor)), factor
 
     def deprefix(self):
         '''return a new unit that remove all the prefix.'''
         return self.deprefix_with_factor()[0]
 
     def tobase_with_factor(self):
-        elems = Compound({UnitElement(unit): e for unit, e in
-                          zip(_BASE_SI, self.dimension) if e}, copy=False)
-        return self.__class__(elems, self.dimension, 1), self.factor
+        if self._tobased is None:
+            elems = FrozenCompound((UnitElement(unit), e) for unit, e in
+                                   zip(_BASE_SI, self.dimension) if e)
+            unit = _canonical(self.__class__(elems, self.dimension, 1))
+            self._tobased = unit, self.factor
+        return self._tobased
 
     def tobase(self):
         '''return a combination of base SI unit 
@@ -78,15 +261,19 @@ class BaseUnit:
         return self.tobase_with_factor()[0]
 
     def simplify_with_factor(self):
+        if self._simplified is None:
+            self._simplified = self.__simplify()
+        return self._simplified
+
+    def __simplify(self):
         if len(self._elements) < 2:
             return self, 1
-        for expo in _SIMPLE_EXPONENT:
-            symbol = _UNIT_STD.get(self.dimension.nthroot(expo))
-            if symbol is None:
-                continue
-            elements = Compound({UnitElement(symbol): expo}, copy=False)
-            return self.__class__(elements, self.dimension, 1), self.factor
-        return self, 1  # fail to simplify
+        symbol, expo = _reduce_index()[0].get(self.dimension, ('', 0))
+        if expo not in _SIMPLE_EXPONENT:
+            return self, 1  # fail to simplify
+        elements = FrozenCompound({UnitElement(symbol): expo})
+        unit = _canonical(self.__class__(elements, self.dimension, 1))
+        return unit, self.factor
 
     def simplify(self):
         '''try if the complex unit can be simplified as a single unit
@@ -103,30 +290,95 @@ class BaseUnit:
         '''
         return self.simplify_with_factor()[0]
     
-    def reduce(self, unit):
-        '''TODO: 
-        
-        example: 
+    @_memoize
+    def reduce_with_factor(self, unit: 'BaseUnit | None' = None):
+        if unit is None:
+            return self.__reduce_auto()
+        # absorb a part of the elements into unit**k, keep the rest
+        items = tuple(self._elements.items())
+        elements = dict(items)
+        best = None
+        for k in _REDUCE_EXPONENT:
+            absorbed = unit.dimension**k
+            for order, rest in enumerate(
+                    _rests(items, self.dimension / absorbed, absorbed)):
+                if rest == elements:
+                    continue  # nothing absorbed
+                rank = (len(rest), sum(map(abs, rest.values())), abs(k),
+                        order)  # prefer the own elements
+                if best is None or rank < best[0]:
+                    best = rank, rest, k
+        if best is None:
+            return self, 1  # fail to reduce
+        _, rest, k = best
+        elements = FrozenCompound(rest) + unit._elements * k
+        factor = unit.factor**k
+        for u, e in rest.items():
+            factor *= u.factor**e
+        new_unit = self.__class__(elements, self.dimension, factor)
+        return new_unit, self.factor / factor
+
+    def __reduce_auto(self):
+        '''the shortest combination of standard units, `u**n` or
+        `u**±1 * b**n` where b is a base SI unit.'''
+        if len(self._elements) < 2:
+            return self, 1
+        index, base_index = _reduce_index()
+        if self.dimension in index:
+            symbol, n = index[self.dimension]
+            elements = {UnitElement(symbol): n}
+        elif len(self._elements) > 2:
+            found = None
+            for dim, symbol in _UNIT_STD.items():
+                for n in (1, -1):
+                    base, n2 = base_index.get(self.dimension / dim**n,
+                                              (symbol, 0))
+                    if base != symbol and (found is None or abs(n2) < found[0]):
+                        found = abs(n2), symbol, n, base, n2
+            if found is None:
+                return self, 1
+            _, symbol, n, base, n2 = found
+            elements = {UnitElement(symbol): n, UnitElement(base): n2}
+        else:
+            return self, 1
+        elements = FrozenCompound(elements)
+        return self.__class__(elements, self.dimension, 1), self.factor
+
+    def reduce(self, unit: 'BaseUnit | None' = None):
+        '''reduce the unit by absorbing its elements into `unit**k`
+        (k = ±1, ±2, ±3), the other elements are kept. 
+
         >>> Unit('ohm.A2/m3').reduce('W')
-        Unit('W/m3')
+        Unit(W/m³, T⁻³L⁻¹M, factor=1)
+
+        if `unit` is None, find the shortest combination (of 1 or 2 
+        elements) of standard units (see `simplify`), if shorter:
+        >>> Unit('kg.m2/s3.A').reduce()
+        Unit(V, T⁻³L²MI⁻¹, factor=1)
+
+        the result is cached per unit.
         '''
-        pass
+        return self.reduce_with_factor(unit)[0]
 
+    @_memoize
     def inverse(self):
         '''inverse of the unit.'''
         cls = self.__class__
         return cls(-self._elements, self.dimension.inverse(), 1 / self.factor)
 
+    @_memoize
     def __mul__(self, other: 'BaseUnit'):
         return self.__class__(self._elements + other._elements,
                               self.dimension * other.dimension,
                               self.factor * other.factor)
 
+    @_memoize
     def __truediv__(self, other: 'BaseUnit'):
         return self.__class__(self._elements - other._elements,
                               self.dimension / other.dimension,
                               self.factor / other.factor)
 
+    @_memoize
     def __pow__(self, n):
         return self.__class__(self._elements * n,
                               self.dimension**n,
@@ -142,6 +394,7 @@ class BaseUnit:
             raise ValueError('only 1 or Unit object can divide Unit object.')
         return self.inverse()
 
+    @_memoize
     def nthroot(self, n):
         '''inverse operation of power.'''
         return self.__class__(self._elements / n,
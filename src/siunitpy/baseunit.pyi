@@ -51,7 +51,8 @@ from typing import Literal
 
 from .dimension import Dimension
 from .unitelement import UnitElement
-from .utilcollections.compound import Compound
+from .utilcollections.compound import FrozenCompound
+from .utilcollections.lrucache import CacheInfo
 
 __all__ = ['BaseUnit']
 
@@ -64,9 +65,24 @@ else:
 
 class BaseUnit:
     '''The base class of `Unit`.
+
+    Results of `*`, `/`, `**`, `nthroot` and `inverse` are cached by the
+    identity of the operands, so repeating the same unit operation 
+    returns the same object at about the cost of a dict lookup:
+    >>> Unit('km') / Unit('h') is Unit('km') / Unit('h')  # True
+    >>> BaseUnit.algebra_cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+    The elements are kept in a canonical order (by dimension, prefix 
+    factor, then base), and units with the same elements from parsing or
+    unit operations are the same object:
+    >>> Unit('s.m') is Unit('m') * Unit('s')  # True, m·s
+
+    `deprefix`, `tobase` and `simplify` (and their `_with_factor`) are
+    computed once and stored in the unit.
     '''
-    def __init__(self, elements: Compound[UnitElement], dimension: Dimension,
-                 factor: float): 
+    def __init__(self, elements: FrozenCompound[UnitElement],
+                 dimension: Dimension, factor: float): 
         '''see the document of `baseunit` for parameter explanation.'''
 
     @property
@@ -74,6 +90,12 @@ class BaseUnit:
     @property
     def fullname(self) -> str: ...
     @property
+    def key(self) -> tuple[tuple[str, str, int | Fraction], ...]:
+        '''canonical key, `(prefix, base, exponent)` of the elements,
+        stable across processes, used in `sameas` and pickling:
+        >>> Unit('km/h').key  # (('k', 'm', 1), ('', 'h', -1))
+        '''
+    @property
     def dimension(self) -> Dimension: ...
     @property
     def factor(self) -> float: ...
@@ -83,13 +105,41 @@ class BaseUnit:
     def deprefix_with_factor(self) -> tuple[Self, float]: ...
     def tobase_with_factor(self) -> tuple[Self, float]: ...
     def simplify_with_factor(self) -> tuple[Self, float]: ...
+    def reduce_with_factor(self, unit: BaseUnit | None = None
+                           ) -> tuple[Self, float]: ...
     def deprefix(self) -> Self: ...
     def tobase(self) -> Self: ...
     def simplify(self) -> Self: ...
+    def reduce(self, unit: BaseUnit | None = None) -> Self:
+        '''reduce the unit by absorbing its elements into `unit**k`
+        (k = ±1, ±2, ±3), the other elements are kept:
+        >>> Unit('ohm.A2/m3').reduce('W')    # W/m³
+
+        the search keeps or absorbs at most 2 elements, or replaces the
+        rest by 1 standard unit, so it is linear in the elements.
+
+        if `unit` is None, find the shortest combination of standard
+        units, `u**n` or `u**±1 * b**n` where b is a base SI unit:
+        >>> Unit('kg.m2/s3.A').reduce()      # V
+        >>> Unit('ohm.A2/m3').reduce()       # Pa/s
+
+        the unit is returned unchanged if it cannot be reduced,
+        results are cached per unit.
+        '''
     def __eq__(self, other: BaseUnit) -> bool: ...
-    def sameas(self, other: BaseUnit) -> bool: ...
+    def sameas(self, other: BaseUnit) -> bool:
+        '''whether the units have the same elements, unlike `==`, 
+        which compares dimension and factor:
+        >>> Unit('J') == Unit('N.m')        # True
+        >>> Unit('J').sameas(Unit('N.m'))  # False
+        '''
     # def parallel(self, other: BaseUnit, /) -> bool: ...
     def isdimensionless(self) -> bool: ...
+    @staticmethod
+    def algebra_cache_info() -> CacheInfo:
+        '''hits, misses, maxsize and currsize of the unit operation cache.'''
+    @staticmethod
+    def algebra_cache_clear() -> None: ...
     def inverse(self) -> Self: ...
     def __mul__(self, other: BaseUnit) -> Self: ...
     def __truediv__(self, other: BaseUnit) -> Self: ...
@@ -0,0 +1,71 @@
+try:
+    from numpy import add, multiply, ndarray
+except ImportError:
+    ndarray = ()  # isinstance(value, ()) is always False
+
+from .unit_registry import _UNIT_OFFSET
+
+__all__ = ['Converter']
+
+
+def _offset(unit) -> float:
+    '''zero point [K] of an absolute temperature unit like °C, °F,
+    0 for other units, including compound ones like °C/s.'''
+    if len(unit._elements) != 1:
+        return 0
+    (element, e), = unit._elements.items()
+    return _UNIT_OFFSET.get(element.symbol, 0) if e == 1 else 0
+
+
+class Converter:
+    '''A converter of values from a unit to another unit of the same
+    dimension, built by `Unit.converter_to`. The dimension check and the
+    factor/offset are computed once, at construction:
+
+        value_in_target = factor * value_in_source + offset
+
+    where offset is non-zero only between absolute temperature units.
+    >>> to_F = Unit('°C').converter_to('°F')
+    >>> to_F(100)                   # 212.0
+    >>> to_F([0, 100])              # [32.0, 212.0]
+    >>> to_F(celsius, out=celsius)  # in-place, for numpy.ndarray/list
+    '''
+    __slots__ = ('_source', '_target', '_factor', '_offset')
+
+    def __init__(self, source, target) -> None:
+        if source.dimension != target.dimension:
+            raise ValueError(
+                f'dimension {source.dimension} != {target.dimension}.')
+        self._source = source
+        self._target = target
+        self._factor = source.factor / target.factor
+        self._offset = (_offset(source) - _offset(target)) / target.factor
+
+    @property
+    def source(self): return self._source
+    @property
+    def target(self): return self._target
+    @property
+    def factor(self) -> float: return self._factor
+    @property
+    def offset(self) -> float: return self._offset
+
+    def __repr__(self) -> str:
+        cls = self.__class__.__name__
+        return f'{cls}({self.source} -> {self.target})'
+
+    def __call__(self, value, /, *, out=None):
+        '''convert a number, list/tuple or array, into `out` if given.'''
+        if out is None:
+            if isinstance(value, (list, tuple)):
+                return [v * self._factor + self._offset for v in value]
+            if self._offset:
+                return value * self._factor + self._offset
+            return value * self._factor
+        if isinstance(out, ndarray):
+            multiply(value, self._factor, out=out)
+            if self._offset:
+                add(out, self._offset, out=out)
+        else:
+            out[:] = self(value)
+        return out
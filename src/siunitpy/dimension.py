@@ -1,5 +1,8 @@
 import operator
+from math import lcm
+from threading import Lock
 from typing import Iterable, SupportsIndex
+from weakref import WeakValueDictionary
 
 from .utilcollections.utils import _inplace, common_rational
 from .utilcollections.utils import superscript as sup
@@ -8,6 +11,51 @@ _DIM_SYMBOL = ('T', 'L', 'M', 'I', 'H', 'N', 'J')
 _DIM_DICT = {s: i for i, s in enumerate(_DIM_SYMBOL)}
 _DIM_NUM = len(_DIM_SYMBOL)
 
+# The dimension vector is stored as fixed-point exponents over a common
+# denominator, packed into one int with a 32-bit slot per base quantity.
+# A slot holds `numerator + _DIM_LIMIT` in [0, 2**31), so the bit 31 of
+# every slot is a guard bit: it is set iff an addition over/underflows.
+# Mul/div/eq/hash of two dimensions are then a few int operations.
+_DIM_BITS = 32
+_DIM_MASK = (1 << _DIM_BITS) - 1
+_DIM_LIMIT = 1 << (_DIM_BITS - 2)
+_DIM_BIAS = sum(_DIM_LIMIT << (_DIM_BITS * i) for i in range(_DIM_NUM))
+_DIM_GUARD = _DIM_BIAS << 1
+_DIM_DENOMINATOR = 2520  # lcm(1, ..., 10), so 1/2, 1/3... are exact
+
+
+def _pack(numerators: Iterable[int]) -> int:
+    packed = 0
+    for n in reversed(tuple(numerators)):
+        if not -_DIM_LIMIT <= n < _DIM_LIMIT:
+            raise OverflowError('dimension exponent out of range.')
+        packed = packed << _DIM_BITS | (n + _DIM_LIMIT)
+    return packed
+
+
+def _unpack(packed: int) -> tuple[int, ...]:
+    return tuple((packed >> (_DIM_BITS * i) & _DIM_MASK) - _DIM_LIMIT
+                 for i in range(_DIM_NUM))
+
+
+# Dimension objects are interned: equal dimensions are the same object,
+# so eq/hash are by identity. Results of mul/div/pow between interned
+# dimensions are memoized, real workloads only touch a few hundred.
+_INTERNED: 'WeakValueDictionary[int | tuple[int, int], Dimension]' = \
+    WeakValueDictionary()
+_INTERN_LOCK = Lock()
+_TABLE_MAXSIZE = 4096
+_MUL_TABLE: dict[tuple, 'Dimension'] = {}
+_DIV_TABLE: dict[tuple, 'Dimension'] = {}
+_POW_TABLE: dict[tuple, 'Dimension'] = {}
+
+
+def _memoize(table: dict, key: tuple, result: 'Dimension') -> 'Dimension':
+    if len(table) >= _TABLE_MAXSIZE:
+        table.clear()
+    table[key] = result
+    return result
+
 
 def _unpack_vector():
     '''properties of Dimension.'''
@@ -17,15 +65,48 @@ def _unpack_vector():
 
 
 class Dimension:
-    __slots__ = ('__vector',)
+    __slots__ = ('__packed', '__denominator', '__vector', '__compatible',
+                 '__weakref__')
 
-    def __init__(self, T: int | Iterable = 0, L=0, M=0, I=0, H=0, N=0, J=0):
+    def __new__(cls, T: int | Iterable = 0, L=0, M=0, I=0, H=0, N=0, J=0):
         if isinstance(T, Iterable):
             # internal use only, assert len(T) == _DIM_NUM
             dimension_vector = T
         else:
             dimension_vector = (T, L, M, I, H, N, J)
-        self.__vector = tuple(map(common_rational, dimension_vector))
+        vector = tuple(map(common_rational, dimension_vector))
+        # the smallest common denominator being a multiple of the default
+        denominator = lcm(_DIM_DENOMINATOR, *(x.denominator for x in vector))
+        packed = _pack(x.numerator * (denominator // x.denominator)
+                       for x in vector)
+        self = cls.__frompacked(packed, denominator)
+        self.__vector = vector
+        return self
+
+    @classmethod
+    def __frompacked(cls, packed: int, denominator: int = _DIM_DENOMINATOR):
+        '''return the interned object.'''
+        if packed & _DIM_GUARD:
+            raise OverflowError('dimension exponent out of range.')
+        key = packed if denominator == _DIM_DENOMINATOR else (packed, denominator)
+        self = _INTERNED.get(key)
+        if self is not None:
+            return self
+        with _INTERN_LOCK:  # no two objects for one dimension
+            self = _INTERNED.get(key)
+            if self is None:
+                self = object.__new__(cls)
+                self.__packed = packed
+                self.__denominator = denominator
+                self.__vector = self.__compatible = None
+                _INTERNED[key] = self
+        return self
+
+    def __reduce__(self): return self.__class__, (self.astuple(),)
+
+    def __copy__(self): return self
+
+    def __deepcopy__(self, memo): return self
 
     @classmethod
     def unpack(cls, iterable: Iterable | dict, /):
@@ -33,14 +114,18 @@ class Dimension:
             return cls(**iterable)
         return cls(*iterable)
 
-    def astuple(self): return self.__vector
+    def astuple(self):
+        if self.__vector is None:  # decode once
+            self.__vector = tuple(common_rational(n) / self.__denominator
+                                  for n in _unpack(self.__packed))
+        return self.__vector
 
     def __getitem__(self, key: SupportsIndex | str): 
         if isinstance(key, str):
-            return self.__vector[_DIM_DICT[key]]
-        return self.__vector[key]
+            return self.astuple()[_DIM_DICT[key]]
+        return self.astuple()[key]
 
-    def __iter__(self): return iter(self.__vector)
+    def __iter__(self): return iter(self.astuple())
 
     T, L, M, I, H, N, J = _unpack_vector()
     time, length, mass, electric_current, thermodynamic_temperature, \
@@ -57,14 +142,13 @@ class Dimension:
 
     def __len__(self) -> int: return _DIM_NUM
 
-    def __hash__(self) -> int: return hash(self.__vector)
-
-    def __eq__(self, other: 'Dimension') -> bool:
-        return self.__vector == other.__vector
+    # interned, equal iff identical
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
 
     def isdimensionless(self):
         '''all dimension is zero.'''
-        return self is _DIMENSIONLESS or all(v == 0 for v in self)
+        return self is _DIMENSIONLESS
 
     def iscomposedof(self, composition: str):
         '''if a dimension is composed of the compostion.
@@ -90,18 +174,43 @@ class Dimension:
         '''inverse of the Dimension.'''
         if self is _DIMENSIONLESS:
             return self
-        return self.__class__(map(operator.neg, self))
+        return self.__frompacked(2 * _DIM_BIAS - self.__packed,
+                                 self.__denominator)
 
     def __mul__(self, other):
-        return self.__class__(map(operator.add, self, other))
+        result = _MUL_TABLE.get((self, other))
+        if result is not None:
+            return result
+        if self.__denominator == other.__denominator == _DIM_DENOMINATOR:
+            result = self.__frompacked(
+                self.__packed + other.__packed - _DIM_BIAS)
+        else:
+            result = self.__class__(map(operator.add, self, other))
+        return _memoize(_MUL_TABLE, (self, other), result)
 
     def __truediv__(self, other):
-        return self.__class__(map(operator.sub, self, other))
+        result = _DIV_TABLE.get((self, other))
+        if result is not None:
+            return result
+        if self.__denominator == other.__denominator == _DIM_DENOMINATOR:
+            result = self.__frompacked(
+                self.__packed - other.__packed + _DIM_BIAS)
+        else:
+            result = self.__class__(map(operator.sub, self, other))
+        return _memoize(_DIV_TABLE, (self, other), result)
 
     def __pow__(self, n):
-        if self is _DIMENSIONLESS:
+        if self is _DIMENSIONLESS or n == 1:
             return self
-        return self.__class__(x * n for x in self)
+        result = _POW_TABLE.get((self, n))
+        if result is not None:
+            return result
+        if type(n) is int and self.__denominator == _DIM_DENOMINATOR:
+            result = self.__frompacked(
+                _pack(x * n for x in _unpack(self.__packed)))
+        else:
+            result = self.__class__(x * n for x in self)
+        return _memoize(_POW_TABLE, (self, n), result)
 
     __imul__ = _inplace(__mul__)
     __itruediv__ = _inplace(__truediv__)
@@ -118,8 +227,20 @@ class Dimension:
         if self is _DIMENSIONLESS:
             return self
         '''inverse operation of power.'''
+        if type(n) is int and self.__denominator == _DIM_DENOMINATOR:
+            numerators = _unpack(self.__packed)
+            if all(x % n == 0 for x in numerators):
+                return self.__frompacked(_pack(x // n for x in numerators))
         return self.__class__(x / n for x in self)
 
+    def compatible_units(self):
+        '''all the registered units (and prefixed variants) whose power
+        has this dimension, cached in the (interned) object.'''
+        if self.__compatible is None:
+            from .unit_registry import compatible_units  # circular import
+            self.__compatible = compatible_units(self)
+        return self.__compatible
+
     @staticmethod
     def product(dim_iter: Iterable['Dimension']):
         '''return the product of dimension objects.'''
@@ -2,6 +2,8 @@ import sys
 from fractions import Fraction
 from typing import Iterable, Iterator, Literal, SupportsIndex
 
+from .symboldata import CompatibleUnit
+
 __all__ = ['Dimension']
 
 if sys.version_info >= (3, 11):
@@ -37,6 +39,15 @@ class Dimension:
     >>> force_dim.inverse()                     # T⁻²LM
     >>> power_dim = force_dim * vilocity_dim    # T⁻³L²M
     >>> vilocity_dim**2                         # T⁻²L²
+
+    Internally the exponents are packed into a single int, so equality,
+    hash and mul/div are integer operations. Exponents are limited to
+    about ±400000 (±2**30 over the common denominator), beyond which an
+    `OverflowError` is raised.
+
+    `Dimension` objects are interned, equal dimensions are the same
+    object, so `==` is an identity check:
+    >>> Dimension(T=-1, L=1) is vilocity_dim    # True
     '''
 
     def __init__(self, T=0, L=0, M=0, I=0, H=0, N=0, J=0) -> None:
@@ -106,5 +117,20 @@ class Dimension:
     def __pow__(self, n: int | float | Fraction) -> Self: ...
     def __ipow__(self, n: int | float | Fraction) -> Self: ...
     def nthroot(self, n: int | float | Fraction) -> Self: ...
+    def compatible_units(self) -> tuple[CompatibleUnit, ...]:
+        '''all the registered units `u` and their prefixed variants, where
+        `u**n` has this dimension for n = ±1, ±2, ±3, ±1/2, ±1/3, 
+        as `(symbol, exponent, factor)`, `factor` is the factor of `u**n`.
+
+        ordered by n, then the standard unit, the other unprefixed units 
+        and the prefixed ones:
+        >>> DimensionConst.LENGTH.compatible_units()[:2]
+        (CompatibleUnit(symbol='m', exponent=1, factor=1), 
+         CompatibleUnit(symbol='Å', exponent=1, factor=1e-10))
+
+        each unit is listed once, with its first n, e.g. the
+        dimensionless units have n = 1 only. The result is an immutable
+        tuple cached in the object.
+        '''
     @staticmethod
     def product(dim_iter: Iterable[Dimension]) -> Dimension: ...
@@ -0,0 +1,162 @@
+'''Monte Carlo propagation
+---
+`propagate(func, *quantities)` samples the inputs from their
+distributions and evaluates `func` on whole sample batches, the result is
+a `Quantity` of the empirical mean and standard deviation.
+
+Unlike the linear propagation of `Variable`, the result holds for large
+relative uncertainties and nonlinear functions, e.g.
+
+    >>> propagate(lambda x: x**2, Quantity(0, 'm', 1), seed=0)
+
+is about `1 ± 1.4 m²`, not `0 m²`.
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .identity import zero
+from .quantity import DIMENSIONLESS, Quantity
+from .variable import Variable
+
+__all__ = ['propagate', 'normal', 'uniform']
+
+Distribution = Callable[[np.random.Generator, object, object, tuple], object]
+'''`distribution(rng, value, uncertainty, shape)` gives samples of `shape`,
+of mean `value` and standard deviation `uncertainty`.'''
+
+
+def normal(rng: np.random.Generator, value, uncertainty, shape: tuple):
+    return rng.normal(value, uncertainty, shape)
+
+
+def uniform(rng: np.random.Generator, value, uncertainty, shape: tuple):
+    '''uniform on `value ± √3 uncertainty`.'''
+    half_width = np.sqrt(3) * np.asarray(uncertainty)
+    return rng.uniform(value - half_width, value + half_width, shape)
+
+
+def _input(x) -> tuple:
+    '''(value, unit, uncertainty) of an input, unit is None when `x` is not
+    a Quantity.'''
+    if isinstance(x, Quantity):
+        return x.value, x.unit, x.uncertainty
+    if isinstance(x, Variable):
+        return x.value, None, x.uncertainty
+    return x, None, zero
+
+
+def _sample(rng: np.random.Generator, size: int, inputs: Sequence[tuple],
+            distributions: Sequence[Distribution]) -> list:
+    '''the arguments of `func`, of shape `(size,) + common shape` when
+    sampled, exact inputs are not sampled but get a leading axis of
+    length 1, so all of them broadcast.'''
+    shape = np.broadcast_shapes(*(np.shape(value) for value, _, _ in inputs))
+    arguments = []
+    for (value, unit, uncertainty), distribution in zip(inputs, distributions):
+        if uncertainty is not zero:
+            value = distribution(rng, value, uncertainty, (size,) + shape)
+        else:
+            value = np.broadcast_to(value, (1,) + shape)
+        arguments.append(value if unit is None else Quantity(value, unit))
+    return arguments
+
+
+def _evaluate(func: Callable, inputs: Sequence[tuple],
+              distributions: Sequence[Distribution], keep: bool,
+              seed: np.random.SeedSequence, size: int) -> tuple:
+    '''(unit, size, mean, sum of squared deviations, samples or None) of
+    one chunk, run in the worker processes.'''
+    result = func(*_sample(np.random.default_rng(seed), size, inputs,
+                           distributions))
+    unit = result.unit if isinstance(result, Quantity) else None
+    samples = np.asarray(result.value if unit is not None else result)
+    if samples.ndim == 0 or samples.shape[0] != size:
+        # func does not depend on the sampled inputs
+        samples = np.broadcast_to(samples, (size,) + samples.shape[1:])
+    mean = samples.mean(axis=0)
+    m2 = ((samples - mean)**2).sum(axis=0)
+    return unit, size, mean, m2, samples if keep else None
+
+
+def _merge(a: tuple, b: tuple) -> tuple:
+    '''(size, mean, m2) of two chunks, by the parallel variance formula.'''
+    (n_a, mean_a, m2_a), (n_b, mean_b, m2_b) = a, b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return (n, mean_a + delta * (n_b / n),
+            m2_a + m2_b + delta**2 * (n_a * n_b / n))
+
+
+def propagate(func: Callable, *quantities, n: int = 100_000,
+              chunk_size: int = 100_000, seed=None,
+              distribution: Distribution | Sequence[Distribution] = normal,
+              percentiles: Sequence[float] | None = None,
+              processes: int | None = None):
+    '''Monte Carlo propagation of the uncertainties of `quantities` through
+    `func`, return a `Quantity` of the empirical mean and standard
+    deviation of `func(*samples)`.
+
+    Each uncertain input is sampled as an array of shape `(size,) +
+    shape`, where `shape` is broadcast from all the values, by
+    `distribution(rng, value, uncertainty, shape)`, one for all inputs or
+    one per input, exact inputs have a leading axis of length 1. `func`
+    is called once per chunk of at most `chunk_size` samples with
+    `Quantity` (or plain array, for non-quantity inputs) arguments, so it
+    should be vectorized along the first axis.
+    Uncertain quantities used in `func` but not passed, like constants,
+    are not sampled.
+
+    The chunks have their own generators spawned from `seed`, so the
+    result depends on `seed` and `chunk_size`, not on `processes`. When
+    `processes` is given, the chunks are evaluated in a process pool of
+    that size, `func` and `distribution` must then be picklable.
+
+    if `percentiles`, return `(quantity, percentile quantity)`, where the
+    latter stacks the percentiles on its first axis, all samples of the
+    result are then kept in memory.
+    '''
+    if n < 2:
+        raise ValueError('n must be at least 2.')
+    inputs = [_input(x) for x in quantities]
+    if callable(distribution):
+        distributions = [distribution] * len(inputs)
+    elif len(distribution) == len(inputs):
+        distributions = list(distribution)
+    else:
+        raise ValueError('one distribution per quantity is required.')
+    sizes = [chunk_size] * (n // chunk_size)
+    if n % chunk_size:
+        sizes.append(n % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    evaluate = partial(_evaluate, func, inputs, distributions,
+                       percentiles is not None)
+    if processes is None:
+        chunks = map(evaluate, seeds, sizes)
+        return _result(chunks, percentiles)
+    with ProcessPoolExecutor(processes) as pool:
+        return _result(pool.map(evaluate, seeds, sizes), percentiles)
+
+
+def _result(chunks, percentiles: Sequence[float] | None):
+    unit, stats, samples = None, None, []
+    for i, (chunk_unit, *chunk_stats, chunk_samples) in enumerate(chunks):
+        if i == 0:
+            unit, stats = chunk_unit, tuple(chunk_stats)
+        elif chunk_unit is not unit:
+            raise ValueError(f'func returns {chunk_unit} and {unit}.')
+        else:
+            stats = _merge(stats, tuple(chunk_stats))
+        if chunk_samples is not None:
+            samples.append(chunk_samples)
+    count, mean, m2 = stats
+    if unit is None:
+        unit = DIMENSIONLESS
+    quantity = Quantity(mean, unit, np.sqrt(m2 / (count - 1)))
+    if percentiles is None:
+        return quantity
+    values = np.percentile(np.concatenate(samples), percentiles, axis=0)
+    return quantity, Quantity(values, unit)
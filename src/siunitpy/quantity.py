@@ -1,11 +1,23 @@
 import operator
+import re
 from copy import copy
-from typing import Callable, Generic, TypeVar
-
-from .baseunit import BaseUnit
+from typing import Callable, Generic, Iterable, TypeVar
+
+try:
+    from numpy import array
+    from numpy import divide as np_divide
+    from numpy import matmul as np_matmul
+    from numpy import multiply as np_multiply
+except ImportError:
+    from .utilcollections import ElementWiseList as array
+    np_divide = np_matmul = np_multiply = None
+
+from .baseunit import BaseUnit, _canonical
+from .converter import Converter, _offset
 from .dimension import Dimension
 from .identity import Zero, zero
 from .unit_analysis import _unit_init
+from .utilcollections import FrozenCompound, LRUCache
 from .utilcollections.abc import Linear
 from .variable import Variable
 
@@ -20,13 +32,96 @@ it a Quantity object, please use expression 'value @ unit', the expression \
     warnings.warn(unit_rop_warning_message, SyntaxWarning, stacklevel=3)
 
 
+_UNIT_CACHE_MAXSIZE = 1024
+
+_UNIT_CACHE: LRUCache[str, 'Unit'] = LRUCache(_UNIT_CACHE_MAXSIZE)
+'''{symbol: Unit}, parse cache of `Unit(symbol)`.'''
+
+_CONVERTER_CACHE_MAXSIZE = 1024
+
+_CONVERTER_CACHE: LRUCache[tuple[int, int], Converter] = \
+    LRUCache(_CONVERTER_CACHE_MAXSIZE)
+'''{(id(unit), id(unit)): Converter}, the converter keeps both units alive,
+so their id is not reused while cached.'''
+
+
 class Unit(BaseUnit):
+    __slots__ = ()
+
+    def __new__(cls, symbol: str, dim=None, factor=None):
+        if dim is not None:  # constructor of base class, internal use only
+            return super().__new__(cls)
+        if not symbol:
+            return DIMENSIONLESS
+        return _UNIT_CACHE.get_or_create(symbol, cls.__parse)
+
     def __init__(self, symbol: str, dim=None, factor=None) -> None:
-        if dim is None:
-            super().__init__(*_unit_init(symbol))
-        else:  # constructor of base class, internal use only
+        if dim is not None:  # parsed units are initialized in `__parse`
             super().__init__(symbol, dim, factor)  # type: ignore
 
+    @classmethod
+    def __parse(cls, symbol: str):
+        self = super().__new__(cls)
+        BaseUnit.__init__(self, *_unit_init(symbol))
+        return _canonical(self)
+
+    @classmethod
+    def parse_many(cls, symbols: Iterable[str], *, codes=False):
+        '''parse a sequence of unit symbols, each distinct symbol is parsed
+        only once.
+        
+        return a list of `Unit` objects, or `(codes, units)` if `codes`,
+        where `units[codes[i]]` is the unit of the i-th symbol.
+        '''
+        index: dict[str, int] = {}
+        code_list = [index.setdefault(symbol, len(index)) for symbol in symbols]
+        units = tuple(map(cls, index))
+        if codes:
+            return code_list, units
+        return [units[code] for code in code_list]
+
+    @staticmethod
+    def cache_info():
+        '''statistics of the `Unit(symbol)` parse cache.'''
+        return _UNIT_CACHE.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        '''clear the `Unit(symbol)` parse cache and its statistics.'''
+        _UNIT_CACHE.cache_clear()
+
+    @staticmethod
+    def cache_evict(symbol: str) -> bool:
+        '''remove `symbol` from the parse cache, return whether it was
+        cached.'''
+        return _UNIT_CACHE.evict(symbol)
+
+    @staticmethod
+    def converter_cache_info():
+        '''statistics of the `Unit.converter_to` cache.'''
+        return _CONVERTER_CACHE.cache_info()
+
+    @staticmethod
+    def converter_cache_clear() -> None:
+        '''clear the `Unit.converter_to` cache and its statistics.'''
+        _CONVERTER_CACHE.cache_clear()
+
+    def converter_to(self, other: 'str | Unit') -> Converter:
+        '''return the (cached) converter of values from this unit to 
+        `other`, raise `ValueError` if the dimensions differ.'''
+        other = Unit.move(other)
+        key = (id(self), id(other))
+        converter = _CONVERTER_CACHE.get(key)
+        if converter is None:
+            converter = _CONVERTER_CACHE.setdefault(
+                key, Converter(self, other))
+        return converter
+
+    def reduce_with_factor(self, unit: 'str | Unit | None' = None):
+        if unit is not None:
+            unit = Unit.move(unit)
+        return super().reduce_with_factor(unit)
+
     @classmethod
     def move(cls, unit):
         '''transform a str/Unit object to a Unit object.'''
@@ -65,8 +160,28 @@ class Unit(BaseUnit):
 
     __array_priority__ = 100000000000
 
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        '''array * unit, array / unit and array @ unit give one Quantity
+        of the whole array, instead of an object array of Quantity.'''
+        if method != '__call__' or kwargs or len(inputs) != 2 \
+                or inputs[1] is not self or isinstance(inputs[0], Unit):
+            return NotImplemented
+        if ufunc is np_multiply or ufunc is np_matmul:
+            return Quantity(inputs[0], self)
+        if ufunc is np_divide:
+            return Quantity(inputs[0], self.inverse())
+        return NotImplemented
+
 
-DIMENSIONLESS = Unit('')
+DIMENSIONLESS = _canonical(Unit(FrozenCompound(), Dimension.product([]), 1))
+
+_NUMBER = r'[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?'
+_QUANTITY_PATTERN = re.compile(
+    r'\s*(?P<open>\()?\s*(?P<value>{0})'
+    r'(?:\s*(?:±|\+-|\+/-)\s*(?P<uncertainty>{0}))?'
+    r'(?(open)\s*\))\s*(?P<unit>.*?)\s*'.format(_NUMBER), re.DOTALL)
+''''value', 'value unit', 'value ± uncertainty unit', 
+'(value ± uncertainty) unit', where '±' can also be '+-' or '+/-'.'''
 
 
 def assert_dimension_consistency(left, right):
@@ -75,6 +190,22 @@ def assert_dimension_consistency(left, right):
         raise ValueError(f"dimension {left.dimension} != {right.dimension}.")
 
 
+def assert_not_absolute(left, right):
+    '''absolute temperatures of different units, like °C and K, cannot be
+    added or subtracted, whether the other is a difference is unknown.'''
+    if left.unit is not right.unit and \
+            (_offset(left.unit) or _offset(right.unit)):
+        raise ValueError(f'cannot add or subtract {left.unit} and '
+                         f'{right.unit}, absolute temperatures must be '
+                         'converted to the same unit first.')
+
+
+def _exact(a: 'Quantity', b: 'Quantity') -> bool:
+    '''both quantities are in the exact state.'''
+    return a._variable._uncertainty is zero and \
+        b._variable._uncertainty is zero
+
+
 def _comparison(op: Callable[[Variable, Variable], bool]):
     '''construct operator: a == b, a != b, a > b, ...
 
@@ -83,6 +214,8 @@ def _comparison(op: Callable[[Variable, Variable], bool]):
     '''
 
     def __op(self: 'Quantity', other: 'Quantity'):
+        if isinstance(other, QuantityArray):
+            return NotImplemented
         if self.isdimensionless() and not isinstance(other, Quantity):
             return op(self.standard_variable, other)
         assert_dimension_consistency(self, other)
@@ -98,20 +231,33 @@ def _addsub(op: Callable, iop: Callable):
     '''
 
     def __op(self: 'Quantity', other: 'Quantity'):
+        if isinstance(other, QuantityArray):
+            return NotImplemented
         if self.isdimensionless() and not isinstance(other, Quantity):
             return Quantity(op(self.standard_variable, other))
         assert_dimension_consistency(self, other)
-        other_var = other.variable * (other.unit.factor / self.unit.factor)
+        assert_not_absolute(self, other)
+        factor = other.unit.factor / self.unit.factor
+        if _exact(self, other):
+            value = other._variable._value
+            return Quantity._exact(op(self._variable._value,
+                                      value if factor == 1 else value * factor),
+                                   self._unit)
+        other_var = other.variable if factor == 1 else other.variable * factor
         return Quantity(op(self.variable, other_var), self.unit)
 
     def __iop(self: 'Quantity', other: 'Quantity'):
+        if isinstance(other, QuantityArray):
+            return NotImplemented
         if self.isdimensionless() and not isinstance(other, Quantity):
             self._variable *= self.unit.factor
             self._variable = iop(self._variable, other)
             self._unit = DIMENSIONLESS
             return self
         assert_dimension_consistency(self, other)
-        other_var = other.variable * (other.unit.factor / self.unit.factor)
+        assert_not_absolute(self, other)
+        factor = other.unit.factor / self.unit.factor
+        other_var = other.variable if factor == 1 else other.variable * factor
         self._variable = iop(self._variable, other_var)
         return self
 
@@ -143,9 +289,15 @@ def _muldiv(op: Callable, iop: Callable, *, unitop=None, inverse=False):
         def opunit(selfunit, unit): return unitop(selfunit, unit)
 
     def __op(self: 'Quantity', other: 'Quantity'):
+        if isinstance(other, Quantity) and _exact(self, other):
+            return Quantity._exact(op(self._variable._value,
+                                      other._variable._value),
+                                   unitop(self._unit, other._unit))
         if isinstance(other, Unit):
             return Quantity(self.variable, opunit(self.unit, other))
         if not isinstance(other, Quantity):
+            if isinstance(other, QuantityArray):
+                return NotImplemented
             return Quantity(op(self.variable, other), self.unit)
         result = Quantity(op(self.variable, other.variable),
                           unitop(self.unit, other.unit))
@@ -156,6 +308,8 @@ def _muldiv(op: Callable, iop: Callable, *, unitop=None, inverse=False):
             self._unit = opunit(self.unit, other)
             return self
         if not isinstance(other, Quantity):
+            if isinstance(other, QuantityArray):
+                return NotImplemented
             self._variable = iop(self._variable, other)
             return self
         self._variable = iop(self._variable, other.variable)
@@ -191,9 +345,51 @@ class Quantity(Generic[T]):
                 relative_uncertainty=relative_uncertainty) # type: ignore
         self._unit = Unit.move(unit)
 
+    @classmethod
+    def _exact(cls, value: T, unit: Unit) -> 'Quantity[T]':
+        '''an exact quantity, without going through `__init__`.'''
+        self = cls.__new__(cls)
+        self._variable = Variable._exact(value)
+        self._unit = unit
+        return self
+
     @classmethod
     def one(cls, unit: str | Unit): return cls(1, unit)  # type: ignore
 
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], *, return_index=False):
+        '''parse strings like `'12.3 ± 0.4 km/h'` in bulk, return a dict 
+        `{unit symbol: Quantity}`, where the values (and uncertainties) of 
+        the strings with the same unit are gathered into one array.
+
+        if `return_index`, the dict values are `(Quantity, indices)`, 
+        where `indices` are the positions of the strings in the input.
+        '''
+        values: list[float] = []
+        uncertainties: list[float | None] = []
+        unit_symbols: list[str] = []
+        for string in strings:
+            match = _QUANTITY_PATTERN.fullmatch(string)
+            if match is None:
+                raise ValueError(f"'{string}' is not a valid quantity string.")
+            value, uncertainty, unit = match.group('value', 'uncertainty', 'unit')
+            values.append(float(value))
+            uncertainties.append(None if uncertainty is None else float(uncertainty))
+            unit_symbols.append(unit)
+        codes, units = Unit.parse_many(unit_symbols, codes=True)
+        groups: dict[str, tuple[Unit, list[int]]] = {}
+        for i, code in enumerate(codes):
+            unit = units[code]
+            groups.setdefault(unit.symbol, (unit, []))[1].append(i)
+        result = {}
+        for symbol, (unit, indices) in groups.items():
+            uncertainty = [uncertainties[i] for i in indices]
+            quantity = cls(array([values[i] for i in indices]), unit,
+                           zero if all(u is None for u in uncertainty) else
+                           array([u or 0.0 for u in uncertainty]))
+            result[symbol] = (quantity, indices) if return_index else quantity
+        return result
+
     @property
     def variable(self) -> Variable[T]: return self._variable
     @variable.setter
@@ -223,9 +419,18 @@ class Quantity(Generic[T]):
     @property
     def dimension(self) -> Dimension: return self.unit.dimension
     @property
-    def standard_variable(self): return self.variable * self.unit.factor
+    def standard_variable(self):
+        offset = _offset(self.unit)  # absolute temperature, K
+        if offset:
+            return self.variable * self.unit.factor + offset
+        return self.variable * self.unit.factor
+
     @property
-    def standard_value(self): return self.value * self.unit.factor
+    def standard_value(self):
+        offset = _offset(self.unit)
+        if offset:
+            return self.value * self.unit.factor + offset
+        return self.value * self.unit.factor
 
     def __repr__(self) -> str:
         cls = self.__class__.__name__
@@ -249,22 +454,37 @@ class Quantity(Generic[T]):
     def copy(self) -> 'Quantity':
         return Quantity(copy(self.variable), self.unit)
 
-    def _to(self, new_unit: Unit, factor: float, inplace: bool):
+    def correlated(self) -> 'Quantity':
+        return Quantity(self._variable.correlated(), self._unit)
+
+    def _convert(self, new_unit: Unit, inplace: bool):
+        '''transform to a unit of the same dimension by the converter,
+        affine between absolute temperature units.'''
+        converter = self.unit.converter_to(new_unit)
+        return self._to(new_unit, converter.factor, inplace,
+                        converter.offset)
+
+    def _to(self, new_unit: Unit, factor: float, inplace: bool,
+            offset: float = 0):
         '''internal use only.'''
         if inplace:
             self._variable *= factor
+            if offset:
+                self._variable += offset
             self._unit = new_unit
             return self
+        if offset:
+            return Quantity(self.variable * factor + offset, new_unit)
         return Quantity(self.variable * factor, new_unit)
 
     def to(self, new_unit: str | Unit, *, inplace=False, assert_dim=True):
-        '''unit transform.
+        '''unit transform, absolute temperature units like °C and °F are 
+        transformed with their zero point.
         if `assert_dim`, raise Error when not dimensionally consistent.
         '''
         new_unit = Unit.move(new_unit)
-        if assert_dim and self.dimension != new_unit.dimension:
-            raise ValueError(
-                f'dimension {self.dimension} != {new_unit.dimension}.')
+        if assert_dim or self.dimension == new_unit.dimension:
+            return self._convert(new_unit, inplace)  # checks the dimension
         return self._to(new_unit, self.unit.factor / new_unit.factor, inplace)
 
     def ito(self, new_unit: str | Unit, *, assert_dim=True):
@@ -273,16 +493,16 @@ class Quantity(Generic[T]):
 
     def deprefix_unit(self, *, inplace=False):
         '''remove all the prefix of the unit.'''
-        new_unit, factor = self.unit.deprefix_with_factor()
-        return self._to(new_unit, factor, inplace)
+        new_unit, _ = self.unit.deprefix_with_factor()
+        return self._convert(new_unit, inplace)
 
     def tobase_unit(self, *, inplace=False) -> 'Quantity':
         '''transform unit to a combination of base SI unit 
         (i.e. m, kg, s, A, K, mol, cd) 
         with the same dimension.
         '''
-        new_unit, factor = self.unit.tobase_with_factor()
-        return self._to(new_unit, factor, inplace)
+        new_unit, _ = self.unit.tobase_with_factor()
+        return self._convert(new_unit, inplace)
 
     def simplify_unit(self, *, inplace=False) -> 'Quantity':
         '''try if the complex unit can be simplified as a single unit
@@ -292,8 +512,17 @@ class Quantity(Generic[T]):
         '''
         if self.isdimensionless():
             return self._to(DIMENSIONLESS, self.unit.factor, inplace)
-        new_unit, factor = self.unit.simplify_with_factor()
-        return self._to(new_unit, factor, inplace)
+        new_unit, _ = self.unit.simplify_with_factor()
+        return self._convert(new_unit, inplace)
+
+    def reduce_unit(self, unit: str | Unit | None = None, *, inplace=False):
+        '''reduce the unit by `unit`, or to the shortest combination of 
+        standard units if `unit` is None.
+
+        see `Unit.reduce.__doc__` for more infomation.
+        '''
+        new_unit, _ = self.unit.reduce_with_factor(unit)
+        return self._convert(new_unit, inplace)
 
     def remove_uncertainty(self) -> 'Quantity':
         '''set uncertainty zero.'''
@@ -337,5 +566,19 @@ class Quantity(Generic[T]):
 
     __array_priority__ = 1000000000000
 
-    # def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
-    #     pass
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        '''numpy ufuncs operate on the value, see `ufunc`.'''
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        '''numpy functions operate on the value, see `ufunc`.'''
+        return array_function(func, types, args, kwargs)
+
+
+# circular, after Quantity
+from .quantityarray import QuantityArray
+
+try:
+    from .ufunc import array_function, array_ufunc
+except ImportError:  # no numpy, the protocols are never called
+    pass
@@ -1,10 +1,12 @@
 import sys
-from typing import Generic, TypeVar, overload
+from typing import Generic, Iterable, Literal, TypeVar, overload
 
 from .baseunit import BaseUnit
+from .converter import Converter
 from .dimension import Dimension
 from .identity import Zero, zero
 from .utilcollections.abc import Linear
+from .utilcollections.lrucache import CacheInfo
 from .variable import Variable
 
 __all__ = ['Quantity']
@@ -34,6 +36,15 @@ class Unit(BaseUnit):
 
     Transformation
     ---
+
+    Cache
+    ---
+    parsed units are cached by their symbol, so constructing the same 
+    symbol again returns the very same (immutable) object:
+    >>> Unit('km/h') is Unit('km/h')
+    True
+    >>> Unit.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
     '''
 
     def __init__(self, symbol: str):
@@ -43,13 +54,18 @@ class Unit(BaseUnit):
         ---
         - unit should be linked from basic units, which are called elements,
         like `'kg'`, `'s'`, `'meV'`...
-        - the linker should be one of: `'/'`, `'.'`, `'·'`, where `'/'` 
-        represents division, while `'.'` and `'·'` represent multiplication.
+        - the linker should be one of: `'/'`, `'.'`, `'·'` or whitespace, 
+        where `'/'` represents division, while the others represent 
+        multiplication.
         - the exponents of the elements should be written after the elements,
         like `'m2'`, `'m-1'`, `'m³'`, `'m^+114514'` are all acceptable.
+        Fractional exponents are written after `'^'`, like `'m^1/2'`, 
+        or in superscript, like `'m¹ᐟ²'`.
         - The standard form has only one `'/'`, and all subsequent elements 
         are represented as denominators, which does not cause any ambiguity.
         Therefore, `Unit('kg/m/s') == Unit('kg/m.s')`.
+        - elements can be grouped by parentheses, and the group can have
+        an exponent, like `'kg/(m.s2)'`, `'(m/s)2'`.
         - following these basic rules you can easily get used to it, and 
         properly using it will give you proper result.
 
@@ -63,11 +79,55 @@ class Unit(BaseUnit):
 
         - illegal expression example: 
 
-        >>> Unit('x')   # UnitSymbolError: 'x' is not a valid unit.
-        >>> Unit('m+m') # UnitSymbolError: 'm+m' is not a valid element unit.
+        >>> Unit('x')   # UnitSymbolError: 'x' at position 0 of 'x' is not a valid element unit.
+        >>> Unit('m+m') # UnitSymbolError: unexpected '+' at position 1 of 'm+m'.
         '''
     @classmethod
     def move(cls, unit: str | Self) -> Self: ...
+    @overload
+    @classmethod
+    def parse_many(cls, symbols: Iterable[str], *,
+                   codes: Literal[False] = False) -> list[Self]:
+        '''parse a sequence of unit symbols, each distinct symbol is parsed
+        only once, return the list of units in order.
+        >>> Unit.parse_many(['m', 'km/h', 'm'])
+        [Unit(m, L, factor=1), Unit(km/h, T⁻¹L, factor=0.277...), Unit(m, L, factor=1)]
+        '''
+    @overload
+    @classmethod
+    def parse_many(cls, symbols: Iterable[str], *,
+                   codes: Literal[True]) -> tuple[list[int], tuple[Self, ...]]:
+        '''parse a sequence of unit symbols, each distinct symbol is parsed
+        only once, return `(codes, units)`, where `units` are the distinct
+        units and `units[codes[i]]` is the unit of the i-th symbol.
+        >>> Unit.parse_many(['m', 'km/h', 'm'], codes=True)
+        ([0, 1, 0], (Unit(m, L, factor=1), Unit(km/h, T⁻¹L, factor=0.277...)))
+        '''
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        '''hits, misses, maxsize and currsize of the parse cache.'''
+    @staticmethod
+    def cache_clear() -> None: ...
+    @staticmethod
+    def cache_evict(symbol: str) -> bool:
+        '''remove `symbol` from the parse cache, return whether it was 
+        cached.'''
+    def converter_to(self, other: str | Unit) -> Converter:
+        '''return a reusable converter of values from this unit to `other`,
+        the dimension check and factor/offset are computed only once, and
+        the converter is cached per (unit, other) pair.
+        >>> to_m = Unit('km').converter_to('m')
+        >>> to_m([1, 2.5])                      # [1000.0, 2500.0]
+        >>> Unit('°C').converter_to('K')(25)    # 298.15, affine
+        '''
+    @staticmethod
+    def converter_cache_info() -> CacheInfo:
+        '''hits, misses, maxsize and currsize of the converter cache.'''
+    @staticmethod
+    def converter_cache_clear() -> None: ...
+    def reduce_with_factor(self, unit: str | Unit | None = None
+                           ) -> tuple[Self, float]: ...
+    def reduce(self, unit: str | Unit | None = None) -> Self: ...
     def __rmul__(self, other: Variable[T] | Quantity[T]) -> Quantity[T]: ...
     def __rtruediv__(self, other: Variable[T] | Quantity[T]) -> Quantity[T]: ...
     def __rmatmul__(self, other: T | Variable[T] | Quantity[T]) -> Quantity[T]: ...
@@ -116,6 +176,30 @@ class Quantity(Generic[T]):
         '''set variable and unit.'''
     @classmethod
     def one(cls, unit: str | Unit) -> Quantity[float]: ...  # Literal[1]
+    @overload
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], *,
+                     return_index: Literal[False] = False
+                     ) -> dict[str, Quantity]:
+        '''parse strings like `'12.3 ± 0.4 km/h'` in bulk. 
+        
+        Each string is `'value'`, `'value unit'`, `'value ± uncertainty unit'`
+        or `'(value ± uncertainty) unit'`, where `'±'` can also be `'+-'` or
+        `'+/-'`. The values (and uncertainties) of strings with the same unit 
+        are gathered into one array (`numpy.ndarray` if numpy is installed),
+        and the result is a dict `{unit symbol: Quantity}`:
+        >>> Quantity.from_strings(['12.3 ± 0.4 km/h', '5 m', '7 km/h'])
+        {'km/h': Quantity(Variable([12.3  7. ], uncertainty=[0.4 0. ]), km/h), 
+         'm': Quantity(Variable([5.], uncertainty=0), m)}
+        '''
+    @overload
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], *,
+                     return_index: Literal[True]
+                     ) -> dict[str, tuple[Quantity, list[int]]]:
+        '''like `return_index=False`, but the dict values are 
+        `(Quantity, indices)`, where `indices` are the positions of the 
+        strings in the input.'''
     @property
     def variable(self) -> Variable[T]: ...
     @variable.setter
@@ -144,11 +228,23 @@ class Quantity(Generic[T]):
     def isexact(self) -> bool: ...
     def isdimensionless(self) -> bool: ...
     def copy(self) -> Quantity: ...
-    def to(self, new_unit: str | Unit, *, assert_dim=True) -> Quantity[T]: ...
+    def correlated(self) -> Quantity[T]:
+        '''the quantity in the correlated mode, see `Variable.correlated`.'''
+    def to(self, new_unit: str | Unit, *, assert_dim=True) -> Quantity[T]:
+        '''unit transform, absolute temperature units (°C, °F) are
+        transformed with their zero point:
+        >>> Quantity(25, '°C').to('K')  # 298.15 K
+
+        so are `deprefix_unit`, `tobase_unit`, `simplify_unit`,
+        `reduce_unit` and comparisons. Adding or subtracting absolute
+        temperatures of different units raises `ValueError`.
+        '''
     def ito(self, new_unit: str | Unit, *, assert_dim=True) -> Quantity[T]: ...
     def deprefix_unit(self, *, inplace=False) -> Quantity[T]: ...
     def tobase_unit(self, *, inplace=False) -> Quantity[T]: ...
     def simplify_unit(self, *, inplace=False) -> Quantity[T]: ...
+    def reduce_unit(self, unit: str | Unit | None = None, *,
+                    inplace=False) -> Quantity[T]: ...
     def remove_uncertainty(self) -> Quantity[T]: ...
     def __eq__(self, other: Quantity[T]) -> bool: ...
     def __ne__(self, other: Quantity[T]) -> bool: ...
@@ -189,3 +285,15 @@ class Quantity(Generic[T]):
     def __rtruediv__(self, other: T | Quantity[T]) -> Quantity[T]: ...
     def __rpow__(self, other) -> Quantity[T]: ...
     def nthroot(self, n: int) -> Quantity[T]: ...
+    def __array_ufunc__(self, ufunc, method: str, *inputs, **kwargs):
+        '''numpy ufuncs operate on the value with the unit algebra and
+        the uncertainty propagation of `Quantity`:
+        >>> numpy.sqrt(Quantity(numpy.array([1, 4]), 'm2'))  # [1. 2.] m
+        >>> numpy.array([1, 2]) * Quantity(3, 'm')            # [3 6] m
+
+        mismatched dimensions raise `ValueError`, unsupported ufuncs 
+        raise `TypeError`.
+        '''
+    def __array_function__(self, func, types, args, kwargs):
+        '''`numpy.sum`, `mean`, `std`, `min`, `max`, `concatenate`, 
+        `stack`, `where`, `clip`, `round`... operate on the value.'''
@@ -0,0 +1,386 @@
+'''QuantityArray
+---
+a columnar container of quantities: one `Unit`, a values `numpy.ndarray`
+and an optional uncertainties `numpy.ndarray` of the same shape.
+
+Unlike a list (or an object array) of `Quantity`, the dimension check
+and the unit algebra run once per operation, not once per element,
+and the values are computed by numpy.
+'''
+
+import operator
+from typing import Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .converter import Converter, _offset
+from .identity import Zero, zero
+from .quantity import DIMENSIONLESS, Quantity, Unit, assert_not_absolute
+
+__all__ = ['QuantityArray']
+
+
+def _asarray(value):
+    '''values as a float (or complex) ndarray.'''
+    value = np.asarray(value)
+    return value if value.dtype.kind in 'fc' else value.astype(float)
+
+
+def _hypot(a, b):
+    '''sqrt(a² + b²) for non-negative a, b, which may be zero.'''
+    if a is zero:
+        return b
+    if b is zero:
+        return a
+    return np.hypot(a, b)
+
+
+def _owned(array) -> bool:
+    '''whether the array owns a writable buffer, not a view.'''
+    return array.base is None and array.flags.writeable
+
+
+def _wrap(value, unit: Unit, uncertainty):
+    '''Quantity if the value is a scalar, otherwise QuantityArray.'''
+    if np.ndim(value) == 0:
+        if uncertainty is not zero:
+            uncertainty = uncertainty.item()
+        return Quantity(value.item(), unit, uncertainty)
+    return QuantityArray._fromarrays(value, unit, uncertainty)
+
+
+def _operand(self: 'QuantityArray', other):
+    '''(value, uncertainty) of a QuantityArray/Quantity in the unit of
+    `self`, or of a plain number/array if `self` is dimensionless.
+    Absolute temperatures are converted with their zero point.'''
+    if isinstance(other, (QuantityArray, Quantity)):
+        if self.dimension != other.dimension:
+            raise ValueError(
+                f'dimension {self.dimension} != {other.dimension}.')
+        if other.unit is not self.unit and \
+                (_offset(other.unit) or _offset(self.unit)):
+            converter = other.unit.converter_to(self.unit)
+            return (converter(other.value),
+                    other.uncertainty * abs(converter.factor))
+        factor = other.unit.factor / self.unit.factor
+        if factor == 1:
+            return other.value, other.uncertainty
+        return other.value * factor, other.uncertainty * factor
+    if not self.isdimensionless():
+        raise ValueError(f'{self.dimension} is not dimensionless, '
+                         'cannot operate with non-quantity value.')
+    return other / self.unit.factor, zero
+
+
+def _comparison(op: Callable):
+    '''construct operator: a == b, a != b, a > b... of the values,
+    return a bool array.'''
+    def __op(self: 'QuantityArray', other):
+        value, _ = _operand(self, other)
+        return op(self._value, value)
+    return __op
+
+
+def _addsub(op: Callable):
+    '''construct operator: a + b, a - b.'''
+    def __op(self: 'QuantityArray', other):
+        if isinstance(other, (QuantityArray, Quantity)):
+            assert_not_absolute(self, other)
+        value, uncertainty = _operand(self, other)
+        return _wrap(op(self._value, value), self._unit,
+                     _hypot(self._uncertainty, abs(uncertainty)))
+
+    def __rop(self: 'QuantityArray', other):
+        if isinstance(other, (QuantityArray, Quantity)):
+            assert_not_absolute(self, other)
+        value, uncertainty = _operand(self, other)
+        return _wrap(op(value, self._value), self._unit,
+                     _hypot(self._uncertainty, abs(uncertainty)))
+
+    return __op, __rop
+
+
+class QuantityArray:
+    '''`QuantityArray` holds one `unit`, an ndarray of `value` and an
+    ndarray (or `zero`) of `uncertainty`:
+    >>> length = QuantityArray([1.0, 2.5, 4.0], 'km', 0.1)
+    >>> length.to('m').value
+    array([1000., 2500., 4000.])
+
+    indexing gives a `Quantity` for a single element, and a
+    `QuantityArray` for slices, masks, etc.:
+    >>> length[1]
+    Quantity(2.5 ± 0.1, km)
+    >>> length[length > Quantity(2, 'km')].sum()
+    Quantity(6.5 ± 0.14142135623730953, km)
+
+    arithmetic propagates the uncertainties as independent,
+    comparisons return bool arrays.
+    '''
+    __slots__ = ('_value', '_unit', '_uncertainty')
+
+    def __init__(self, value, /, unit: str | Unit = DIMENSIONLESS,
+                 uncertainty=zero, *, relative_uncertainty=zero) -> None:
+        if np is None:
+            raise ImportError('QuantityArray requires numpy.')
+        self._value = _asarray(value)
+        self._unit = Unit.move(unit)
+        if uncertainty is zero:
+            uncertainty = relative_uncertainty * self._value
+        if uncertainty is not zero:
+            uncertainty = np.abs(np.broadcast_to(uncertainty, self.shape))
+        self._uncertainty = uncertainty
+
+    @classmethod
+    def _fromarrays(cls, value, unit: Unit, uncertainty):
+        '''construct without check, internal use only.'''
+        self = cls.__new__(cls)
+        self._value, self._unit, self._uncertainty = value, unit, uncertainty
+        return self
+
+    @classmethod
+    def from_quantities(cls, quantities: Iterable[Quantity],
+                        unit: str | Unit | None = None):
+        '''gather quantities into one array, in `unit` or the unit of the
+        first quantity. The converter is looked up once per unit.'''
+        quantities = list(quantities)
+        if unit is None:
+            if not quantities:
+                raise ValueError('unit of empty quantities is unknown.')
+            unit = quantities[0].unit
+        unit = Unit.move(unit)
+        converters: dict[int, Converter] = {}
+        value, uncertainty = [], []
+        for q in quantities:
+            converter = converters.get(id(q.unit))
+            if converter is None:  # checks the dimension
+                converter = converters[id(q.unit)] = q.unit.converter_to(unit)
+            value.append(converter(q.value))
+            uncertainty.append(0 if q.isexact() else
+                               q.uncertainty * abs(converter.factor))
+        return cls(value, unit, zero if not any(uncertainty) else uncertainty)
+
+    @property
+    def value(self): return self._value
+    @property
+    def uncertainty(self): return self._uncertainty
+    @property
+    def relative_uncertainty(self): return self._uncertainty / abs(self._value)
+    @property
+    def unit(self) -> Unit: return self._unit
+    @property
+    def dimension(self): return self._unit.dimension
+    @property
+    def standard_value(self):
+        offset = _offset(self._unit)  # absolute temperature, K
+        if offset:
+            return self._value * self._unit.factor + offset
+        return self._value * self._unit.factor
+    @property
+    def shape(self) -> tuple[int, ...]: return self._value.shape
+    @property
+    def ndim(self) -> int: return self._value.ndim
+    @property
+    def size(self) -> int: return self._value.size
+    @property
+    def dtype(self): return self._value.dtype
+
+    def __len__(self) -> int: return len(self._value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        uncertainty = self._uncertainty
+        if uncertainty is not zero:
+            uncertainty = uncertainty[key]
+        return _wrap(self._value[key], self._unit, uncertainty)
+
+    def __setitem__(self, key, other) -> None:
+        value, uncertainty = _operand(self, other)
+        self._value[key] = value
+        if uncertainty is zero and self._uncertainty is zero:
+            return
+        if self._uncertainty is zero:
+            self._uncertainty = np.zeros(self.shape)
+        elif not self._uncertainty.flags.writeable:
+            self._uncertainty = self._uncertainty.copy()
+        self._uncertainty[key] = 0 if uncertainty is zero else uncertainty
+
+    def __repr__(self) -> str:
+        cls = self.__class__.__name__
+        if self.isexact():
+            return f'{cls}({self._value!r}, {self._unit})'
+        return (f'{cls}({self._value!r}, {self._unit}, '
+                f'uncertainty={self._uncertainty!r})')
+
+    def __str__(self) -> str:
+        value = str(self._value)
+        if not self.isexact():
+            value = f'{value} ± {self._uncertainty}'
+        if self._unit is DIMENSIONLESS:
+            return value
+        return f'{value} {self._unit}'
+
+    def isexact(self) -> bool: return self._uncertainty is zero
+
+    def isdimensionless(self) -> bool: return self._unit.isdimensionless()
+
+    def copy(self) -> 'QuantityArray':
+        uncertainty = self._uncertainty
+        if uncertainty is not zero:
+            uncertainty = uncertainty.copy()
+        return self._fromarrays(self._value.copy(), self._unit, uncertainty)
+
+    def remove_uncertainty(self) -> 'QuantityArray':
+        return self._fromarrays(self._value, self._unit, zero)
+
+    def to(self, new_unit: str | Unit, *, inplace=False):
+        '''unit transform, the dimension is checked once, absolute
+        temperature units are transformed with their zero point.'''
+        new_unit = Unit.move(new_unit)
+        converter = self._unit.converter_to(new_unit)
+        factor = converter.factor
+        if inplace:
+            # views share their buffers with the parent, rebind them
+            if _owned(self._value):
+                converter(self._value, out=self._value)
+            else:
+                self._value = converter(self._value)
+            uncertainty = self._uncertainty
+            if uncertainty is zero:
+                pass
+            elif _owned(uncertainty):
+                np.multiply(uncertainty, abs(factor), out=uncertainty)
+            else:
+                self._uncertainty = uncertainty * abs(factor)
+            self._unit = new_unit
+            return self
+        return self._fromarrays(converter(self._value), new_unit,
+                                self._uncertainty * abs(factor))
+
+    def ito(self, new_unit: str | Unit):
+        '''abbreviation of inplace unit transform.'''
+        return self.to(new_unit, inplace=True)
+
+    def tobase_unit(self) -> 'QuantityArray':
+        new_unit, _ = self._unit.tobase_with_factor()
+        return self.to(new_unit)
+
+    # reductions, the unit is preserved
+
+    def sum(self, axis=None):
+        uncertainty = self._uncertainty
+        if uncertainty is not zero:
+            uncertainty = np.sqrt(np.sum(uncertainty**2, axis=axis))
+        return _wrap(np.sum(self._value, axis=axis), self._unit, uncertainty)
+
+    def mean(self, axis=None):
+        n = self.size if axis is None else self.shape[axis]
+        uncertainty = self._uncertainty
+        if uncertainty is not zero:
+            uncertainty = np.sqrt(np.sum(uncertainty**2, axis=axis)) / n
+        return _wrap(np.mean(self._value, axis=axis), self._unit, uncertainty)
+
+    def std(self, axis=None, ddof=0):
+        '''standard deviation of the values, which is exact.'''
+        return _wrap(np.std(self._value, axis=axis, ddof=ddof),
+                     self._unit, zero)
+
+    def __extremum(self, arg: Callable, axis):
+        index = arg(self._value, axis=axis)
+        if axis is None:
+            uncertainty = self._uncertainty
+            if uncertainty is not zero:
+                uncertainty = uncertainty.reshape(-1)[index]
+            return _wrap(self._value.reshape(-1)[index], self._unit,
+                         uncertainty)
+        index = np.expand_dims(index, axis)
+        uncertainty = self._uncertainty
+        if uncertainty is not zero:
+            uncertainty = np.take_along_axis(uncertainty, index, axis)
+            uncertainty = uncertainty.squeeze(axis)
+        value = np.take_along_axis(self._value, index, axis).squeeze(axis)
+        return _wrap(value, self._unit, uncertainty)
+
+    def min(self, axis=None):
+        '''the minimum and its uncertainty.'''
+        return self.__extremum(np.argmin, axis)
+
+    def max(self, axis=None):
+        '''the maximum and its uncertainty.'''
+        return self.__extremum(np.argmax, axis)
+
+    __eq__ = _comparison(operator.eq)  # type: ignore
+    __ne__ = _comparison(operator.ne)  # type: ignore
+    __gt__ = _comparison(operator.gt)
+    __lt__ = _comparison(operator.lt)
+    __ge__ = _comparison(operator.ge)
+    __le__ = _comparison(operator.le)
+    __hash__ = None  # type: ignore
+
+    def __pos__(self): return self._fromarrays(+self._value, self._unit,
+                                               self._uncertainty)
+
+    def __neg__(self): return self._fromarrays(-self._value, self._unit,
+                                               self._uncertainty)
+
+    def __abs__(self): return self._fromarrays(abs(self._value), self._unit,
+                                               self._uncertainty)
+
+    __add__, __radd__ = _addsub(operator.add)
+    __sub__, __rsub__ = _addsub(operator.sub)
+
+    def __mul__(self, other):
+        if isinstance(other, Unit):
+            return self._fromarrays(self._value, self._unit * other,
+                                    self._uncertainty)
+        if not isinstance(other, (QuantityArray, Quantity)):
+            return _wrap(self._value * other, self._unit,
+                         self._uncertainty * np.abs(other))
+        value = self._value * other.value
+        uncertainty = _hypot(self._uncertainty * np.abs(other.value),
+                             other.uncertainty * np.abs(self._value))
+        return _wrap(value, self._unit * other.unit, uncertainty)
+
+    def __truediv__(self, other):
+        if isinstance(other, Unit):
+            return self._fromarrays(self._value, self._unit / other,
+                                    self._uncertainty)
+        if not isinstance(other, (QuantityArray, Quantity)):
+            return _wrap(self._value / other, self._unit,
+                         self._uncertainty / np.abs(other))
+        value = self._value / other.value
+        uncertainty = _hypot(self._uncertainty,
+                             other.uncertainty * np.abs(value))
+        return _wrap(value, self._unit / other.unit,
+                     uncertainty / np.abs(other.value))
+
+    def __rmul__(self, other):
+        '''other is a number, an array or a `Quantity`.'''
+        return self * other
+
+    def __rtruediv__(self, other):
+        '''other is a number, an array or a `Quantity`.'''
+        value = other.value if isinstance(other, Quantity) else other
+        result = self._value**-1 * value
+        uncertainty = self._uncertainty * np.abs(result / self._value)
+        if isinstance(other, Quantity):
+            uncertainty = _hypot(uncertainty, other.uncertainty *
+                                 np.abs(result / other.value))
+            return _wrap(result, other.unit / self._unit, uncertainty)
+        return _wrap(result, self._unit.inverse(), uncertainty)
+
+    def __pow__(self, n):
+        value = self._value**n
+        uncertainty = self._uncertainty
+        if uncertainty is not zero:
+            uncertainty = uncertainty * np.abs(n * value / self._value)
+        return _wrap(value, self._unit**n, uncertainty)
+
+    # ndarray [op] QuantityArray defers to the reflected operators
+    __array_ufunc__ = None
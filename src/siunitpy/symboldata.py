@@ -1,8 +1,11 @@
+from fractions import Fraction
+from typing import NamedTuple
+
 from .dimension import Dimension
 from .dimensionconst import DimensionConst
 from .utilcollections.constclass import ConstClass
 
-__all__ = ['SymbolData', 'PrefixData', 'BaseData']
+__all__ = ['SymbolData', 'PrefixData', 'BaseData', 'CompatibleUnit']
 
 
 class UnitSystem(ConstClass):
@@ -59,3 +62,11 @@ class BaseData(SymbolData):
     def dimension(self): return self._dimension
     @dimension.setter
     def dimension(self, dim): self._dimension = dim
+
+
+class CompatibleUnit(NamedTuple):
+    '''a registered (prefixed) unit element whose `exponent` power has
+    the queried dimension, and `factor` is the factor of the power.'''
+    symbol: str
+    exponent: int | Fraction
+    factor: float
@@ -0,0 +1,290 @@
+'''NumPy protocols of `Quantity`
+---
+`Quantity.__array_ufunc__` and `Quantity.__array_function__` dispatch
+here. The ufuncs and functions work on the values with the unit algebra
+of `Quantity` and the uncertainty propagation of `Variable`, so
+`numpy.sqrt(q)`, `numpy.array([1, 2]) * q` or `numpy.sum(q)` give one
+`Quantity` instead of an object array.
+
+Non-quantity operands are treated as dimensionless. Mismatched
+dimensions raise `ValueError`. Unsupported ufuncs and functions return
+`NotImplemented`, so numpy raises `TypeError`.
+'''
+
+from typing import Callable
+
+import numpy as np
+
+from .identity import zero
+from .quantity import DIMENSIONLESS, Quantity, Unit, assert_not_absolute
+from .quantityarray import QuantityArray
+from .variable import Variable
+
+__all__ = ['array_ufunc', 'array_function']
+
+
+def _variable(x) -> Variable:
+    return x.variable if isinstance(x, Quantity) else Variable(x)
+
+
+def _unit(x) -> Unit:
+    return x.unit if isinstance(x, Quantity) else DIMENSIONLESS
+
+
+def _same_unit(inputs) -> tuple[Unit, list[Variable]]:
+    '''the unit of the first quantity, and the variables of the inputs
+    in that unit, the dimension is checked once per input. Absolute
+    temperatures are converted with their zero point.'''
+    unit = next(x.unit for x in inputs if isinstance(x, Quantity))
+    variables = []
+    for x in inputs:
+        if isinstance(x, Quantity):
+            if x.dimension != unit.dimension:
+                raise ValueError(
+                    f'dimension {x.dimension} != {unit.dimension}.')
+            variable = x.variable
+            if x.unit is not unit:
+                converter = x.unit.converter_to(unit)
+                variable = variable * converter.factor
+                if converter.offset:
+                    variable = variable + converter.offset
+        else:
+            if not unit.isdimensionless():
+                raise ValueError(f'{unit.dimension} is not dimensionless, '
+                                 'cannot operate with non-quantity value.')
+            variable = Variable(x / unit.factor)
+        variables.append(variable)
+    return unit, variables
+
+
+def _dimensionless(x) -> Variable:
+    '''the standard variable of a dimensionless input.'''
+    if not isinstance(x, Quantity):
+        return Variable(x)
+    if not x.isdimensionless():
+        raise ValueError(f'{x.dimension} is not dimensionless.')
+    return x.standard_variable
+
+
+def _array(uncertainty):
+    return 0 if uncertainty is zero else uncertainty
+
+
+# rules of ufuncs, `rule(ufunc, *inputs)`
+
+def _addsub(ufunc, a, b):
+    if isinstance(a, Quantity) and isinstance(b, Quantity):
+        assert_not_absolute(a, b)
+    unit, (a, b) = _same_unit((a, b))
+    return Quantity(a + b if ufunc is np.add else a - b, unit)
+
+
+def _muldiv(ufunc, a, b):
+    a_var, b_var = _variable(a), _variable(b)
+    if ufunc is np.multiply:
+        return Quantity(a_var * b_var, _unit(a) * _unit(b))
+    return Quantity(a_var / b_var, _unit(a) / _unit(b))
+
+
+def _power(ufunc, base, exponent):
+    if not isinstance(base, Quantity) or base.isdimensionless():
+        # the uncertainty of the exponent propagates
+        return Quantity(_dimensionless(base) ** _dimensionless(exponent))
+    if isinstance(exponent, Quantity):
+        exponent = _dimensionless(exponent).value
+    if np.ndim(exponent) != 0:
+        raise ValueError('exponent of a quantity with unit must be a scalar.')
+    return Quantity(base.variable ** exponent, base.unit ** exponent)
+
+
+def _root(n: int):
+    def rule(ufunc, x):
+        return Quantity(x.variable.nthroot(n), x.unit.nthroot(n))
+    return rule
+
+
+def _square(ufunc, x): return Quantity(x.variable ** 2, x.unit ** 2)
+
+
+def _reciprocal(ufunc, x):
+    return Quantity(x.variable ** -1, x.unit.inverse())
+
+
+def _unary(ufunc, x):
+    '''value-only ufuncs keeping the unit and the uncertainty.'''
+    return Quantity(ufunc(x.value), x.unit, x.uncertainty)
+
+
+def _extremum(ufunc, a, b):
+    unit, (a, b) = _same_unit((a, b))
+    value = ufunc(a.value, b.value)
+    if a.uncertainty is zero and b.uncertainty is zero:
+        return Quantity(value, unit)
+    uncertainty = np.where(value == a.value, _array(a.uncertainty),
+                           _array(b.uncertainty))
+    return Quantity(value, unit, uncertainty)
+
+
+def _comparison(ufunc, a, b):
+    _, (a, b) = _same_unit((a, b))
+    return ufunc(a.value, b.value)
+
+
+def _predicate(ufunc, x): return ufunc(x.value)
+
+
+def _function(derivative: Callable):
+    '''ufuncs of dimensionless input, `derivative(x, f(x))`.'''
+    def rule(ufunc, x):
+        x = _dimensionless(x)
+        value = ufunc(x.value)
+        if x.uncertainty is zero:
+            return Quantity(value)
+        return Quantity(value, DIMENSIONLESS,
+                        np.abs(derivative(x.value, value)) * x.uncertainty)
+    return rule
+
+
+def _arctan2(ufunc, y, x):
+    _, (y, x) = _same_unit((y, x))
+    value = ufunc(y.value, x.value)
+    if y.uncertainty is zero and x.uncertainty is zero:
+        return Quantity(value)
+    uncertainty = np.hypot(x.value * y.uncertainty, y.value * x.uncertainty)
+    return Quantity(value, DIMENSIONLESS,
+                    uncertainty / (x.value**2 + y.value**2))
+
+
+_LN2, _LN10 = np.log(2), np.log(10)
+
+_UFUNC_RULES: dict[np.ufunc, Callable] = {
+    np.add: _addsub, np.subtract: _addsub,
+    np.multiply: _muldiv, np.divide: _muldiv,
+    np.power: _power, np.float_power: _power,
+    np.sqrt: _root(2), np.cbrt: _root(3), np.square: _square,
+    np.reciprocal: _reciprocal,
+    **dict.fromkeys((np.negative, np.positive, np.absolute, np.fabs,
+                     np.conjugate, np.rint, np.floor, np.ceil, np.trunc),
+                    _unary),
+    **dict.fromkeys((np.maximum, np.minimum, np.fmax, np.fmin), _extremum),
+    **dict.fromkeys((np.equal, np.not_equal, np.less, np.less_equal,
+                     np.greater, np.greater_equal), _comparison),
+    **dict.fromkeys((np.isfinite, np.isinf, np.isnan, np.signbit),
+                    _predicate),
+    np.exp: _function(lambda x, y: y),
+    np.expm1: _function(lambda x, y: y + 1),
+    np.exp2: _function(lambda x, y: y * _LN2),
+    np.log: _function(lambda x, y: 1 / x),
+    np.log2: _function(lambda x, y: 1 / (x * _LN2)),
+    np.log10: _function(lambda x, y: 1 / (x * _LN10)),
+    np.log1p: _function(lambda x, y: 1 / (1 + x)),
+    np.sin: _function(lambda x, y: np.cos(x)),
+    np.cos: _function(lambda x, y: np.sin(x)),
+    np.tan: _function(lambda x, y: 1 + y**2),
+    np.arcsin: _function(lambda x, y: 1 / np.sqrt(1 - x**2)),
+    np.arccos: _function(lambda x, y: 1 / np.sqrt(1 - x**2)),
+    np.arctan: _function(lambda x, y: 1 / (1 + x**2)),
+    np.sinh: _function(lambda x, y: np.cosh(x)),
+    np.cosh: _function(lambda x, y: np.sinh(x)),
+    np.tanh: _function(lambda x, y: 1 - y**2),
+    np.arcsinh: _function(lambda x, y: 1 / np.sqrt(x**2 + 1)),
+    np.arccosh: _function(lambda x, y: 1 / np.sqrt(x**2 - 1)),
+    np.arctanh: _function(lambda x, y: 1 / (1 - x**2)),
+    np.arctan2: _arctan2,
+}
+
+
+def array_ufunc(ufunc, method: str, *inputs, **kwargs):
+    if method != '__call__' or kwargs:
+        return NotImplemented  # reduce, accumulate, out=...
+    rule = _UFUNC_RULES.get(ufunc)
+    if rule is None:
+        return NotImplemented
+    if any(isinstance(x, Unit) for x in inputs):  # quantity [op] unit
+        inputs = tuple(Quantity(1, x) if isinstance(x, Unit) else x
+                       for x in inputs)
+    return rule(ufunc, *inputs)
+
+
+# array functions, `function(*args, **kwargs)` like numpy
+
+def _columnar(q: Quantity) -> QuantityArray:
+    value = np.asarray(q.value)
+    uncertainty = q.uncertainty
+    if uncertainty is not zero:
+        uncertainty = np.broadcast_to(uncertainty, value.shape)
+    return QuantityArray._fromarrays(value, q.unit, uncertainty)
+
+
+def _quantity(result) -> Quantity:
+    if isinstance(result, QuantityArray):
+        return Quantity(result.value, result.unit, result.uncertainty)
+    return result
+
+
+def _reduction(name: str, keywords: frozenset[str] = frozenset()):
+    '''reductions of QuantityArray, the unit is preserved. Keyword
+    arguments other than `axis` and `keywords`, like `keepdims` or `out`,
+    are not supported.'''
+    def function(a: Quantity, axis=None, **kwargs):
+        if not keywords.issuperset(kwargs):
+            return NotImplemented
+        return _quantity(getattr(_columnar(a), name)(axis=axis, **kwargs))
+    return function
+
+
+def _join(func: Callable):
+    '''functions joining a sequence of quantities, like concatenate.'''
+    def function(quantities, *args, **kwargs):
+        unit, variables = _same_unit(quantities)
+        value = func([v.value for v in variables], *args, **kwargs)
+        if all(v.uncertainty is zero for v in variables):
+            return Quantity(value, unit)
+        uncertainty = func([np.broadcast_to(_array(v.uncertainty),
+                                             np.shape(v.value))
+                            for v in variables], *args, **kwargs)
+        return Quantity(value, unit, uncertainty)
+    return function
+
+
+def _where(condition, x, y):
+    unit, (x, y) = _same_unit((x, y))
+    value = np.where(condition, x.value, y.value)
+    if x.uncertainty is zero and y.uncertainty is zero:
+        return Quantity(value, unit)
+    uncertainty = np.where(condition, _array(x.uncertainty),
+                           _array(y.uncertainty))
+    return Quantity(value, unit, uncertainty)
+
+
+def _clip(a, a_min, a_max, **kwargs):
+    unit, (a, a_min, a_max) = _same_unit((a, a_min, a_max))
+    value = np.clip(a.value, a_min.value, a_max.value, **kwargs)
+    return Quantity(value, unit, a.uncertainty)
+
+
+def _round(a, decimals=0):
+    return Quantity(np.round(a.value, decimals), a.unit, a.uncertainty)
+
+
+_ARRAY_FUNCTIONS: dict[Callable, Callable] = {
+    np.sum: _reduction('sum'), np.mean: _reduction('mean'),
+    np.std: _reduction('std', frozenset({'ddof'})),
+    np.min: _reduction('min'), np.max: _reduction('max'),
+    np.amin: _reduction('min'), np.amax: _reduction('max'),
+    np.concatenate: _join(np.concatenate), np.stack: _join(np.stack),
+    np.hstack: _join(np.hstack), np.vstack: _join(np.vstack),
+    np.where: _where, np.clip: _clip,
+    np.round: _round, np.around: _round,
+    np.shape: lambda a: np.shape(a.value),
+    np.ndim: lambda a: np.ndim(a.value),
+    np.size: lambda a, axis=None: np.size(a.value, axis),
+}
+
+
+def array_function(func, types, args, kwargs):
+    function = _ARRAY_FUNCTIONS.get(func)
+    if function is None or not all(issubclass(t, (Quantity, np.ndarray))
+                                   for t in types):
+        return NotImplemented
+    return function(*args, **kwargs)
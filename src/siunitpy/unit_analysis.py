@@ -4,13 +4,19 @@ Resolving rules
 - for special elements, convert it to formular, like '℃' -> '°C'.
 - some special dimensionless unit should not be prefixed or combined, 
   like '%', '°', '″'...
-- split the symbol into element list by linkers: '/', '.', '·' 
+- split the symbol into elements by linkers: '/', '.', '·', whitespace
   (and their combination), after the first '/', all elements are the 
   denominators.
 - exponents of the elements are the digits and sign at the end of each
-  substring.
+  element, optionally led by '^', like 'm2', 'm-1', 'm³', 'm⁻¹ᐟ²'.
+  fractional exponent is written after '^', like 'm^1/2', 'm^-3/2'.
+- elements can be grouped by parentheses, the group follows the rules
+  above and can have an exponent, like 'kg/(m.s2)', '(m/s)2'.
 - elements are the first combination without digits
   and sign and space and '^'.
+
+The symbol is scanned once from left to right, an invalid symbol raises
+`UnitSymbolError` with the position where the scanning fails.
 '''
 
 if False:
@@ -21,19 +27,17 @@ if False:
         import re
         raise ImportWarning('please use regex.')
 import re
+from fractions import Fraction
 from math import prod as float_product
 
 from .dimension import Dimension
-from .unitelement import UnitElement
-from .utilcollections import Compound
-from .utilcollections.utils import _SUPERSCRIPT, neg_after
+from .unitelement import UnitElement, UnitSymbolError
+from .utilcollections import FrozenCompound
+from .utilcollections.utils import _SUPERSCRIPT
 from .utilcollections.utils import superscript as sup
 
-__all__ = ['_resolve', '_combine', '_combine_fullname', '_unit_init']
-
-_UNIT_SEP = re.compile(r'[/.·]+')
-_UNIT_EXPO = re.compile(r'[+-]?[0-9]+$')
-_REMOVE = re.compile(r'\s|\^?[+-]?[0-9]+$')
+__all__ = ['_tokenize', '_resolve', '_combine', '_combine_fullname',
+           '_unit_init']
 
 # special single char
 _SPECIAL_CHAR = {
@@ -41,57 +45,133 @@ _SPECIAL_CHAR = {
     '℃': '°C', '℉': '°F',
     '٪': '%', '⁒': '%',
     "'": '′', '"': '″',
-} | {s: str(i) for i, s in enumerate(_SUPERSCRIPT)}
-_SPECIAL_PAT = re.compile('[{}]'.format(''.join(_SPECIAL_CHAR)))
+}
+_SPECIAL_TABLE = str.maketrans(_SPECIAL_CHAR)
+_EXPONENT_TABLE = str.maketrans({s: str(i) for i, s in enumerate(_SUPERSCRIPT)}
+                                | {'⁺': '+', '⁻': '-', 'ᐟ': '/'})
+
+_NOT_NAME = r'\s/.·()^+\-0-9' + _SUPERSCRIPT + '⁺⁻ᐟ'
+_NAME = r'[^{0}]+(?:-[^{0}]+)*'.format(_NOT_NAME)
+_EXPONENT = r'(?P<{0}>\^)?[+\-⁺⁻]?(?:[0-9]+|[{1}]+(?:ᐟ[{1}]+)?)' \
+    r'(?({0})(?:/[0-9]+)?)'  # fraction after '^' only
+_TOKEN = re.compile(
+    r'(?P<sep>[\s/.·]+)?(?:(?P<open>\()|'
+    r'(?P<name>{})(?P<exp>{})?|'.format(
+        _NAME, _EXPONENT.format('caret', _SUPERSCRIPT)) +
+    r'(?P<close>\))(?P<gexp>{})?|'.format(
+        _EXPONENT.format('gcaret', _SUPERSCRIPT)) +
+    r'(?P<error>.))?', re.DOTALL)
+'''a token is an optional linker followed by an element, a parenthesis 
+or an unexpected char, `lastgroup` of a token match tells its kind.'''
+
+
+def _tokenize(symbol: str, /) -> list[tuple[UnitElement, Fraction | int]]:
+    '''scan the unit symbol once, return the (element, exponent) pairs 
+    in order, the same element may appear more than once.'''
+    pairs: list[tuple[UnitElement, Fraction | int]] = []
+    levels: list[list[tuple[UnitElement, Fraction | int]]] = []
+    sign = 1  # -1 after '/' of the current level
+    signs: list[int] = []  # signs of the outer levels
+    opens: list[int] = []  # positions of '('
+    after_term = False  # the last token is an element or a group
+    for token in _TOKEN.finditer(symbol):
+        kind = token.lastgroup
+        sep = token.group('sep')
+        if sep:
+            if '/' in sep:
+                sign = -1
+            after_term = False
+        if kind == 'name' or kind == 'exp':
+            name = token.group('name')
+            if after_term:
+                raise UnitSymbolError(f"missing linker at position "
+                                      f"{token.start('name')} of '{symbol}'.")
+            after_term = True
+            try:
+                special = not name.isascii() or "'" in name or '"' in name
+                unit = UnitElement(name.translate(_SPECIAL_TABLE) if special
+                                   else name)
+            except UnitSymbolError:
+                raise UnitSymbolError(
+                    f"'{name}' at position {token.start('name')} of "
+                    f"'{symbol}' is not a valid element unit.") from None
+            e = sign if kind == 'name' else sign * _exponent(token.group('exp'))
+            if e:
+                pairs.append((unit, e))
+        elif kind == 'open':
+            if after_term:
+                raise UnitSymbolError(f"missing linker at position "
+                                      f"{token.start('open')} of '{symbol}'.")
+            levels.append(pairs)
+            signs.append(sign)
+            opens.append(token.start('open'))
+            pairs, sign = [], 1
+        elif kind == 'close' or kind == 'gexp':
+            if not opens:
+                raise UnitSymbolError(f"unmatched ')' at position "
+                                      f"{token.start('close')} of '{symbol}'.")
+            after_term = True
+            opens.pop()
+            group, pairs, sign = pairs, levels.pop(), signs.pop()
+            e = sign if kind == 'close' else \
+                sign * _exponent(token.group('gexp'))
+            if e:
+                pairs.extend((unit, x * e) for unit, x in group)
+        elif kind == 'error':
+            raise UnitSymbolError(f"unexpected {token.group('error')!r} at "
+                                  f"position {token.start('error')} of '{symbol}'.")
+    if opens:
+        raise UnitSymbolError(
+            f"unclosed '(' at position {opens[-1]} of '{symbol}'.")
+    return pairs
+
 
+def _exponent(text: str) -> Fraction | int:
+    '''convert the exponent str, like '2', '^-1', '⁻¹ᐟ²', to number.'''
+    text = text.lstrip('^').translate(_EXPONENT_TABLE)
+    return Fraction(text) if '/' in text else int(text)
 
-def _resolve(symbol: str, /) -> Compound[UnitElement]:
+
+def _resolve(symbol: str, /) -> FrozenCompound[UnitElement]:
     '''resolve the unit info from `str`, return elements of Unit.'''
-    elements: Compound[UnitElement] = Compound()
-    # convertion: for convience to deal with
-    symbol = _SPECIAL_PAT.sub(_formularize_unit, symbol)
-    # unite = unit(str) + exponent(str)
-    unites = [unite for unite in _UNIT_SEP.split(symbol) if unite]
-    # get exponent(str)
-    expo_match_gen = (_UNIT_EXPO.search(unite) for unite in unites)
-    expo = [1 if em is None else int(em.group()) for em in expo_match_gen]
-    for i, sep_match in enumerate(_UNIT_SEP.finditer(symbol)):
-        if '/' in sep_match.group():
-            neg_after(expo, i)  # you can use ElementWiseList
-            break
-    # remove exponent
-    unit_gen = (UnitElement(_REMOVE.sub('', unite)) for unite in unites)
-    for unit, e in zip(unit_gen, expo):
-        if e != 0:
-            elements[unit] += e  # merge the same units
-    return elements
-
-
-def _combine(elements: Compound[UnitElement]) -> str:
+    elements: dict[UnitElement, Fraction | int] = {}
+    for unit, e in _tokenize(symbol):
+        elements[unit] = elements.get(unit, 0) + e  # merge the same units
+    return FrozenCompound(elements)
+
+
+def _join(elements: FrozenCompound[UnitElement], attr: str) -> str:
+    numerator: list[str] = []
+    denominator: list[str] = []
+    for unit, e in elements.items():  # one pass for both signs
+        if e > 0:
+            numerator.append(getattr(unit, attr) + sup(e))
+        else:
+            denominator.append(getattr(unit, attr) + sup(-e))
+    if denominator:
+        return '·'.join(numerator) + '/' + '·'.join(denominator)
+    return '·'.join(numerator)
+
+
+def _combine(elements: FrozenCompound[UnitElement]) -> str:
     '''combine the info in the dict into a str representing the unit.'''
-    symbol = '·'.join(u.symbol + sup(e) for u, e in elements.pos_items())
-    if any(e < 0 for e in elements.values()):
-        symbol += '/' + \
-            '·'.join(u.symbol + sup(-e) for u, e in elements.neg_items())
-    return symbol
+    return _join(elements, 'symbol')
 
 
-def _combine_fullname(elements: Compound[UnitElement]) -> str:
+def _combine_fullname(elements: FrozenCompound[UnitElement]) -> str:
     '''combine the info in the dict into a str representing the unit.'''
-    symbol = '·'.join(u.fullname + sup(e) for u, e in elements.pos_items())
-    if any(e < 0 for e in elements.values()):
-        symbol += '/' + \
-            '·'.join(u.fullname + sup(-e) for u, e in elements.neg_items())
-    return symbol
+    return _join(elements, 'fullname')
 
 
-def _formularize_unit(matchobj: re.Match[str]) -> str:
-    return _SPECIAL_CHAR[matchobj.group()]
+def _factor(elements: FrozenCompound[UnitElement]) -> float:
+    '''the factor of a unit from its elements, the same however the unit
+    is built.'''
+    return float_product(u.factor**e for u, e in elements.items())
 
 
-def _unit_init(symbol: str) -> tuple[Compound[UnitElement], Dimension, float]:
+def _unit_init(symbol: str
+               ) -> tuple[FrozenCompound[UnitElement], Dimension, float]:
     '''used in `Unit.__init__(self, symbol)`'''
     elements = _resolve(symbol)
     dimension = Dimension.product(u.dimension**e for u, e in elements.items())
-    factor = float_product(u.factor**e for u, e in elements.items())
-    return elements, dimension, factor
+    return elements, dimension, _factor(elements)
@@ -7,7 +7,8 @@ from .value_archive import *
 __all__ = [
     '_PREFIX_DATA', '_PREFIX_FULLNAME',
     '_BASE_SI',
-    '_UNIT_DATA', '_UNIT_FULLNAME', '_UNIT_STD'
+    '_UNIT_DATA', '_UNIT_FULLNAME', '_UNIT_STD', '_UNIT_OFFSET',
+    '_PREFIX_ALIAS', '_UNIT_FULLNAME_ALIAS', '_build_element_index',
 ]
 
 _PREFIX_DATA: dict[str, PrefixData] = {
@@ -93,7 +94,7 @@ __UNIT_LIB: dict[Dimension, dict[str, BaseData]] = {
         'K': BaseData('kelvin', 1),
         '°C': BaseData('degree-Celsius', 1, never_prefix=True),
         '°F': BaseData('degree-Fahrenheit', 5/9, never_prefix=True),
-        '°R': BaseData('degree-Rankine', 1.8, never_prefix=True)
+        '°R': BaseData('degree-Rankine', 5/9, never_prefix=True)
     },
     DimensionConst.AMOUNT_OF_SUBSTANCE: {
         'mol': BaseData('mole', 1),
@@ -191,3 +192,40 @@ _UNIT_STD: dict[Dimension, str] = {
 }
 '''standard unit for dimension'''
 _UNIT_STD[DimensionConst.MASS] = 'kg'
+
+_UNIT_OFFSET: dict[str, float] = {
+    '°C': KELVIN_ZERO,
+    '°F': KELVIN_ZERO - 32 * 5/9,
+}
+'''zero point [K] of absolute temperature unit, K = factor * u + offset'''
+
+_PREFIX_ALIAS = {'u': 'µ', 'K': 'k'}
+_UNIT_FULLNAME_ALIAS = {'meter': 'metre', 'liter': 'litre'}
+
+
+def _build_element_index() -> dict[str, tuple[str, str]]:
+    '''index every valid unexponented element str to its (base, prefix).
+
+    When an element str can be read in multiple ways, the priority is:
+    unprefixed symbol > prefixed symbol (shorter prefix first) > 
+    unprefixed fullname > prefixed fullname (shorter prefix first).
+    Entries are inserted from the lowest priority, so that the higher 
+    priority overwrites.
+    '''
+    prefixes = {p: p for p in _PREFIX_DATA if p} | \
+        {alias: p for alias, p in _PREFIX_ALIAS.items()}
+    fullnames = _UNIT_FULLNAME | {alias: _UNIT_FULLNAME[name]
+                                  for alias, name in _UNIT_FULLNAME_ALIAS.items()}
+    prefixable = {base for base, data in _UNIT_DATA.items()
+                  if not data.never_prefix}  # including '', a single prefix
+    index: dict[str, tuple[str, str]] = {}
+    for fullname in sorted(filter(None, _PREFIX_FULLNAME), key=len, reverse=True):
+        prefix = _PREFIX_FULLNAME[fullname]
+        index.update((fullname + name, (base, prefix))
+                     for name, base in fullnames.items() if base in prefixable)
+    index.update((name, (base, '')) for name, base in fullnames.items())
+    for alias in sorted(prefixes, key=len, reverse=True):
+        prefix = prefixes[alias]
+        index.update((alias + base, (base, prefix)) for base in prefixable)
+    index.update((base, (base, '')) for base in _UNIT_DATA)
+    return index
@@ -0,0 +1,226 @@
+'''The unit registry (prefixes, units, standard units and the element
+index) is defined in `unit_archive`, whose construction builds hundreds
+of objects and a few thousand index entries at import.
+
+To cut the startup time, a frozen snapshot of the registry is written
+next to this file when the package is built (see `setup.py`), or by
+
+    python -m siunitpy.unit_registry [path]
+
+shipped as package data and loaded directly at import. The dimensions in
+the snapshot are interned, each distinct dimension is constructed only
+once.
+
+The snapshot records the size, mtime and checksum of the archive
+sources. At import they are compared by `os.stat`, a source is read and
+checksummed only when its mtime differs (e.g. in an installed package).
+Import never writes. If the snapshot is missing (e.g. a source checkout),
+broken, stale (an archive changed), or of another interpreter or format,
+the registry is built from `unit_archive` in memory as before.
+'''
+
+import marshal
+import os
+import sys
+import zlib
+from fractions import Fraction
+
+from .dimension import Dimension
+from .symboldata import BaseData, CompatibleUnit, PrefixData
+
+__all__ = [
+    '_PREFIX_DATA', '_PREFIX_FULLNAME',
+    '_BASE_SI',
+    '_UNIT_DATA', '_UNIT_FULLNAME', '_UNIT_STD', '_UNIT_OFFSET',
+    '_ELEMENT_INDEX',
+    'build_snapshot', 'compatible_units',
+]
+
+_HERE = os.path.dirname(__file__)
+_SNAPSHOT_PATH = os.path.join(_HERE, 'unit_registry.snapshot')
+_FORMAT = 3
+'''version of the snapshot layout, bump it when `_freeze` changes.'''
+_SOURCES = ('value_archive.py', 'unit_archive.py', 'symboldata.py')
+
+
+def _digest() -> tuple[int, ...]:
+    '''the interpreter version, for `marshal` format is version-specific,
+    and the snapshot layout.'''
+    return (*sys.version_info[:2], marshal.version, _FORMAT)
+
+
+def _checksum(path: str) -> int:
+    with open(path, 'rb') as file:
+        return zlib.crc32(file.read())
+
+
+def _source_stamps() -> tuple[tuple[int, int, int], ...]:
+    '''(size, mtime, checksum) of the archive sources.'''
+    stamps = []
+    for source in _SOURCES:
+        path = os.path.join(_HERE, source)
+        stat = os.stat(path)
+        stamps.append((stat.st_size, stat.st_mtime_ns, _checksum(path)))
+    return tuple(stamps)
+
+
+def _fresh(stamps) -> bool:
+    '''whether the archive sources are those the snapshot was built from.
+    Without the sources (e.g. a bytecode-only installation), the snapshot
+    is trusted.'''
+    if not isinstance(stamps, tuple) or len(stamps) != len(_SOURCES):
+        return False
+    for source, (size, mtime, checksum) in zip(_SOURCES, stamps):
+        path = os.path.join(_HERE, source)
+        try:
+            stat = os.stat(path)
+            if stat.st_size != size:
+                return False
+            if stat.st_mtime_ns != mtime and _checksum(path) != checksum:
+                return False
+        except OSError:
+            continue
+    return True
+
+
+def _freeze() -> dict:
+    '''build the registry from `unit_archive`, return it as plain data.'''
+    from . import unit_archive as archive
+    dimensions: dict[Dimension, int] = {}
+    pairs: dict[tuple[str, str], tuple[str, str]] = {}  # shared when dumped
+    def intern(dim: Dimension): return dimensions.setdefault(dim, len(dimensions))
+    units = [(symbol, data.fullname, data.factor,
+              intern(data.dimension), data.never_prefix)
+             for symbol, data in archive._UNIT_DATA.items()]
+    standards = [(intern(dim), symbol)
+                 for dim, symbol in archive._UNIT_STD.items()]
+    return {
+        'digest': _digest(),
+        'sources': _source_stamps(),
+        'dimensions': [tuple(x.as_integer_ratio() for x in dim)
+                       for dim in dimensions],
+        'prefixes': [(symbol, data.fullname, data.factor)
+                     for symbol, data in archive._PREFIX_DATA.items()],
+        'units': units,
+        'standards': standards,
+        'base_si': archive._BASE_SI,
+        'offsets': archive._UNIT_OFFSET,
+        'element_index': {element: pairs.setdefault(pair, pair) for element, pair
+                          in archive._build_element_index().items()},
+    }
+
+
+def _thaw(snapshot: dict):
+    '''construct the registry objects from the plain data.'''
+    dimensions = [Dimension(Fraction(*ratio) for ratio in vector)
+                  for vector in snapshot['dimensions']]
+    prefix_data = {symbol: PrefixData(fullname, factor)
+                   for symbol, fullname, factor in snapshot['prefixes']}
+    prefix_fullname = {v.fullname: k for k, v in prefix_data.items()}
+    unit_data = {
+        symbol: BaseData(fullname, factor, dimensions[dim],
+                         never_prefix=never_prefix)
+        for symbol, fullname, factor, dim, never_prefix in snapshot['units']
+    }
+    unit_fullname = {v.fullname: k for k, v in unit_data.items()}
+    unit_std = {dimensions[dim]: symbol
+                for dim, symbol in snapshot['standards']}
+    return (prefix_data, prefix_fullname, snapshot['base_si'], unit_data,
+            unit_fullname, unit_std, snapshot['offsets'],
+            snapshot['element_index'])
+
+
+def _load_snapshot(path: str = _SNAPSHOT_PATH) -> dict | None:
+    '''return the snapshot, or None if it is missing, broken, stale or of
+    another interpreter or format.'''
+    try:
+        with open(path, 'rb') as file:
+            snapshot = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(snapshot, dict) or \
+            snapshot.get('digest') != _digest() or \
+            not _fresh(snapshot.get('sources')):
+        return None
+    return snapshot
+
+
+def _write_snapshot(snapshot: dict, path: str = _SNAPSHOT_PATH) -> None:
+    '''write atomically, so a concurrent import never reads half a file.'''
+    temp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(temp, 'wb') as file:
+            marshal.dump(snapshot, file)
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def build_snapshot(path: str = _SNAPSHOT_PATH) -> str:
+    '''build the registry from `unit_archive` and write the snapshot.'''
+    _write_snapshot(_freeze(), path)
+    return path
+
+
+_snapshot = _load_snapshot()
+if _snapshot is None:
+    _snapshot = _freeze()  # in memory only
+
+_PREFIX_DATA, _PREFIX_FULLNAME, _BASE_SI, _UNIT_DATA, _UNIT_FULLNAME, \
+    _UNIT_STD, _UNIT_OFFSET, _ELEMENT_INDEX = _thaw(_snapshot)
+del _snapshot
+
+
+_COMPATIBLE_EXPONENT = (1, -1, 2, -2, 3, -3,
+                        *(Fraction(1, n) for n in (2, -2, 3, -3)))
+_DIMENSION_INDEX: dict[Dimension, tuple[str, ...]] | None = None
+'''{dimension: unit symbols (without prefix)}, in registry order.'''
+
+
+def _dimension_index() -> dict[Dimension, tuple[str, ...]]:
+    global _DIMENSION_INDEX
+    if _DIMENSION_INDEX is None:
+        index: dict[Dimension, list[str]] = {}
+        for symbol, data in _UNIT_DATA.items():
+            index.setdefault(data.dimension, []).append(symbol)
+        _DIMENSION_INDEX = {dim: tuple(symbols)  # publish when complete
+                            for dim, symbols in index.items()}
+    return _DIMENSION_INDEX
+
+
+def compatible_units(dimension: Dimension) -> tuple[CompatibleUnit, ...]:
+    '''all the registered units `u` and their prefixed variants, where
+    `dimension(u)**n == dimension` for n = ±1, ±2, ±3, ±1/2, ±1/3,
+    ordered by n, then the standard unit, the other unprefixed units
+    and the prefixed ones. Each unit is listed once, with its first n,
+    e.g. the dimensionless units have n = 1 only.
+    '''
+    index = _dimension_index()
+    units: list[CompatibleUnit] = []
+    seen: set[str] = set()
+    for n in _COMPATIBLE_EXPONENT:
+        # dimension(u) = dimension**(1/n)
+        root = dimension**int(1 / n) if type(n) is Fraction \
+            else dimension.nthroot(n)
+        bases = index.get(root, ())
+        standard = _UNIT_STD.get(root, '')
+        symbols = [standard] if standard else []
+        symbols.extend(base for base in bases if base != standard)
+        symbols.extend(prefix + base for base in bases
+                       if not _UNIT_DATA[base].never_prefix
+                       for prefix in _PREFIX_DATA if prefix
+                       and prefix + base != standard  # 'kg'
+                       and _ELEMENT_INDEX.get(prefix + base) == (base, prefix))
+        for symbol in symbols:
+            if symbol in seen:
+                continue
+            seen.add(symbol)
+            base, prefix = _ELEMENT_INDEX[symbol]
+            factor = _PREFIX_DATA[prefix].factor * _UNIT_DATA[base].factor
+            units.append(CompatibleUnit(symbol, n, factor**n))
+    return tuple(units)
+
+
+if __name__ == '__main__':
+    print(f'unit registry snapshot written to {build_snapshot(*sys.argv[1:2])}')
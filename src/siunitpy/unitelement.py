@@ -21,40 +21,15 @@ programmatic context, ensuring consistency and accuracy in scientific
 or engineering calculations.
 '''
 
-from .unit_archive import (_PREFIX_DATA, _PREFIX_FULLNAME, _UNIT_DATA,
-                           _UNIT_FULLNAME)
-
-_PREFIX_ALIAS = {'u': 'µ', 'K': 'k'}
-_PREFIX_MAXLEN = max(map(len, _PREFIX_DATA))
-_PREFIX_FULLNAME_MINLEN = min(filter(None, map(len, _PREFIX_FULLNAME)))
-_PREFIX_FULLNAME_MAXLEN = max(map(len, _PREFIX_FULLNAME))
-_UNIT_FULLNAME_ALIAS = {'miter': 'mitre', 'liter': 'litre'}
+from .unit_registry import _ELEMENT_INDEX, _PREFIX_DATA, _UNIT_DATA
 
 
 def _resolve_element(unit: str) -> tuple[str, str]:
     '''resolve a unexponented element unit str.'''
-    if unit in _UNIT_DATA:
-        return unit, ''
-    for prefix_len in range(1, _PREFIX_MAXLEN):
-        prefix, base = unit[:prefix_len], unit[prefix_len:]
-        if prefix in _PREFIX_ALIAS:
-            prefix = _PREFIX_ALIAS[prefix]
-        if prefix in _PREFIX_DATA and base in _UNIT_DATA:
-            if _UNIT_DATA[base].never_prefix:
-                continue
-            return base, prefix
-    # fullname case
-    if unit in _UNIT_FULLNAME:
-        return _UNIT_FULLNAME[unit], ''
-    for prefix_len in range(_PREFIX_FULLNAME_MINLEN, _PREFIX_FULLNAME_MAXLEN):
-        prefix, base = unit[:prefix_len], unit[prefix_len:]
-        if base in _UNIT_FULLNAME_ALIAS:
-            base = _UNIT_FULLNAME_ALIAS[base]
-        if prefix in _PREFIX_FULLNAME and base in _UNIT_FULLNAME:
-            if _UNIT_DATA[_UNIT_FULLNAME[base]].never_prefix:
-                continue
-            return _UNIT_FULLNAME[base], _PREFIX_FULLNAME[prefix]
-    raise UnitSymbolError(f"'{unit}' is not a valid element unit.")
+    try:
+        return _ELEMENT_INDEX[unit]
+    except KeyError:
+        raise UnitSymbolError(f"'{unit}' is not a valid element unit.") from None
 
 
 class UnitElement:
@@ -67,63 +42,91 @@ class UnitElement:
     The `base` represents the core unit, while the `prefix` serves as a 
     multiplier that modifies the magnitude of the base unit. Together, 
     they define the complete unit and its scale.
+
+    `UnitElement` objects are interned, the same element is always the 
+    same object, with its symbol, factor and dimension precomputed.
     '''
-    __slots__ = ('_base', '_prefix')
+    __slots__ = ('_base', '_prefix', '_symbol', '_fullname', '_factor',
+                 '_prefix_factor', '_dimension', '_order')
 
     def __new__(cls, base: str, prefix: str | None = None):
-        if isinstance(prefix, str):
-            self = super().__new__(cls)
-            self._base, self._prefix = base, prefix  # internal use only
-        elif base in _UNITELEMENT_BASE:
-            self = _UNITELEMENT_BASE[base]  # singleton
-        else:
-            self = super().__new__(cls)
-            self._base, self._prefix = _resolve_element(base)
+        if prefix is None:
+            self = _INTERNED_SYMBOL.get(base)
+            if self is None:
+                self = _INTERNED_SYMBOL.setdefault(
+                    base, cls(*_resolve_element(base)))
+            return self
+        self = _INTERNED.get((base, prefix))
+        if self is None:
+            self = _INTERNED.setdefault((base, prefix),
+                                        cls.__build(base, prefix))
+        return self
+
+    @classmethod
+    def __build(cls, base: str, prefix: str):
+        self = super().__new__(cls)
+        base_data, prefix_data = _UNIT_DATA[base], _PREFIX_DATA[prefix]
+        self._base, self._prefix = base, prefix
+        self._symbol = prefix + base
+        self._fullname = prefix_data.fullname + base_data.fullname
+        self._prefix_factor = prefix_data.factor
+        self._factor = prefix_data.factor * base_data.factor
+        self._dimension = base_data.dimension
+        # canonical order: dimension vector, prefix factor, base
+        self._order = (tuple(map(float, base_data.dimension)),
+                       prefix_data.factor, base, prefix)
         return self
 
+    def __reduce__(self): return self.__class__, (self._base, self._prefix)
+
+    def __copy__(self): return self
+
+    def __deepcopy__(self, memo): return self
+
     @property
     def base(self) -> str: return self._base
     @property
     def prefix(self) -> str: return self._prefix
     @property
-    def symbol(self) -> str: return self.prefix + self.base
+    def symbol(self) -> str: return self._symbol
     @property
     def prefix_fullname(self) -> str: return _PREFIX_DATA[self.prefix].fullname
     @property
     def base_fullname(self) -> str: return _UNIT_DATA[self.base].fullname
     @property
-    def fullname(self) -> str: return self.prefix_fullname + self.base_fullname
+    def fullname(self) -> str: return self._fullname
     @property
-    def prefix_factor(self) -> float: return _PREFIX_DATA[self.prefix].factor
+    def prefix_factor(self) -> float: return self._prefix_factor
     @property
     def base_factor(self) -> float: return _UNIT_DATA[self.base].factor
     @property
-    def factor(self) -> float: return self.prefix_factor * self.base_factor
+    def factor(self) -> float: return self._factor
     @property
-    def dimension(self): return _UNIT_DATA[self.base].dimension
+    def dimension(self): return self._dimension
 
     def deprefix(self): return UnitElement(self.base, '')
 
     def __str__(self) -> str: return self.symbol
 
     def __repr__(self) -> str:
-        return '{}({}-{})'.format(self.prefix, self.base)
+        cls = self.__class__.__name__
+        return f'{cls}({self.prefix}-{self.base})'
 
-    def __hash__(self) -> int: return hash((self.prefix, self.base))
+    # interned, equal elements are the same object
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
 
-    def __eq__(self, other: 'UnitElement') -> bool:
-        return self.symbol == other.symbol
+    def __lt__(self, other: 'UnitElement') -> bool:
+        return self._order < other._order
 
     def __le__(self, other: 'UnitElement') -> bool:
-        # TODO: the order of unit-element
-        if self.prefix_factor == other.prefix_factor:
-            if self.dimension == other.dimension:
-                return self.base < other.base
-            return self.dimension.astuple() < other.dimension.astuple()
-        return self.prefix_factor < other.prefix_factor
+        return self._order <= other._order
 
 
-_UNITELEMENT_BASE = {
+# Every resolved element is interned, by (base, prefix) and by the str
+# it is resolved from. Both are bounded by the registry, so plain dicts.
+_INTERNED: dict[tuple[str, str], UnitElement] = {}
+_INTERNED_SYMBOL: dict[str, UnitElement] = {
     base: UnitElement(base, '') for base in _UNIT_DATA
 }
 
@@ -1,5 +1,6 @@
 from . import abc
-from .compound import Compound
+from .compound import Compound, FrozenCompound
 from .continuedfraction import ContinuedFraction
 from .elementwiselist import ElementWiseList
 from .interval import Interval
+from .lrucache import LRUCache
@@ -1,3 +1,4 @@
+import operator
 from fractions import Fraction
 from itertools import chain
 from typing import Generator, Generic, Iterable, Iterator, TypeVar
@@ -5,7 +6,7 @@ from typing import Generator, Generic, Iterable, Iterator, TypeVar
 from .utils import Number, _inplace
 from .utils import common_rational as frac
 
-__all__ = ['Compound']
+__all__ = ['Compound', 'FrozenCompound']
 
 K = TypeVar('K')
 _ZERO = Fraction(0)
@@ -99,3 +100,148 @@ class Compound(Generic[K]):
     __imul__ = _inplace(__mul__)
     __itruediv__ = _inplace(__truediv__)
     __rmul__ = __mul__
+
+
+def _exponent(value) -> int | Fraction:
+    '''int if the value is an integer, else Fraction.'''
+    if type(value) is int:
+        return value
+    if not isinstance(value, Fraction):
+        value = frac(value)
+    return value.numerator if value.denominator == 1 else value
+
+
+def _merged(items, other_items, op) -> tuple:
+    '''items of `op(items, other_items)` elementwise, zeros removed,
+    both are sorted by key and merged in one pass.'''
+    merged = []
+    i = j = 0
+    n, m = len(items), len(other_items)
+    while i < n and j < m:
+        k, v = items[i]
+        other_k, other_v = other_items[j]
+        if k == other_k:
+            v = op(v, other_v)
+            if v:
+                merged.append((k, _exponent(v)))
+            i += 1
+            j += 1
+        elif k < other_k:
+            merged.append(items[i])
+            i += 1
+        else:
+            merged.append((other_k, op(0, other_v)))
+            j += 1
+    merged.extend(items[i:])
+    merged.extend((k, op(0, v)) for k, v in other_items[j:])
+    return tuple(merged)
+
+
+class FrozenCompound(Generic[K]):
+    __slots__ = ('_items', '_hash')
+
+    def __init__(self, elements: dict[K, Number] | Iterable[tuple[K, Number]]
+                 = (), /):
+        if isinstance(elements, (Compound, FrozenCompound)):
+            elements = elements.items()
+        elif not isinstance(elements, Iterable):
+            raise TypeError(f"{type(elements) = } is not 'Iterable'.")
+        if not isinstance(elements, dict):
+            elements = dict(elements)  # the last value of a key is kept
+        # keys in the canonical (sorted) order
+        self._items: tuple[tuple[K, int | Fraction], ...] = tuple(
+            (k, _exponent(elements[k])) for k in sorted(elements)
+            if elements[k])
+        self._hash = None
+
+    @classmethod
+    def _fromitems(cls, items: tuple):
+        '''construct from normalized items without check, internal use.'''
+        self = cls.__new__(cls)
+        self._items = items
+        self._hash = None
+        return self
+
+    def __contains__(self, key: K) -> bool:
+        return any(k == key for k, _ in self._items)
+
+    def __getitem__(self, key: K) -> int | Fraction:
+        for k, v in self._items:
+            if k == key:
+                return v
+        return 0
+
+    def __iter__(self) -> Iterator[K]: return (k for k, _ in self._items)
+
+    def __repr__(self) -> str:
+        mid = ', '.join(f'{repr(k)}: {v}' for k, v in self._items)
+        return '{' + mid + '}'
+
+    def __str__(self) -> str:
+        mid = ', '.join(f'{k}: {v}' for k, v in self._items)
+        return '{' + mid + '}'
+
+    def __len__(self) -> int: return len(self._items)
+
+    def __bool__(self) -> bool: return bool(self._items)
+
+    def copy(self): return self  # immutable
+
+    def keys(self): return tuple(k for k, _ in self._items)
+
+    def values(self): return tuple(v for _, v in self._items)
+
+    def items(self): return self._items
+
+    def pos_items(self):
+        '''filter items whose value > 0.'''
+        return filter(lambda item: item[1] > 0, self._items)
+
+    def neg_items(self):
+        '''filter items whose value < 0.'''
+        return filter(lambda item: item[1] < 0, self._items)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._items)
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenCompound):
+            return self._items == other._items
+        if isinstance(other, Compound):
+            return dict(self._items) == other._elements
+        return NotImplemented
+
+    def __pos__(self): return self
+
+    def __neg__(self):
+        return self._fromitems(tuple((k, -v) for k, v in self._items))
+
+    def __add__(self, other: 'FrozenCompound'):
+        if not other._items:
+            return self
+        if not self._items:
+            return other
+        return self._fromitems(_merged(self._items, other._items, operator.add))
+
+    def __sub__(self, other: 'FrozenCompound'):
+        if not other._items:
+            return self
+        return self._fromitems(_merged(self._items, other._items, operator.sub))
+
+    def __mul__(self, other):
+        if other == 1:
+            return self
+        if other == 0:
+            return self._fromitems(())
+        return self._fromitems(tuple((k, _exponent(v * other))
+                                     for k, v in self._items))
+
+    def __truediv__(self, other):
+        if other == 1:
+            return self
+        return self._fromitems(tuple((k, _exponent(frac(v) / other))
+                                     for k, v in self._items))
+
+    __rmul__ = __mul__
@@ -94,3 +94,48 @@ class Compound(Generic[K]):
     def __imul__(self, other: int | Fraction) -> Self: ...
     def __itruediv__(self, other: int | Fraction) -> Self: ...
     def __rmul__(self, other: int | Fraction) -> Self: ...
+
+
+class FrozenCompound(Generic[K]):
+    '''`FrozenCompound` is the immutable and hashable `Compound`, stored
+    as a tuple of `(key, value)` pairs, used as the elements of units.
+
+    values are kept as `int` if they are integers, `Fraction` otherwise:
+    >>> FrozenCompound({'a': 0, 'b': Fraction(2), 'c': 0.5})
+    {'b': 2, 'c': 1/2}
+
+    operations return new objects (or the operand itself if unchanged), 
+    add/sub merge two sorted compounds in one pass:
+    >>> FrozenCompound({'b': 1, 'c': 2}) + FrozenCompound({'c': -2, 'd': 3})
+    {'b': 1, 'd': 3}
+
+    keys are kept sorted (so they must be comparable), equal compounds 
+    have the same items in the same order.
+    '''
+    @overload
+    def __init__(self) -> None: ...
+    @overload
+    def __init__(self, iterable: Iterable[tuple[K, Number]], /) -> None: ...
+    @overload
+    def __init__(self, elements: dict[K, Number], /) -> None: ...
+    def __contains__(self, key: K) -> bool: ...
+    def __getitem__(self, key: K) -> int | Fraction: ...
+    def __iter__(self) -> Iterator[K]: ...
+    def __str__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __bool__(self) -> bool: ...
+    def copy(self) -> Self: ...
+    def keys(self) -> tuple[K, ...]: ...
+    def values(self) -> tuple[int | Fraction, ...]: ...
+    def items(self) -> tuple[tuple[K, int | Fraction], ...]: ...
+    def pos_items(self) -> filter[tuple[K, int | Fraction]]: ...
+    def neg_items(self) -> filter[tuple[K, int | Fraction]]: ...
+    def __hash__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __pos__(self) -> Self: ...
+    def __neg__(self) -> Self: ...
+    def __add__(self, other: FrozenCompound[K]) -> Self: ...
+    def __sub__(self, other: FrozenCompound[K]) -> Self: ...
+    def __mul__(self, other: int | Fraction) -> Self: ...
+    def __truediv__(self, other: int | Fraction) -> Self: ...
+    def __rmul__(self, other: int | Fraction) -> Self: ...
@@ -2,10 +2,50 @@
 It's similar to Enum, but members of Enum need an extra value attribute
 to access its value, and I think it's unnecessary. 
 So I build myEnum myself.
+
+Members expensive to build can be declared `lazy`, they are evaluated
+on first access and then stored as ordinary members:
+>>> class Const(ConstClass):
+...     a = lazy(float, '1.5')
+...     b = lazy(lambda: Const.a * 2)
 '''
 
+from threading import RLock
+
+__all__ = ['ConstMeta', 'ConstClass', 'lazy']
+
+
+class lazy:
+    '''a lazy member of ConstClass, `factory(*args, **kwargs)` is called once on
+    first access, then the result replaces the member.
+    '''
+    __slots__ = ('factory', 'args', 'kwargs', 'name', 'owner', 'lock')
 
-__all__ = ['ConstMeta', 'ConstClass']
+    def __init__(self, factory, *args, **kwargs):
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+        self.name = self.owner = None
+        self.lock = RLock()
+
+    def __set_name__(self, owner, name):
+        if self.name is None:  # the first one of `a = b = lazy(...)`
+            self.name, self.owner = name, owner
+
+    def __get__(self, instance, owner=None):
+        with self.lock:
+            # another thread may have finished it while we wait
+            value = self.owner.__dict__[self.name]
+            if value is not self:
+                return value
+            value = self.factory(*self.args, **self.kwargs)
+            for name, member in tuple(self.owner.__dict__.items()):
+                if member is self:  # aliases
+                    type.__setattr__(self.owner, name, value)
+            return value
+
+    def __repr__(self) -> str:
+        return f'<lazy member {self.name!r}>'
 
 
 class ConstMeta(type):
@@ -24,6 +64,12 @@ class ConstMeta(type):
     def __delattr__(self, name):
         raise AttributeError("Cannot delete Const member.")
 
+    def evaluate(self) -> None:
+        '''evaluate all the lazy members.'''
+        for name, member in tuple(vars(self).items()):
+            if isinstance(member, lazy):
+                getattr(self, name)
+
 
 class ConstClass(metaclass=ConstMeta):
     pass 
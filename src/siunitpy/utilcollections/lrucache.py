@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+__all__ = ['LRUCache', 'CacheInfo']
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    '''A bounded, thread-safe, least-recently-used mapping.
+
+    Unlike `functools.lru_cache`, entries can be inspected and evicted
+    one by one, and the cache is not bound to a single function:
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.get_or_create('a', str.upper)  # miss, 'A'
+    >>> cache.get_or_create('a', str.upper)  # hit, 'A'
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    `maxsize=None` means unbounded.
+    '''
+    __slots__ = ('_data', '_maxsize', '_hits', '_misses', '_lock')
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must be non-negative or None.')
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = self._misses = 0
+        self._lock = RLock()
+
+    @property
+    def maxsize(self) -> int | None: return self._maxsize
+
+    def __len__(self) -> int: return len(self._data)
+
+    def __contains__(self, key: K) -> bool: return key in self._data
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        '''return the cached value (and mark it recently used),
+        count a hit or a miss.'''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def setdefault(self, key: K, value: V) -> V:
+        '''insert `value` if `key` is absent, return the cached value,
+        so that concurrent creators all end up sharing one object.'''
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+            if self._maxsize == 0:
+                return value
+            self._data[key] = value
+            if self._maxsize is not None and len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+            return value
+
+    def get_or_create(self, key: K, factory: Callable[[K], V]) -> V:
+        '''return the cached value, or create it by `factory(key)`.
+
+        `factory` runs outside the lock, so a slow factory does not block
+        the other threads, and an exception leaves the cache untouched.
+        '''
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.setdefault(key, factory(key))
+        return value  # type: ignore
+
+    def evict(self, key: K) -> bool:
+        '''remove `key` from the cache, return whether it was present.'''
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses,
+                             self._maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        '''remove all the entries and reset the statistics.'''
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+
+_MISSING = object()
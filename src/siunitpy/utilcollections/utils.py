@@ -1,5 +1,6 @@
 from decimal import Decimal
 from fractions import Fraction
+from functools import lru_cache
 from typing import Callable, Iterable, TypeVar, overload
 
 __all__ = [
@@ -21,9 +22,11 @@ _SUPERSCRIPT = '⁰¹²³⁴⁵⁶⁷⁸⁹'
 _SUBSCRIPT = '₀₁₂₃₄₅₆₇₈₉'
 
 
+@lru_cache(maxsize=1024)
 def superscript(ratio: Fraction | int) -> str:
     '''turn a number (Fraction/int) into superscript, 
-    like 2 -> ², -1 -> ⁻¹, 3/4 -> ³ᐟ⁴, etc.'''
+    like 2 -> ², -1 -> ⁻¹, 3/4 -> ³ᐟ⁴, etc. 
+    The string is cached per exponent.'''
     if ratio.numerator < 0:
         return '⁻¹' if ratio == -1 else '⁻' + superscript(-ratio)
     if ratio == 1:
@@ -1,17 +1,24 @@
+import itertools
 import operator
+from collections import defaultdict
 from copy import copy
 from typing import Any, Callable, Generic, Iterable, TypeVar
 
 try:
-    from numpy import log
+    from numpy import absolute, arange, array, broadcast_arrays, \
+        broadcast_shapes, empty_like, errstate, hypot, ix_, log, multiply, \
+        ndarray
+    from numpy import shape as np_shape
+    from numpy import sqrt, zeros
 except ImportError:
     from math import log
+    ndarray = ()  # isinstance(value, ()) is always False
 
 from .identity import Zero, zero
 from .utilcollections import Interval
 from .utilcollections.abc import Cardinal, Linear
 
-__all__ = ['Variable']
+__all__ = ['Variable', 'covariance_matrix', 'correlation_matrix']
 
 T = TypeVar('T', bound=Linear)
 
@@ -39,6 +46,69 @@ def iszero(value: Any, precision: Any = 0) -> bool:
 def _hypotenuse(a, b): return (a**2 + b**2)**0.5
 
 
+def _inplace_ready(variable: 'Variable') -> bool:
+    '''whether the uncertainty is a writable float array of the shape of
+    the value, so in-place operations can write into it.'''
+    uncertainty = variable._uncertainty
+    return isinstance(uncertainty, ndarray) and \
+        uncertainty.shape == getattr(variable._value, 'shape', None) and \
+        uncertainty.dtype.kind == 'f' and uncertainty.flags.writeable
+
+
+_INPUT_IDS = itertools.count()
+'''IDs of the independent inputs of the correlated mode.'''
+
+
+def _tracked(x) -> bool:
+    '''whether x is a Variable in the correlated mode.'''
+    return isinstance(x, Variable) and x._gradient is not None
+
+
+def _value(x): return x._value if isinstance(x, Variable) else x
+
+
+def _own(x):
+    '''a copy of an array, other values are immutable.'''
+    return x.copy() if isinstance(x, ndarray) else x
+
+
+def _gradient(x) -> dict:
+    '''the gradient of x, `{input ID: derivative * input uncertainty}`.
+    An uncertain variable out of the correlated mode is an independent
+    input, its ID is assigned once, so reusing it correlates.'''
+    if not isinstance(x, Variable):
+        return {}
+    if x._gradient is not None:
+        return x._gradient
+    if x._uncertainty is zero:
+        return {}
+    if x._id is None:
+        x._id = next(_INPUT_IDS)
+    # a copy, the in-place operations of x write into its uncertainty
+    return {x._id: copy(x.uncertainty)}
+
+
+def _linear(*terms: tuple[Any, dict]) -> dict:
+    '''the gradient `sum(k * gradient for k, gradient in terms)`.'''
+    terms = sorted(terms, key=lambda term: -len(term[1]))
+    k, gradient = terms[0]  # the largest is copied in C when k is 1
+    result = dict(gradient) if isinstance(k, int) and k == 1 else \
+        {i: k * c for i, c in gradient.items()}
+    for k, gradient in terms[1:]:
+        for i, c in gradient.items():
+            c = k * c
+            result[i] = result[i] + c if i in result else c
+    return result
+
+
+def _accumulate(target: dict, k, gradient: dict) -> None:
+    '''target += k * gradient, in place, O(len(gradient)).'''
+    for i, c in gradient.items():
+        if not (isinstance(k, int) and k == 1):
+            c = k * c
+        target[i] = target[i] + c if i in target else c
+
+
 def _comparison(op: Callable[[T, T], bool]):
     def __op(self: 'Variable', other):
         if not isinstance(other, Variable):
@@ -49,28 +119,68 @@ def _comparison(op: Callable[[T, T], bool]):
 
 def _unary(op: Callable):
     def __op(self: 'Variable'):
+        if self._gradient is not None:
+            return Variable._fromgradient(
+                op(self._value),
+                {i: op(c) for i, c in self._gradient.items()})
+        if self._uncertainty is zero:
+            return Variable._exact(op(self._value))
         return Variable(op(self.value), self.uncertainty)
     return __op
 
 
 def _addsub(op: Callable, iop: Callable):
     '''operator: a + b, a - b.'''
+    sign = 1 if op is operator.add else -1
+
+    def __tracked(a, b) -> 'Variable':
+        return Variable._fromgradient(
+            op(_value(a), _value(b)),
+            _linear((1, _gradient(a)), (sign, _gradient(b))))
 
     def __op(self: 'Variable', other: 'Variable'):
+        if self._gradient is not None or _tracked(other):
+            return __tracked(self, other)
         if not isinstance(other, Variable):
+            if self._uncertainty is zero:
+                return Variable._exact(op(self._value, other))
             return Variable(op(self.value, other), self.uncertainty)
+        if other._uncertainty is zero:
+            return __op(self, other._value)
+        if self._uncertainty is zero:
+            return Variable(op(self._value, other._value), other.uncertainty)
         return Variable(op(self.value, other.value),
                         _hypotenuse(self.uncertainty, other.uncertainty))
 
     def __iop(self: 'Variable', other: 'Variable'):
+        if self._gradient is not None:
+            # the gradient is owned, update it instead of copying
+            self._value = iop(self._value, _value(other))
+            _accumulate(self._gradient, sign, _gradient(other))
+            return self._gradient_changed()
+        if _tracked(other):
+            return self._become(__tracked(self, other))
+        self._keep_absolute()
+        self._id = None
         if not isinstance(other, Variable):
             self._value = iop(self.value, other)
             return self
         self._value = iop(self.value, other.value)
-        self._uncertainty = _hypotenuse(self.uncertainty, other.uncertainty)
+        if other._uncertainty is zero:
+            return self
+        if _inplace_ready(self):
+            hypot(self._uncertainty, other.uncertainty,
+                  out=self._uncertainty)
+        else:
+            self.uncertainty = _hypotenuse(self.uncertainty,
+                                           other.uncertainty)
         return self
     
     def __rop(self: 'Variable', other):
+        if self._gradient is not None:
+            return __tracked(other, self)
+        if self._uncertainty is zero:
+            return Variable._exact(op(other, self._value))
         return Variable(op(other, self.value), self.uncertainty)
 
     return __op, __iop, __rop
@@ -78,61 +188,256 @@ def _addsub(op: Callable, iop: Callable):
 
 def _muldiv(op: Callable, iop: Callable):
     '''operator: a * b, a / b.'''
+    # exact and in-place paths of elementwise operations, not for a @ b
+    elementwise = op is operator.mul or op is operator.truediv
+
+    def __tracked(a, b) -> 'Variable':
+        '''d(ab) = b da + a db, d(a/b) = (da - (a/b) db) / b.'''
+        va, vb = _value(a), _value(b)
+        if op is operator.mul:
+            return Variable._fromgradient(
+                va * vb, _linear((vb, _gradient(a)), (va, _gradient(b))))
+        if op is operator.truediv:
+            value = va / vb
+            return Variable._fromgradient(
+                value, _linear((1 / vb, _gradient(a)),
+                               (-value / vb, _gradient(b))))
+        raise TypeError('the correlated mode is elementwise, '
+                        f'{op.__name__} is not supported.')
 
     def __op(self: 'Variable', other: 'Variable'):
+        if self._gradient is not None or _tracked(other):
+            return __tracked(self, other)
         if not isinstance(other, Variable):
+            if self._uncertainty is zero:
+                return Variable._exact(op(self._value, other))
+            if elementwise and self._uncertainty is None:
+                # scaling keeps the relative uncertainty
+                return Variable._fromrelative(op(self._value, other),
+                                              self._relative)
             return Variable(op(self.value, other), op(self.uncertainty, other))
+        if elementwise and other._uncertainty is zero:
+            return __op(self, other._value)
+        if self._uncertainty is zero:
+            return Variable._fromrelative(op(self._value, other._value),
+                                          other.relative_uncertainty)
         r = _hypotenuse(self.relative_uncertainty, other.relative_uncertainty)
-        return Variable(op(self.value, other.value), relative_uncertainty=r)
+        return Variable._fromrelative(op(self.value, other.value), r)
 
     def __iop(self: 'Variable', other: 'Variable'):
-        if not isinstance(other, Variable):
+        if elementwise and self._gradient is not None and \
+                _gradient(other) is not self._gradient:
+            __iop_tracked(self, other)
+            return self._gradient_changed()
+        if self._gradient is not None or _tracked(other):
+            return self._become(__tracked(self, other))
+        self._id = None
+        if not isinstance(other, Variable) or other._uncertainty is zero:
+            if isinstance(other, Variable):
+                other = other._value
+            if not elementwise:
+                self._keep_absolute()
             self._value = iop(self.value, other)
-            self._uncertainty = op(self.uncertainty, abs(other))
+            if self._uncertainty is zero or self._uncertainty is None:
+                return self  # the relative uncertainty is kept
+            if elementwise and _inplace_ready(self):
+                # |u * b| = |u| * |b| for u >= 0, no abs(b) temporary
+                iop(self._uncertainty, other)
+                absolute(self._uncertainty, out=self._uncertainty)
+            else:
+                self._uncertainty = op(self._uncertainty, abs(other))
+            return self
+        if elementwise and _inplace_ready(self):
+            __iop_inplace(self, other)
+            self._relative = None
             return self
+        r = _hypotenuse(self.relative_uncertainty, other.relative_uncertainty)
         self._value = iop(self.value, other.value)
-        self.relative_uncertainty = \
-            _hypotenuse(self.relative_uncertainty, other.relative_uncertainty)
+        self._uncertainty, self._relative = None, r
         return self
 
+    def __iop_tracked(self: 'Variable', other: 'Variable'):
+        '''the owned gradient is scaled and updated in place.'''
+        gradient, va, vb = self._gradient, self._value, _value(other)
+        if op is operator.mul:
+            scale, value = vb, va * vb
+            k = va
+        else:
+            scale, value = 1 / vb, va / vb
+            k = -value / vb
+        for i, c in gradient.items():
+            gradient[i] = scale * c
+        _accumulate(gradient, k, _gradient(other))
+        self._value = value
+
+    def __iop_inplace(self: 'Variable', other: 'Variable'):
+        '''u(a*b) = hypot(u(a)|b|, u(b)|a|),
+        u(a/b) = hypot(u(a), u(b)|a/b|) / |b|,
+        computed in the uncertainty of self and one scratch buffer, which
+        is freed when the operation returns.'''
+        uncertainty, other_uncertainty = self._uncertainty, other.uncertainty
+        scratch = empty_like(uncertainty)
+        if op is operator.mul:
+            multiply(other_uncertainty, self._value, out=scratch)
+            iop(uncertainty, other._value)
+            self._value = iop(self._value, other._value)
+        else:
+            self._value = iop(self._value, other._value)
+            multiply(other_uncertainty, self._value, out=scratch)
+        absolute(scratch, out=scratch)
+        absolute(uncertainty, out=uncertainty)
+        hypot(uncertainty, scratch, out=uncertainty)
+        if op is not operator.mul:
+            iop(uncertainty, other._value)
+            absolute(uncertainty, out=uncertainty)
+
     def __rop(self: 'Variable', other):
         '''when other is not a `Variable` object.'''
-        return Variable(op(other, self.value),
-                        relative_uncertainty=self.relative_uncertainty)
+        if self._gradient is not None:
+            return __tracked(other, self)
+        if self._uncertainty is zero:
+            return Variable._exact(op(other, self._value))
+        return Variable._fromrelative(op(other, self.value),
+                                      self.relative_uncertainty)
 
     return __op, __iop, __rop
 
 
 class Variable(Generic[T]):
-    __slots__ = ("_value", "_uncertainty")
+    # the absolute and the relative uncertainty are cached lazily, None if
+    # stale, at least one of them or the gradient is valid, both are `zero`
+    # when exact. `_gradient` is None out of the correlated mode, `_id` is
+    # the input ID.
+    __slots__ = ("_value", "_uncertainty", "_relative", "_gradient", "_id")
 
     def __init__(self, value: T, /, uncertainty: T | Zero = zero, *,
                  relative_uncertainty: T | Zero = zero) -> None:
         self._value = value
+        self._gradient = self._id = None
         if uncertainty is not zero:
             self.uncertainty = uncertainty
-        else:
+        elif relative_uncertainty is not zero:
             self.relative_uncertainty = relative_uncertainty
+        else:
+            self._uncertainty = self._relative = zero
+
+    @classmethod
+    def _exact(cls, value: T) -> 'Variable[T]':
+        '''an exact variable, without going through `__init__`.'''
+        self = cls.__new__(cls)
+        self._value = value
+        self._uncertainty = self._relative = zero
+        self._gradient = self._id = None
+        return self
+
+    @classmethod
+    def _fromrelative(cls, value: T, relative: T) -> 'Variable[T]':
+        '''a variable of a non-negative relative uncertainty, the absolute
+        uncertainty is computed when it is read.'''
+        self = cls.__new__(cls)
+        self._value = value
+        self._uncertainty, self._relative = None, relative
+        self._gradient = self._id = None
+        return self
+
+    @classmethod
+    def _fromgradient(cls, value: T, gradient: dict) -> 'Variable[T]':
+        '''a variable in the correlated mode, the uncertainty is the norm
+        of the gradient.'''
+        self = cls.__new__(cls)
+        self._value = value
+        self._gradient, self._id = gradient, None
+        if gradient:  # the uncertainty is computed when it is read
+            self._uncertainty = self._relative = None
+        else:
+            self._uncertainty = self._relative = zero
+        return self
+
+    def _gradient_changed(self) -> 'Variable[T]':
+        '''after the gradient is updated in place.'''
+        if self._gradient:
+            self._uncertainty = self._relative = None
+        else:
+            self._uncertainty = self._relative = zero
+        self._id = None
+        return self
+
+    def __copy__(self) -> 'Variable[T]':
+        '''a shallow copy, except that the arrays and the gradient are not
+        shared, since in-place operations write into them.'''
+        new = self.__class__.__new__(self.__class__)
+        new._value, new._uncertainty, new._relative = \
+            _own(self._value), _own(self._uncertainty), _own(self._relative)
+        new._id = self._id
+        new._gradient = None if self._gradient is None else \
+            dict(self._gradient)
+        return new
+
+    def _become(self, other: 'Variable[T]') -> 'Variable[T]':
+        '''in-place operations of the correlated mode.'''
+        self._value, self._uncertainty, self._relative = \
+            other._value, other._uncertainty, other._relative
+        self._gradient, self._id = other._gradient, None
+        return self
+
+    def _new_input(self) -> None:
+        '''after the uncertainty is set, the variable is a new input.'''
+        self._id = None
+        if self._gradient is not None:
+            self._gradient = {} if self._uncertainty is zero else \
+                {next(_INPUT_IDS): self.uncertainty}
+
+    def correlated(self) -> 'Variable[T]':
+        if self._gradient is not None:
+            return self
+        return Variable._fromgradient(copy(self._value), _gradient(self))
+
+    def iscorrelated(self) -> bool: return self._gradient is not None
+
+    def _keep_absolute(self) -> None:
+        '''before the value changes with the absolute uncertainty kept.'''
+        if self.uncertainty is not zero:
+            self._relative = None
 
     @property
     def value(self) -> T: return self._value
+
     @value.setter
-    def value(self, value: T) -> None: self._value = value
+    def value(self, value: T) -> None:
+        self._keep_absolute()
+        self._value = value
+        self._id = None
 
     @property
-    def uncertainty(self) -> T | Zero: return self._uncertainty
+    def uncertainty(self) -> T | Zero:
+        if self._uncertainty is None:
+            if self._relative is None:  # the norm of the gradient
+                self._uncertainty = sum(
+                    c * c for c in self._gradient.values())**0.5
+            else:
+                self._uncertainty = abs(self._relative * self._value)
+        return self._uncertainty
 
     @uncertainty.setter
     def uncertainty(self, uncertainty: T | Zero) -> None:
         self._uncertainty = abs(move(uncertainty))
+        self._relative = zero if self._uncertainty is zero else None
+        self._new_input()
 
     @property
     def relative_uncertainty(self) -> T | Zero:
-        return self._uncertainty / abs(self.value)
+        if self._relative is None:
+            self._relative = self.uncertainty / abs(self._value)
+        return self._relative
 
     @relative_uncertainty.setter
     def relative_uncertainty(self, relative_uncertainty: T | Zero) -> None:
-        self._uncertainty = abs(move(relative_uncertainty) * self.value)
+        relative_uncertainty = abs(move(relative_uncertainty))
+        if relative_uncertainty is zero:
+            self._uncertainty = self._relative = zero
+        else:
+            self._uncertainty, self._relative = None, relative_uncertainty
+        self._new_input()
 
     @property
     def confidence_interval(self) -> Interval[T]:
@@ -158,13 +463,22 @@ class Variable(Generic[T]):
         return f'{self.value:{format_spec}} ± {self.uncertainty:{format_spec}}'
 
     def isexact(self, precision=zero) -> bool:
+        if self._uncertainty is zero:  # the exact state
+            return True
         if precision is zero:
             precision = 0
         return iszero(self.uncertainty, precision)
 
-    def clear_uncertainty(self) -> None: self._uncertainty = zero
+    def clear_uncertainty(self) -> None:
+        self._uncertainty = self._relative = zero
+        self._new_input()
 
     def copy(self) -> 'Variable':
+        if self._gradient is not None:
+            return Variable._fromgradient(copy(self._value),
+                                          dict(self._gradient))
+        if self._uncertainty is zero:
+            return Variable._exact(copy(self._value))
         return Variable(copy(self.value), copy(self.uncertainty))
 
     def almost_equal(self, other: 'Variable') -> bool:
@@ -193,6 +507,18 @@ class Variable(Generic[T]):
         operator.truediv, operator.itruediv)
 
     def __pow__(self, other: T):
+        if self._gradient is not None or _tracked(other):
+            base, exponent = self._value, _value(other)
+            value = base**exponent
+            terms = [(exponent * base**(exponent - 1), _gradient(self))]
+            if isinstance(other, Variable) and other._uncertainty is not zero:
+                terms.append((value * log(base), _gradient(other)))
+            return Variable._fromgradient(value, _linear(*terms))
+        if self._uncertainty is zero:
+            if not isinstance(other, Variable):
+                return Variable._exact(self._value**other)
+            if other._uncertainty is zero:
+                return Variable._exact(self._value**other._value)
         if not isinstance(other, Variable):
             rel_uncert = self.relative_uncertainty * other
         else:
@@ -201,17 +527,49 @@ class Variable(Generic[T]):
         return Variable(self.value**other, relative_uncertainty=rel_uncert)
 
     def __ipow__(self, other: T):
+        if isinstance(other, Variable) or self._gradient is not None:
+            return self._become(self ** other)
+        self._id = None
         if self.isexact():
             self._value **= other
             return self
-        old_value = copy(self.value)
-        self._value *= other - 1
-        self._uncertainty *= self.value * other
-        self._value *= old_value
+        relative = self.relative_uncertainty * abs(other)
+        self._value **= other
+        self._uncertainty, self._relative = None, relative
         return self
 
     def __rpow__(self, other): return other ** self.value
 
     def nthroot(self, n):
+        if self._gradient is not None:
+            return self ** (1 / n)
+        if self._uncertainty is zero:
+            return Variable._exact(self._value**(1/n))
         return Variable(self.value**(1/n), 
                         relative_uncertainty=self.relative_uncertainty/n)
+
+
+def covariance_matrix(*variables: Variable) -> 'ndarray':
+    '''`cov[i, j]` of the variables (or quantities, in their own units),
+    elementwise for array values, the shape is `(n, n) + value shape`.'''
+    variables = tuple(getattr(v, 'variable', v) for v in variables)
+    n = len(variables)
+    result = zeros((n, n) + broadcast_shapes(
+        *(np_shape(v.value) for v in variables)))
+    by_input: defaultdict[int, list] = defaultdict(list)
+    for i, variable in enumerate(variables):
+        for input_id, c in _gradient(variable).items():
+            by_input[input_id].append((i, c))
+    for terms in by_input.values():  # only the variables sharing an input
+        index, c = zip(*terms)
+        c = array(broadcast_arrays(*c))
+        result[ix_(index, index)] += c[:, None] * c[None, :]
+    return result
+
+
+def correlation_matrix(*variables: Variable) -> 'ndarray':
+    '''`cov[i, j] / (std[i] std[j])`, nan for exact variables.'''
+    cov = covariance_matrix(*variables)
+    std = sqrt(cov[arange(len(cov)), arange(len(cov))])
+    with errstate(divide='ignore', invalid='ignore'):
+        return cov / (std[:, None] * std[None, :])
@@ -1,10 +1,13 @@
 from typing import Generic, TypeVar, overload
 
+from numpy import ndarray
+
 from .identity import Zero, zero
+from .quantity import Quantity
 from .utilcollections import Interval
 from .utilcollections.abc import Linear
 
-__all__ = ['Variable']
+__all__ = ['Variable', 'covariance_matrix', 'correlation_matrix']
 
 T = TypeVar('T', bound=Linear)
 
@@ -19,6 +22,9 @@ class Variable(Generic[T]):
 
     `relative_uncertainty` = `uncertainty` / `value`, but it's meaningless
     to call this property when `value` <= 0
+
+    Both are computed lazily and cached, products and quotients carry the
+    relative uncertainty, sums and differences the absolute one.
     '''
     @overload
     def __new__(cls, value: float, /) -> Variable[float]: 
@@ -48,6 +54,13 @@ class Variable(Generic[T]):
     def __format__(self, format_spec: str) -> str: ...
     def isexact(self, precision: T | Zero = zero) -> bool: ...
     def copy(self) -> Variable[T]: ...
+    def correlated(self) -> Variable[T]:
+        '''the variable in the correlated mode, where results carry the
+        gradient on the independent inputs, so `x - x` is exact and reused
+        inputs are not added in quadrature. Other uncertain variables meet
+        in the mode as independent inputs, each with one ID.
+        The mode is elementwise, `@` is not supported.'''
+    def iscorrelated(self) -> bool: ...
     def almost_equal(self, other: Variable[T]) -> bool: ...
     def sameas(self, other: Variable[T]) -> bool: ...
     def __eq__(self, other: Variable[T]) -> bool: ...
@@ -80,3 +93,11 @@ class Variable(Generic[T]):
     def __rtruediv__(self, other: T | Variable[T]) -> Variable[T]: ...
     def __rpow__(self, other: T | Variable[T]) -> Variable[T]: ...
     def nthroot(self, n: int) -> Variable[T]: ...
+
+
+def covariance_matrix(*variables: Variable | Quantity) -> ndarray:
+    '''`cov[i, j]` of the variables (or quantities, in their own units),
+    elementwise for array values, the shape is `(n, n) + value shape`.
+    Variables out of the correlated mode are independent of the others.'''
+def correlation_matrix(*variables: Variable | Quantity) -> ndarray:
+    '''`cov[i, j] / (std[i] std[j])`, nan for exact variables.'''
@@ -0,0 +1,35 @@
+import sys
+import unittest
+from fractions import Fraction
+
+from src.siunitpy.utilcollections import FrozenCompound
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestFrozenCompound(unittest.TestCase):
+    def test_init(self):
+        c = FrozenCompound({'a': 0, 'b': Fraction(2), 'c': 0.5})
+        self.assertEqual(tuple(c.items()), (('b', 2), ('c', Fraction(1, 2))))
+        self.assertIs(type(c['b']), int)
+        self.assertEqual(c['a'], 0)
+        self.assertNotIn('a', c)
+
+    def test_operation(self):
+        a = FrozenCompound({'a': 1, 'b': 2})
+        b = FrozenCompound({'b': -2, 'c': Fraction(1, 2)})
+        self.assertEqual(a + b, FrozenCompound({'a': 1, 'c': Fraction(1, 2)}))
+        self.assertEqual(a - b, FrozenCompound({'a': 1, 'b': 4, 'c': -0.5}))
+        self.assertEqual((b * 2)['c'], 1)
+        self.assertIs(type((b * 2)['c']), int)
+        self.assertEqual((a / 2)['a'], Fraction(1, 2))
+        self.assertEqual(-a, FrozenCompound({'a': -1, 'b': -2}))
+        self.assertIs(a + FrozenCompound(), a)
+        self.assertEqual(len(a * 0), 0)
+
+    def test_hash(self):
+        a = FrozenCompound({'a': 1, 'b': 2})
+        b = FrozenCompound({'b': Fraction(2), 'a': 1.0})
+        self.assertEqual(a, b)
+        self.assertEqual({a: 1}[b], 1)
+        with self.assertRaises(AttributeError):
+            a.x = 1
@@ -0,0 +1,48 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.siunitpy.utilcollections.constclass import ConstClass, lazy
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestConstClass(unittest.TestCase):
+    def test_lazy(self):
+        calls = []
+
+        def build(x):
+            calls.append(x)
+            return x
+
+        class Const(ConstClass):
+            a = b = lazy(build, 1)
+            c = lazy(lambda: Const.a + 1)
+            d = 4
+
+        self.assertIn('c', dir(Const))
+        self.assertIsInstance(vars(Const)['c'], lazy)
+        self.assertEqual(Const.c, 2)
+        self.assertEqual((Const.a, Const.b, Const.c), (1, 1, 2))
+        self.assertEqual(calls, [1])
+        self.assertEqual(vars(Const)['c'], 2)
+        with self.assertRaises(AttributeError):
+            Const.c = 3
+        with self.assertRaises(AttributeError):
+            del Const.a
+
+    def test_thread_safe(self):
+        calls = []
+
+        class Const(ConstClass):
+            a = lazy(lambda: calls.append(None) or object())
+
+        with ThreadPoolExecutor(8) as pool:
+            values = list(pool.map(lambda _: Const.a, range(64)))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(v is values[0] for v in values))
+
+    def test_evaluate(self):
+        class Const(ConstClass):
+            a = lazy(int, '1')
+        Const.evaluate()
+        self.assertEqual(vars(Const)['a'], 1)
@@ -0,0 +1,60 @@
+import sys
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.siunitpy import Quantity, QuantityArray, Unit
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestConverter(unittest.TestCase):
+    def test_scale(self):
+        to_m = Unit('km').converter_to('m')
+        self.assertIs(to_m, Unit('km').converter_to(Unit('m')))
+        self.assertEqual(to_m(2), 2000)
+        self.assertEqual(to_m([1, 2.5]), [1000, 2500])
+        values = [1, 2]
+        self.assertIs(to_m(values, out=values), values)
+        self.assertEqual(values, [1000, 2000])
+        with self.assertRaises(ValueError):
+            Unit('km').converter_to('s')
+
+    def test_temperature(self):
+        to_K = Unit('°C').converter_to('K')
+        self.assertAlmostEqual(to_K(25), 298.15)
+        self.assertAlmostEqual(Unit('°F').converter_to('°C')(212), 100)
+        self.assertAlmostEqual(Unit('°R').converter_to('K')(491.67), 273.15)
+        self.assertEqual(Unit('°C/s').converter_to('K/s').offset, 0)
+        self.assertAlmostEqual(Quantity(25, '°C').to('K').value, 298.15)
+
+    def test_absolute_temperature(self):
+        t = Quantity(25, '°C')
+        self.assertAlmostEqual(t.tobase_unit().value, 298.15)
+        self.assertIs(t.tobase_unit().unit, Unit('K'))
+        self.assertAlmostEqual(t.standard_value, 298.15)
+        self.assertTrue(t == Quantity(298.15, 'K'))
+        self.assertFalse(t < Quantity(30, 'K'))
+        self.assertTrue(Quantity(32, '°F') < Quantity(1, '°C'))
+        self.assertEqual((t - Quantity(20, '°C')).value, 5)
+        with self.assertRaises(ValueError):
+            t + Quantity(1, 'K')
+        with self.assertRaises(ValueError):
+            t - Quantity(20, '°F')
+
+    @unittest.skipIf(np is None, 'numpy is not installed.')
+    def test_absolute_temperature_array(self):
+        t = QuantityArray([0.0, 100.0], '°C', 1.0)
+        np.testing.assert_allclose(t.tobase_unit().value, [273.15, 373.15])
+        np.testing.assert_array_equal(t > Quantity(300, 'K'), [False, True])
+        with self.assertRaises(ValueError):
+            t + Quantity(1, 'K')
+
+    @unittest.skipIf(np is None, 'numpy is not installed.')
+    def test_array(self):
+        to_F = Unit('°C').converter_to('°F')
+        celsius = np.array([0., 100.])
+        self.assertIs(to_F(celsius, out=celsius), celsius)
+        np.testing.assert_allclose(celsius, [32, 212])
@@ -1,5 +1,8 @@
+import copy
+import pickle
 import sys
 import unittest
+from fractions import Fraction
 
 from src.siunitpy import Dimension, DimensionConst
 
@@ -25,3 +28,46 @@ class TestDimension(unittest.TestCase):
         self.assertEqual(str(1 / df), 'T²L⁻¹M⁻¹')
         self.assertEqual(dl / dt, dv)
         self.assertEqual(dm * dl / dt**2, df)
+
+    def test_fraction(self):
+        dl = DimensionConst.LENGTH
+        df = DimensionConst.FORCE
+        self.assertEqual(str(df.nthroot(2)), 'T⁻¹L¹ᐟ²M¹ᐟ²')
+        self.assertEqual(df.nthroot(2)**2, df)
+        self.assertEqual(df**Fraction(1, 2), df.nthroot(2))
+        self.assertEqual(hash(df.nthroot(2) * df.nthroot(2)), hash(df))
+        self.assertEqual(dl**Fraction(1, 11) * dl**Fraction(10, 11), dl)
+        self.assertEqual((dl**Fraction(1, 11)).L, Fraction(1, 11))
+        self.assertTrue((df / df).isdimensionless())
+        with self.assertRaises(OverflowError):
+            Dimension(L=10**6)
+
+    def test_interned(self):
+        dl = DimensionConst.LENGTH
+        dt = DimensionConst.TIME
+        self.assertIs(Dimension(L=1), dl)
+        self.assertIs(Dimension.unpack({'L': 1, 'T': -1}), dl / dt)
+        self.assertIs(dl / dt, dl * dt**-1)
+        self.assertIs(dl / dl, DimensionConst.DIMENSIONLESS)
+        self.assertIs(dl.nthroot(2)**2, dl)
+        self.assertIs(copy.deepcopy(dl), dl)
+        self.assertIs(pickle.loads(pickle.dumps(dl / dt)), dl / dt)
+
+    def test_compatible_units(self):
+        mass = DimensionConst.MASS.compatible_units()
+        self.assertEqual(mass[0], ('kg', 1, 1))
+        self.assertIs(DimensionConst.MASS.compatible_units(), mass)
+        symbols = {unit.symbol: unit for unit in mass}
+        self.assertEqual(symbols['mg'].factor, 1e-6)
+        self.assertNotIn('Pa', {u.symbol for u in
+                                DimensionConst.AREA.compatible_units()})
+        area = {(u.symbol, u.exponent): u.factor
+                for u in DimensionConst.AREA.compatible_units()}
+        self.assertAlmostEqual(area['km', 2], 1e6)
+        self.assertEqual(area['ha', 1], 1e4)
+        length = {(u.symbol, u.exponent): u.factor
+                  for u in DimensionConst.LENGTH.compatible_units()}
+        self.assertAlmostEqual(length['ha', Fraction(1, 2)], 100)
+        dimensionless = [u.symbol for u in
+                         DimensionConst.DIMENSIONLESS.compatible_units()]
+        self.assertEqual(len(dimensionless), len(set(dimensionless)))
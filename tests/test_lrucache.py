@@ -0,0 +1,40 @@
+import sys
+import unittest
+
+from src.siunitpy import Unit
+from src.siunitpy.utilcollections import LRUCache
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestLRUCache(unittest.TestCase):
+    def test_get_or_create(self):
+        cache = LRUCache(maxsize=2)
+        self.assertEqual(cache.get_or_create('a', str.upper), 'A')
+        self.assertEqual(cache.get_or_create('a', str.upper), 'A')
+        self.assertEqual(tuple(cache.cache_info()), (1, 1, 2, 1))
+        cache.get_or_create('b', str.upper)
+        cache.get('a')  # 'b' becomes the least recently used
+        cache.get_or_create('c', str.upper)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_evict_and_clear(self):
+        cache = LRUCache(maxsize=None)
+        cache.setdefault(1, 'one')
+        self.assertEqual(cache.setdefault(1, 'uno'), 'one')
+        self.assertTrue(cache.evict(1))
+        self.assertFalse(cache.evict(1))
+        cache.setdefault(2, 'two')
+        cache.cache_clear()
+        self.assertEqual(tuple(cache.cache_info()), (0, 0, None, 0))
+
+    def test_unit_cache(self):
+        Unit.cache_clear()
+        u0 = Unit('kg.m/s2')
+        self.assertIs(Unit('kg.m/s2'), u0)
+        self.assertEqual(Unit.cache_info().hits, 1)
+        self.assertTrue(Unit.cache_evict('kg.m/s2'))
+        self.assertIs(Unit('kg.m/s2'), u0)  # reparsed, still canonical
+        self.assertEqual(Unit.cache_info().misses, 2)
+        self.assertIs(Unit(''), Unit(''))
@@ -0,0 +1,64 @@
+import sys
+import unittest
+
+import numpy as np
+
+from src.siunitpy import Quantity, Unit, Variable
+from src.siunitpy.montecarlo import propagate, uniform
+
+
+def _area(length, width): return length * width
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestMonteCarlo(unittest.TestCase):
+    def test_propagate(self):
+        x = Quantity(0.0, 'm', 1.0)
+        q = propagate(lambda x: x**2, x, n=200_000, seed=0)
+        self.assertIs(q.unit, Unit('m2'))
+        self.assertAlmostEqual(q.value, 1, delta=0.02)
+        self.assertAlmostEqual(q.uncertainty, 2**0.5, delta=0.02)
+        a, b = Quantity(2.0, 'm', 0.01), Quantity(300.0, 'cm')
+        q = propagate(_area, a, b, n=10_000, seed=1)
+        self.assertAlmostEqual(q.value, 600, delta=1)
+        self.assertAlmostEqual(q.uncertainty, 3, delta=0.1)
+        q = propagate(lambda v: v + 1, Variable(np.array([1.0, 2.0]), 0.1),
+                      n=1000, distribution=uniform, seed=2)
+        np.testing.assert_allclose(q.value, [2, 3], atol=0.02)
+        self.assertEqual(q.unit, Unit(''))
+
+    def test_chunk(self):
+        x = Quantity(1.0, 's', 0.1)
+        q = propagate(np.exp, x / Quantity(1, 's'), n=10_001, chunk_size=1000,
+                      seed=3)
+        r = propagate(np.exp, x / Quantity(1, 's'), n=10_001, chunk_size=1000,
+                      seed=3)
+        self.assertEqual((q.value, q.uncertainty), (r.value, r.uncertainty))
+        q, p = propagate(lambda x: 2 * x, x, n=10_000, seed=4,
+                         percentiles=[2.5, 50, 97.5])
+        self.assertEqual(p.value.shape, (3,))
+        self.assertAlmostEqual(p.value[1], 2, delta=0.01)
+        with self.assertRaises(ValueError):
+            propagate(_area, x, x, distribution=[uniform])
+
+    def test_processes(self):
+        a, b = Quantity(2.0, 'm', 0.01), Quantity(3.0, 'm', 0.02)
+        q = propagate(_area, a, b, n=4000, chunk_size=1000, seed=5)
+        r = propagate(_area, a, b, n=4000, chunk_size=1000, seed=5,
+                      processes=2)
+        self.assertIs(r.unit, q.unit)
+        self.assertEqual((q.value, q.uncertainty), (r.value, r.uncertainty))
+
+    def test_broadcast(self):
+        a = Quantity(np.array([1.0, 2.0]), 'm', 0.1)
+        q = propagate(lambda x, y: x * y, a, Quantity(3.0, 's', 0.1),
+                      n=10_000, seed=6)
+        self.assertIs(q.unit, Unit('m.s'))
+        np.testing.assert_allclose(q.value, [3, 6], rtol=0.01)
+        q = propagate(lambda x, y: x + y, Quantity(1.0, 'm', 0.1),
+                      Quantity(np.array([1.0, 2.0, 3.0]), 'm'), n=1000, seed=7)
+        np.testing.assert_allclose(q.value, [2, 3, 4], rtol=0.01)
+        np.testing.assert_allclose(q.uncertainty, [0.1] * 3, rtol=0.1)
+        q = propagate(lambda x: 2 * x, Quantity(np.array([1.0, 2.0]), 'm'),
+                      n=100)
+        np.testing.assert_array_equal(q.value, [2, 4])
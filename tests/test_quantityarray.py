@@ -0,0 +1,84 @@
+import sys
+import unittest
+
+import numpy as np
+
+from src.siunitpy import Quantity, QuantityArray, Unit
+from src.siunitpy.identity import zero
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestQuantityArray(unittest.TestCase):
+    def test_init(self):
+        a = QuantityArray([1, 2, 3], 'km', 0.1)
+        self.assertEqual(a.dtype, float)
+        self.assertEqual(a.shape, (3,))
+        self.assertIs(a.unit, Unit('km'))
+        np.testing.assert_array_equal(a.uncertainty, [0.1, 0.1, 0.1])
+        self.assertIs(QuantityArray([1, 2]).uncertainty, zero)
+        b = QuantityArray.from_quantities(
+            [Quantity(1, 'km', 0.1), Quantity(500, 'm')])
+        np.testing.assert_allclose(b.value, [1, 0.5])
+        np.testing.assert_allclose(b.uncertainty, [0.1, 0])
+        with self.assertRaises(ValueError):
+            QuantityArray.from_quantities([Quantity(1, 'm'), Quantity(1, 's')])
+
+    def test_index(self):
+        a = QuantityArray([1.0, 2.0, 3.0], 'm', [0.1, 0.2, 0.3])
+        self.assertIsInstance(a[1], Quantity)
+        self.assertEqual((a[1].value, a[1].uncertainty), (2.0, 0.2))
+        self.assertIsInstance(a[1:], QuantityArray)
+        mask = a > Quantity(150, 'cm')
+        np.testing.assert_array_equal(mask, [False, True, True])
+        np.testing.assert_array_equal(a[mask].value, [2, 3])
+        a[0] = Quantity(50, 'cm')
+        self.assertEqual(a[0].value, 0.5)
+        self.assertTrue(a[0].isexact())
+        with self.assertRaises(ValueError):
+            a > Quantity(1, 's')
+
+    def test_reduction(self):
+        a = QuantityArray([[1.0, 4.0], [3.0, 2.0]], 'm', [[3, 4], [0, 0]])
+        self.assertEqual(a.sum().value, 10)
+        self.assertEqual(a.sum().uncertainty, 5)
+        self.assertIs(a.sum().unit, Unit('m'))
+        np.testing.assert_array_equal(a.sum(axis=0).value, [4, 6])
+        self.assertEqual(a.mean().uncertainty, 5 / 4)
+        self.assertEqual(a.max().uncertainty, 4)
+        np.testing.assert_array_equal(a.min(axis=1).value, [1, 2])
+        np.testing.assert_array_equal(a.min(axis=1).uncertainty, [3, 0])
+        self.assertAlmostEqual(a.std().value, np.std([1, 4, 3, 2]))
+
+    def test_arithmetic(self):
+        a = QuantityArray([1.0, 2.0], 'km', [0.3, 0.4])
+        b = QuantityArray([100.0, 200.0], 'm')
+        np.testing.assert_allclose((a + b).value, [1.1, 2.2])
+        np.testing.assert_allclose((a + b).uncertainty, [0.3, 0.4])
+        self.assertIs((a * b).unit, Unit('km.m'))
+        np.testing.assert_allclose((a / Quantity(2, 'h')).value, [0.5, 1])
+        self.assertIs((Quantity(1, 'km') + a).unit, Unit('km'))
+        self.assertIs((2 / a).unit, Unit('km-1'))
+        self.assertIs((np.array([1, 2]) * a).unit, Unit('km'))
+        np.testing.assert_allclose((a**2).uncertainty, [0.6, 1.6])
+        with self.assertRaises(ValueError):
+            a + Quantity(1, 's')
+
+    def test_to(self):
+        t = QuantityArray([0.0, 100.0], '°C', 1.0)
+        f = t.to('°F')
+        np.testing.assert_allclose(f.value, [32, 212])
+        np.testing.assert_allclose(f.uncertainty, [1.8, 1.8])
+        t.ito('K')
+        np.testing.assert_allclose(t.value, [273.15, 373.15])
+        with self.assertRaises(ValueError):
+            t.to('m')
+
+    def test_ito_view(self):
+        a = QuantityArray([1.0, 2.0, 3.0], 'km', 0.1)
+        b = a[:2]
+        b.ito('m')
+        np.testing.assert_allclose(b.value, [1000, 2000])
+        np.testing.assert_allclose(b.uncertainty, [100, 100])
+        np.testing.assert_allclose(a.value, [1, 2, 3])
+        np.testing.assert_allclose(a.uncertainty, [0.1, 0.1, 0.1])
+        self.assertIs(a.unit, Unit('km'))
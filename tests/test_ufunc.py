@@ -0,0 +1,97 @@
+import sys
+import unittest
+import warnings
+
+import numpy as np
+
+from src.siunitpy import Quantity, Unit
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestUfunc(unittest.TestCase):
+    def setUp(self):
+        self.a = Quantity(np.array([1.0, 4.0]), 'm', np.array([0.1, 0.2]))
+        self.b = Quantity(np.array([100.0, 200.0]), 'cm')
+
+    def test_arithmetic(self):
+        a, b = self.a, self.b
+        c = np.add(a, b)
+        self.assertIs(c.unit, Unit('m'))
+        np.testing.assert_allclose(c.value, [2, 6])
+        c = np.array([1, 2]) * a
+        self.assertIsInstance(c, Quantity)
+        np.testing.assert_allclose(c.uncertainty, [0.1, 0.4])
+        self.assertIs(np.multiply(a, b).unit, Unit('m.cm'))
+        c = np.sqrt(a)
+        self.assertIs(c.unit, Unit('m^1/2'))
+        np.testing.assert_allclose(c.uncertainty, [0.05, 0.05])
+        self.assertIs(np.power(a, 2).unit, Unit('m2'))
+        np.testing.assert_array_equal(np.greater(a, b), [False, True])
+        with self.assertRaises(ValueError):
+            np.add(a, Quantity(1, 's'))
+        with self.assertRaises(TypeError):
+            np.bitwise_and(a, a)
+
+    def test_dimensionless(self):
+        x = Quantity(0.5, '', 0.01)
+        self.assertAlmostEqual(np.sin(x).uncertainty, 0.01 * np.cos(0.5))
+        self.assertAlmostEqual(np.exp(Quantity(1, 'm') / Quantity(1, 'km')).value,
+                               np.exp(0.001))
+        with self.assertRaises(ValueError):
+            np.log(self.a)
+
+    def test_absolute_temperature(self):
+        c, k = Quantity(0, '°C'), Quantity(100, 'K')
+        self.assertFalse(np.less(c, k))
+        self.assertEqual(np.less(c, k), c < k)
+        self.assertAlmostEqual(np.maximum(k, c).value, 273.15)
+        joined = np.concatenate([Quantity(np.array([0.0]), '°C'),
+                                 Quantity(np.array([300.0]), 'K')])
+        np.testing.assert_allclose(joined.value, [0, 26.85])
+        self.assertIs(joined.unit, Unit('°C'))
+        with self.assertRaises(ValueError):
+            np.add(c, k)
+        with self.assertRaises(ValueError):
+            np.subtract(k, c)
+        self.assertEqual(np.subtract(c, Quantity(5, '°C')).value, -5)
+
+    def test_power(self):
+        p = Quantity(2, '', 0.1)
+        r = np.power(3, p)
+        self.assertIsInstance(r, Quantity)
+        self.assertAlmostEqual(r.value, 9)
+        self.assertAlmostEqual(r.uncertainty, 9 * np.log(3) * 0.1)
+        r = np.power(Quantity(3, ''), p)
+        self.assertAlmostEqual(r.uncertainty, 9 * np.log(3) * 0.1)
+        r = np.power(Quantity(3, 'm'), 2)
+        self.assertEqual((r.value, r.unit), (9, Unit('m2')))
+
+    def test_function(self):
+        a, b = self.a, self.b
+        s = np.sum(a)
+        self.assertEqual((s.value, s.unit), (5, Unit('m')))
+        self.assertAlmostEqual(s.uncertainty, np.hypot(0.1, 0.2))
+        self.assertEqual(np.max(a).uncertainty, 0.2)
+        c = np.concatenate([a, b])
+        np.testing.assert_allclose(c.value, [1, 4, 1, 2])
+        np.testing.assert_allclose(c.uncertainty, [0.1, 0.2, 0, 0])
+        c = np.where([True, False], a, b)
+        np.testing.assert_allclose(c.value, [1, 2])
+        self.assertEqual(np.shape(a), (2,))
+        with self.assertRaises(TypeError):
+            np.cumsum(a)
+        with self.assertRaises(TypeError):
+            np.sum(a, keepdims=True)
+        self.assertEqual(np.std(a, ddof=1).value, np.std([1, 4], ddof=1))
+
+    def test_array_unit(self):
+        values = np.arange(3.0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            q = values * Unit('km')
+        self.assertIsInstance(q, Quantity)
+        self.assertIs(q.value, values)
+        self.assertIs(q.unit, Unit('km'))
+        self.assertIs((values / Unit('s')).unit, Unit('s-1'))
+        self.assertIs((values @ Unit('s')).unit, Unit('s'))
+        self.assertIs(np.multiply(self.b, Unit('s')).unit, Unit('cm.s'))
@@ -1,14 +1,15 @@
 import sys
 import unittest
 
-from src.siunitpy import Dimension, DimensionConst, Unit, UnitConst
+from src.siunitpy import Dimension, DimensionConst, Unit
+from src.siunitpy.SI import si
 
 
 @unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
 class TestUnit(unittest.TestCase):
     def test_init(self):
         u0 = Unit('kg.m/s2')
-        self.assertEqual(repr(u0), 'Unit(kg·m/s², T⁻²LM, factor=1)')
+        self.assertEqual(repr(u0), 'Unit(kg·m/s², T⁻²LM, factor=1.0)')
         self.assertEqual(u0.symbol, 'kg·m/s²')
         self.assertEqual(u0.dimension, DimensionConst.FORCE)
         self.assertEqual(u0.factor, 1)
@@ -21,7 +22,7 @@ class TestUnit(unittest.TestCase):
         u3 = Unit('megaelectronvolt/speed-of-light2')
         self.assertEqual(repr(u3), repr(u3))
         u4 = Unit('T.W/m2.K4')
-        self.assertEqual(u4.symbol, 'T·W/m²·K⁴')
+        self.assertEqual(u4.symbol, 'W·T/K⁴·m²')
         self.assertEqual(u4.dimension, Dimension(-5, 0, 2, -1, -4, 0, 0))
         self.assertEqual(u4.factor, 1)
 
@@ -31,19 +32,19 @@ class TestUnit(unittest.TestCase):
         self.assertEqual(u1.symbol, "eV/c")
         self.assertEqual(factor1, 1000_000)
         u2, factor2 = u0.tobase_with_factor()
-        self.assertEqual(u2.symbol, "m·kg/s")
+        self.assertEqual(u2.symbol, "kg·m/s")
         self.assertEqual(factor2, 5.3442859926783075e-22)
         self.assertEqual(u0.factor / Unit(u2.symbol).factor, factor2)
         u3, factor3 = Unit("V/mA").simplify_with_factor()
         self.assertEqual(u3.symbol, "Ω")
         self.assertEqual(factor3, 1000)
-        um = UnitConst.METER
-        ukg = UnitConst.KILOGRAM
-        us = UnitConst.SECOND
+        um = si.m
+        ukg = si.kg
+        us = si.s
         self.assertEqual((ukg * um / us**2).symbol, "kg·m/s²")
 
     def test_comparison(self):
-        u0 = UnitConst.NEWTON
+        u0 = si.N
         u1 = Unit('kg.m/s2')
         u2 = Unit('N')
         self.assertEqual(u0 == u1, True)
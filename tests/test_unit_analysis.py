@@ -0,0 +1,47 @@
+import sys
+import unittest
+
+from src.siunitpy.unit_analysis import _resolve
+from src.siunitpy.unitelement import UnitSymbolError
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestUnitAnalysis(unittest.TestCase):
+    def test_resolve(self):
+        self.assertEqual(str(_resolve('kg.m/s2')), '{kg: 1, m: 1, s: -2}')
+        self.assertEqual(str(_resolve('kilogram.meter/second2')),
+                         '{kg: 1, m: 1, s: -2}')
+        self.assertEqual(str(_resolve('MeV/c2')), '{MeV: 1, c: -2}')
+        self.assertEqual(str(_resolve('megaelectronvolt/speed-of-light2')),
+                         '{MeV: 1, c: -2}')
+        self.assertEqual(str(_resolve('T.W/m2.K4')),
+                         '{W: 1, T: 1, K: -4, m: -2}')
+        self.assertEqual(str(_resolve('kg/m/s')), '{kg: 1, m: -1, s: -1}')
+        self.assertEqual(str(_resolve('m³/kg·s²')), '{kg: -1, m: 3, s: -2}')
+        self.assertEqual(str(_resolve('m^+2.mol-1')), '{mol: -1, m: 2}')
+        self.assertEqual(str(_resolve('μm/℃')), '{°C: -1, µm: 1}')
+        self.assertEqual(str(_resolve("'")), '{′: 1}')
+        self.assertEqual(str(_resolve('"')), '{″: 1}')
+        self.assertEqual(str(_resolve("m/'")), '{′: -1, m: 1}')
+        self.assertEqual(str(_resolve('/m')), '{m: -1}')
+        self.assertEqual(str(_resolve('m.m-1')), '{}')
+
+    def test_fraction_and_group(self):
+        self.assertEqual(str(_resolve('m^1/2')), '{m: 1/2}')
+        self.assertEqual(str(_resolve('m⁻¹ᐟ²')), '{m: -1/2}')
+        self.assertEqual(str(_resolve('kg/(m.s2)')), '{kg: 1, m: -1, s: -2}')
+        self.assertEqual(str(_resolve('kg/(m/s)')), '{kg: 1, m: -1, s: 1}')
+        self.assertEqual(str(_resolve('(m/s)^-1/2')), '{m: -1/2, s: 1/2}')
+
+    def test_error_position(self):
+        cases = {
+            'm+m': "unexpected '+' at position 1 of 'm+m'.",
+            'kg.x/s': "'x' at position 3 of 'kg.x/s' is not a valid element unit.",
+            'kg/(m': "unclosed '(' at position 3 of 'kg/(m'.",
+            'm)': "unmatched ')' at position 1 of 'm)'.",
+            '(m)s': "missing linker at position 3 of '(m)s'.",
+        }
+        for symbol, message in cases.items():
+            with self.assertRaises(UnitSymbolError) as context:
+                _resolve(symbol)
+            self.assertEqual(str(context.exception), message)
@@ -0,0 +1,50 @@
+import marshal
+import os
+import sys
+import tempfile
+import unittest
+
+from src.siunitpy import unit_archive, unit_registry
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestUnitRegistry(unittest.TestCase):
+    def test_same_as_archive(self):
+        self.assertEqual(unit_registry._PREFIX_DATA, unit_archive._PREFIX_DATA)
+        self.assertEqual(unit_registry._UNIT_DATA, unit_archive._UNIT_DATA)
+        self.assertEqual(unit_registry._UNIT_STD, unit_archive._UNIT_STD)
+        self.assertEqual(unit_registry._UNIT_OFFSET, unit_archive._UNIT_OFFSET)
+        self.assertEqual(unit_registry._ELEMENT_INDEX,
+                         unit_archive._build_element_index())
+        for symbol, data in unit_registry._UNIT_DATA.items():
+            self.assertEqual(data.dimension,
+                             unit_archive._UNIT_DATA[symbol].dimension)
+            self.assertEqual(data.never_prefix,
+                             unit_archive._UNIT_DATA[symbol].never_prefix)
+
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'unit_registry.snapshot')
+            self.assertIsNone(unit_registry._load_snapshot(path))
+            unit_registry.build_snapshot(path)
+            snapshot = unit_registry._load_snapshot(path)
+            self.assertIsNotNone(snapshot)
+            sources = snapshot['sources']
+            # an archive edited after the build, same size
+            snapshot['sources'] = ((sources[0][0], 0, 0), *sources[1:])
+            with open(path, 'wb') as file:
+                marshal.dump(snapshot, file)
+            self.assertIsNone(unit_registry._load_snapshot(path))
+            # mtime changed only, e.g. an installed package
+            snapshot['sources'] = ((sources[0][0], 0, sources[0][2]),
+                                   *sources[1:])
+            with open(path, 'wb') as file:
+                marshal.dump(snapshot, file)
+            self.assertIsNotNone(unit_registry._load_snapshot(path))
+            snapshot['digest'] = (0,)  # another interpreter
+            with open(path, 'wb') as file:
+                marshal.dump(snapshot, file)
+            self.assertIsNone(unit_registry._load_snapshot(path))
+            with open(path, 'wb') as file:
+                file.write(b'broken')
+            self.assertIsNone(unit_registry._load_snapshot(path))
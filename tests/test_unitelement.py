@@ -0,0 +1,42 @@
+import sys
+import unittest
+
+from src.siunitpy.unitelement import UnitElement, UnitSymbolError
+
+
+@unittest.skipIf(sys.version_info < (3, 9), 'only support 3.9+.')
+class TestUnitElement(unittest.TestCase):
+    def test_resolve(self):
+        km = UnitElement('km')
+        self.assertEqual((km.base, km.prefix), ('m', 'k'))
+        self.assertEqual(UnitElement('kilometer'), km)
+        self.assertEqual(UnitElement('kilometre'), km)
+        self.assertEqual(UnitElement('Km'), km)
+        self.assertEqual(UnitElement('um').prefix, 'µ')
+        self.assertEqual(UnitElement('dam').prefix, 'da')
+        self.assertEqual(UnitElement('Pa').symbol, 'Pa')  # not peta-year
+        self.assertEqual(UnitElement('electronvolt').symbol, 'eV')
+        self.assertEqual(UnitElement('k').factor, 1000)  # single prefix
+
+    def test_never_prefix(self):
+        with self.assertRaises(UnitSymbolError):
+            UnitElement('m°C')
+        with self.assertRaises(UnitSymbolError):
+            UnitElement('kilospeed-of-light')
+        with self.assertRaises(UnitSymbolError):
+            UnitElement('furlong')
+
+    def test_order(self):
+        elements = [UnitElement(s) for s in ('s', 'km', 'm', 'kg', 'N')]
+        self.assertEqual([u.symbol for u in sorted(elements)],
+                         ['N', 'kg', 'm', 'km', 's'])
+
+    def test_interned(self):
+        km = UnitElement('km')
+        self.assertIs(UnitElement('kilometre'), km)
+        self.assertIs(UnitElement('m', 'k'), km)
+        self.assertIs(UnitElement('m').deprefix(), UnitElement('m'))
+        self.assertEqual(km.factor, 1000)
+        self.assertEqual(km.fullname, 'kilometre')
+        self.assertIs(km.dimension, UnitElement('m').dimension)
+        self.assertEqual(repr(km), 'UnitElement(k-m)')
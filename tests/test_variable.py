@@ -1,7 +1,12 @@
+import copy
 import sys
+import time
 import unittest
 
-from src.siunitpy import Variable
+import numpy as np
+
+from src.siunitpy import (Quantity, Variable, correlation_matrix,
+                          covariance_matrix)
 from src.siunitpy.identity import zero
 from src.siunitpy.utilcollections import Interval
 
@@ -33,6 +38,102 @@ class TestVariable(unittest.TestCase):
         self.assertEqual(v3.value, 200)
         self.assertEqual(v3.uncertainty, 1e-3)
 
+    def test_inplace_array(self):
+        a, b = np.array([1.0, -2.0]), np.array([4.0, 0.5])
+        ua, ub = np.array([0.1, 0.2]), np.array([0.3, 0.4])
+        for op in ('__mul__', '__truediv__', '__add__'):
+            expected = getattr(Variable(a, ua), op)(Variable(b, ub))
+            v = Variable(a.copy(), ua)
+            uncertainty = v.uncertainty
+            v = getattr(v, op.replace('__', '__i', 1))(Variable(b, ub))
+            self.assertIs(v.uncertainty, uncertainty)
+            np.testing.assert_allclose(v.value, expected.value)
+            np.testing.assert_allclose(v.uncertainty, expected.uncertainty)
+        v = Variable(a.copy(), ua)
+        v *= -2
+        np.testing.assert_allclose(v.uncertainty, [0.2, 0.4])
+        v *= Variable(b)
+        np.testing.assert_allclose(v.uncertainty, [0.8, 0.2])
+
+    def test_copy_inplace(self):
+        v = Variable(np.array([1.0, 2.0]), np.array([0.1, 0.1]))
+        w = copy.copy(v)
+        w *= Variable(np.array([2.0, 2.0]), np.array([0.1, 0.1]))
+        np.testing.assert_allclose(v.value, [1, 2])
+        np.testing.assert_allclose(v.uncertainty, [0.1, 0.1])
+        q = Quantity(np.array([1.0, 2.0]), 'km', np.array([0.1, 0.1]))
+        for op in (lambda c: c.__imul__(2), lambda c: c.__iadd__(q),
+                   lambda c: c.ito('m')):
+            op(q.copy())
+            np.testing.assert_allclose(q.value, [1, 2])
+            np.testing.assert_allclose(q.uncertainty, [0.1, 0.1])
+
+    def test_exact(self):
+        a, b = Variable(2.0), Variable(4.0, 0.4)
+        for v in (a + 1, a - a, a * a, a / 2, 3 / a, a**2, a**a,
+                  a.nthroot(2), -a, a.copy()):
+            self.assertIs(v.uncertainty, zero)
+        self.assertEqual((a * b).uncertainty, 0.8)
+        self.assertEqual((b / a).uncertainty, 0.2)
+        self.assertEqual((a + b).uncertainty, 0.4)
+        self.assertTrue(Variable(1.0, 0.0).isexact())
 
+    def test_lazy_uncertainty(self):
+        a, b = Variable(2.0, 0.2), Variable(4.0, 0.4)
+        c = a * b / a
+        self.assertAlmostEqual(c.relative_uncertainty, 0.1 * 3**0.5)
+        self.assertAlmostEqual(c.uncertainty, 0.4 * 3**0.5)
+        c = a * 3
+        c.value = 1.0
+        self.assertAlmostEqual(c.uncertainty, 0.6)
+        self.assertAlmostEqual(c.relative_uncertainty, 0.6)
+        c **= 2
+        self.assertAlmostEqual(c.relative_uncertainty, 1.2)
+        c += 1
+        self.assertAlmostEqual(c.uncertainty, 1.2)
+        c.uncertainty = 0.5
+        self.assertAlmostEqual(c.relative_uncertainty, 0.25)
 
+    def test_correlated(self):
+        x = Variable(2.0, 0.1).correlated()
+        self.assertTrue((x - x).isexact())
+        self.assertAlmostEqual((x * x).uncertainty, (x**2).uncertainty)
+        self.assertAlmostEqual((x / x).uncertainty, 0)
+        y = Variable(3.0, 0.2)  # joins as one independent input
+        z = x * y + y
+        self.assertAlmostEqual(z.uncertainty, (0.3**2 + 0.6**2)**0.5)
+        self.assertAlmostEqual((z - 3 * y.correlated()).uncertainty, 0.3)
+        z -= x * y
+        self.assertAlmostEqual(z.uncertainty, 0.2)
+        cov = covariance_matrix(x, -x, y, Variable(1.0, 0.5))
+        np.testing.assert_allclose(cov[:2, :2], [[0.01, -0.01], [-0.01, 0.01]])
+        np.testing.assert_allclose(cov[2:, 2:], [[0.04, 0], [0, 0.25]])
+        np.testing.assert_allclose(correlation_matrix(x, 2 * x + 1, y),
+                                   [[1, 1, 0], [1, 1, 0], [0, 0, 1]])
+        a = Variable(np.array([1.0, 2.0]), np.array([0.1, 0.2])).correlated()
+        np.testing.assert_allclose((a - a.copy()).uncertainty, [0, 0])
+        self.assertEqual(covariance_matrix(a, a * 2).shape, (2, 2, 2))
+        with self.assertRaises(TypeError):
+            a @ a
 
+    def test_correlated_inplace(self):
+        a = Variable(np.array([1.0, 2.0]), np.array([0.1, 0.1]))
+        x = a.correlated()
+        a += Variable(np.array([1.0, 2.0]), np.ones(2))
+        a *= Variable(np.array([3.0, 3.0]), np.ones(2))
+        np.testing.assert_allclose(x.uncertainty, [0.1, 0.1])
+        self.assertAlmostEqual(covariance_matrix(x, a.correlated())[0, 1, 0], 0)
+        y = x.copy()
+        x *= 2
+        np.testing.assert_allclose(y.uncertainty, [0.1, 0.1])
+        np.testing.assert_allclose(x.uncertainty, [0.2, 0.2])
+        s = Variable(0.0).correlated()
+        inputs = [Variable(1.0, 0.1).correlated() for _ in range(30_000)]
+        start = time.perf_counter()
+        for v in inputs:
+            s += v
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertAlmostEqual(s.uncertainty, 0.1 * 30_000**0.5)
+        s -= inputs[0]
+        s /= 2
+        self.assertAlmostEqual(s.uncertainty, 0.05 * 29_999**0.5)